@@ -7,29 +7,74 @@ from .bot import (
     safe_await_with_retry,
     safe_call,
     safe_call_with_retry,
+    safe_gather,
 )
 from .client import CoCClient
-from .exceptions import APIError, NotFound, RateLimited, ServerError, Unauthorized
-from .models import Clan, ClanMembersPage, CurrentWar, Player, RaidSeasonsPage
+from .crawler import CrawlResult, LeaderboardCrawler
+from .deadline import time_budget
+from .exceptions import (
+    APIError,
+    DeadlineExceeded,
+    NotFound,
+    RateLimited,
+    ServerError,
+    Unauthorized,
+)
+from .latency import HedgePolicy, LatencyTracker
+from .models import (
+    Clan,
+    ClanMembersPage,
+    ClanRoster,
+    CurrentWar,
+    CWLSeason,
+    Player,
+    RaidSeasonsPage,
+    RawResponse,
+    SyncResult,
+)
+from .scheduler import RequestScheduler, request_priority
+from .store import EntityStore
+from .tokens import TokenPool
+from .warmer import CacheWarmer
+from .watchers import WarEvent, WarPollIntervals, WarWatcher
 
 __all__ = [
     "APIError",
     "AsyncCoCClient",
     "BotError",
     "BotResult",
+    "CWLSeason",
+    "CacheWarmer",
     "Clan",
     "ClanMembersPage",
+    "ClanRoster",
     "CoCClient",
+    "CrawlResult",
     "CurrentWar",
+    "DeadlineExceeded",
+    "EntityStore",
+    "HedgePolicy",
+    "LatencyTracker",
+    "LeaderboardCrawler",
     "NotFound",
     "Player",
     "RaidSeasonsPage",
     "RateLimited",
+    "RawResponse",
+    "RequestScheduler",
     "ServerError",
+    "SyncResult",
+    "TokenPool",
     "Unauthorized",
+    "WarEvent",
+    "WarPollIntervals",
+    "WarWatcher",
     "format_bot_error",
+    "request_priority",
     "safe_await",
     "safe_await_with_retry",
     "safe_call",
     "safe_call_with_retry",
+    "safe_gather",
+    "time_budget",
 ]
@@ -0,0 +1,166 @@
+"""Minimal asyncio HTTP/1.1 server shared by the proxy and the mock API."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import json
+import logging
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    502: "Bad Gateway",
+    503: "Service Unavailable",
+    504: "Gateway Timeout",
+}
+_MAX_HEADER_LINES = 100
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class HTTPReply:
+    status: int
+    body: bytes
+    headers: Mapping[str, str] = dataclasses.field(default_factory=dict)
+
+
+def json_reply(status: int, payload: Any, headers: Mapping[str, str] | None = None) -> HTTPReply:
+    body = json.dumps(payload, separators=(",", ":")).encode()
+    return HTTPReply(status, body, {"Content-Type": "application/json", **(headers or {})})
+
+
+# (method, target, lower-cased headers) -> reply
+RequestHandler = Callable[[str, str, Mapping[str, str]], Awaitable[HTTPReply]]
+
+
+class LocalHTTPServer:
+    def __init__(
+        self,
+        handler: RequestHandler,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self._handler = handler
+        self._host = host
+        self._port = port
+        self._logger = logger or logging.getLogger("coc_api_wrapper")
+        self._server: asyncio.Server | None = None
+        self._connections: dict[asyncio.StreamWriter, asyncio.Task[Any]] = {}
+        self._requests = 0
+
+    @property
+    def address(self) -> tuple[str, int]:
+        if self._server is None:
+            raise RuntimeError("server is not started")
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return host, port
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.address
+        return f"http://{host}:{port}"
+
+    @property
+    def requests(self) -> int:
+        return self._requests
+
+    async def start(self) -> None:
+        if self._server is None:
+            self._server = await asyncio.start_server(self._serve, self._host, self._port)
+
+    async def stop(self) -> None:
+        server, self._server = self._server, None
+        if server is not None:
+            server.close()
+            # Idle keep-alive connections would otherwise hold wait_closed() open.
+            connections = list(self._connections.items())
+            for writer, _ in connections:
+                writer.close()
+            await asyncio.gather(*(task for _, task in connections), return_exceptions=True)
+            await server.wait_closed()
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        assert self._server is not None
+        await self._server.serve_forever()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        assert task is not None
+        self._connections[writer] = task
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    return
+                method, target, version, headers = request
+                self._requests += 1
+                try:
+                    reply = await self._handler(method, target, headers)
+                except Exception:
+                    self._logger.exception("local server failed on %s %s", method, target)
+                    reply = json_reply(500, {"reason": "serverError"})
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" and (
+                    version == "HTTP/1.1" or connection == "keep-alive"
+                )
+                await self._write_reply(writer, reply, head=method == "HEAD", keep_alive=keep_alive)
+                if not keep_alive:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            return
+        finally:
+            self._connections.pop(writer, None)
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    @staticmethod
+    async def _read_request(
+        reader: asyncio.StreamReader,
+    ) -> tuple[str, str, str, dict[str, str]] | None:
+        line = await reader.readline()
+        if not line.strip():
+            return None
+        method, target, version = line.decode("latin-1").split()
+        headers: dict[str, str] = {}
+        for _ in range(_MAX_HEADER_LINES):
+            header = await reader.readline()
+            if header in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = header.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        else:
+            raise ValueError("too many header lines")
+        length = int(headers.get("content-length") or 0)
+        if length:
+            await reader.readexactly(length)
+        return method.upper(), target, version.upper(), headers
+
+    @staticmethod
+    async def _write_reply(
+        writer: asyncio.StreamWriter,
+        reply: HTTPReply,
+        *,
+        head: bool,
+        keep_alive: bool,
+    ) -> None:
+        reason = _REASONS.get(reply.status, "")
+        lines = [f"HTTP/1.1 {reply.status} {reason}"]
+        lines.extend(f"{name}: {value}" for name, value in reply.headers.items())
+        lines.append(f"Content-Length: {len(reply.body)}")
+        lines.append(f"Connection: {'keep-alive' if keep_alive else 'close'}")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        if not head:
+            writer.write(reply.body)
+        await writer.drain()
@@ -1 +1,118 @@
-"""Planned adapter for aiogram (no implementation in v0.1.0)."""
+"""aiogram adapter: debounced inline queries with per-query result caching."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+from ..cache import TTLCache
+
+if TYPE_CHECKING:
+    from aiogram.types import InlineQuery
+
+InlineAnswer = Sequence[Any] | Mapping[str, Any]
+
+
+class InlineDebouncer:
+    """Debounces inline queries per user and drops the ones a newer query replaced.
+
+    Each query waits ``delay`` seconds before its handler runs. A newer query
+    from the same user cancels the older one, including any
+    :class:`AsyncCoCClient` requests it is awaiting; a fetch that other
+    callers share keeps running for them. ``handler()`` also caches answers
+    per query string for ``cache_ttl`` seconds.
+
+    Use ``handler()`` as a decorator on an inline-query handler that returns
+    the results (or ``answer()`` kwargs), or register the instance as an
+    ``inline_query`` middleware for debouncing only.
+    """
+
+    def __init__(
+        self,
+        *,
+        delay: float = 0.35,
+        cache_ttl: float = 30.0,
+        cache_max_entries: int | None = 1024,
+        personal: bool = False,
+    ) -> None:
+        if delay < 0:
+            raise ValueError("delay must not be negative")
+        self._delay = float(delay)
+        self._personal = personal
+        self._pending: dict[int, asyncio.Task[Any]] = {}
+        self._answers: TTLCache[dict[str, Any]] = TTLCache(
+            enabled=cache_ttl > 0,
+            default_ttl=cache_ttl,
+            max_entries=cache_max_entries,
+        )
+        self._superseded = 0
+
+    @property
+    def superseded(self) -> int:
+        return self._superseded
+
+    async def __call__(
+        self,
+        handler: Callable[[Any, dict[str, Any]], Awaitable[Any]],
+        event: Any,
+        data: dict[str, Any],
+    ) -> Any:
+        return await self._latest(event.from_user.id, functools.partial(handler, event, data))
+
+    def handler(self, fn: Callable[..., Awaitable[InlineAnswer]]) -> Callable[..., Awaitable[None]]:
+        @functools.wraps(fn)
+        async def wrapper(query: InlineQuery, *args: Any, **kwargs: Any) -> None:
+            key = self._cache_key(query)
+            cached = self._answers.get(key)
+            if cached is not None:
+                self._supersede(query.from_user.id)
+                await query.answer(**cached)
+                return
+
+            async def produce() -> None:
+                answer = _answer_kwargs(await fn(query, *args, **kwargs))
+                self._answers.set(key, answer)
+                await query.answer(**answer)
+
+            await self._latest(query.from_user.id, produce)
+
+        return wrapper
+
+    async def _latest(self, user_id: int, produce: Callable[[], Awaitable[Any]]) -> Any:
+        self._supersede(user_id)
+        task = asyncio.ensure_future(self._debounced(produce))
+        self._pending[user_id] = task
+        try:
+            return await task
+        except asyncio.CancelledError:
+            current = asyncio.current_task()
+            if current is not None and current.cancelling():
+                raise
+            return None
+        finally:
+            if self._pending.get(user_id) is task:
+                del self._pending[user_id]
+
+    def _supersede(self, user_id: int) -> None:
+        previous = self._pending.pop(user_id, None)
+        if previous is not None and not previous.done():
+            previous.cancel()
+            self._superseded += 1
+
+    async def _debounced(self, produce: Callable[[], Awaitable[Any]]) -> Any:
+        if self._delay:
+            await asyncio.sleep(self._delay)
+        return await produce()
+
+    def _cache_key(self, query: InlineQuery) -> str:
+        text = " ".join(query.query.split()).casefold()
+        key = f"{text}\x00{query.offset or ''}"
+        return f"{query.from_user.id}\x00{key}" if self._personal else key
+
+
+def _answer_kwargs(value: InlineAnswer) -> dict[str, Any]:
+    if isinstance(value, Mapping):
+        return dict(value)
+    return {"results": list(value)}
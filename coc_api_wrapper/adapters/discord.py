@@ -1 +1,231 @@
-"""Planned adapter for discord.py (no implementation in v0.1.0)."""
+"""discord.py adapter: one shared client per process and latency-aware deferral."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from ..async_client import AsyncCoCClient
+from ..bot import bot_error_from_exception, format_bot_error
+from ..exceptions import APIError
+from ..latency import LatencyTracker
+
+if TYPE_CHECKING:
+    import discord
+
+Reply = str | Mapping[str, Any]
+
+INTERACTION_WINDOW = 3.0
+
+
+@dataclass(slots=True)
+class _Shared:
+    client: AsyncCoCClient
+    kwargs: dict[str, Any]
+    users: int = 0
+
+
+_SHARED: dict[str, _Shared] = {}
+
+
+def shared_client(token: str, **kwargs: Any) -> AsyncCoCClient:
+    """Return the process-wide client for ``token``, creating it on first use.
+
+    Every shard (or bot instance) in one process gets the same client, so they
+    share a connection pool, cache and rate budget. Pair each call with
+    :func:`release_shared_client`; the client is closed when the last user leaves.
+    Later calls may omit ``kwargs``; passing different ones raises ``ValueError``.
+    """
+    entry = _SHARED.get(token)
+    if entry is None:
+        entry = _SHARED[token] = _Shared(AsyncCoCClient(token, **kwargs), kwargs)
+    elif kwargs and kwargs != entry.kwargs:
+        raise ValueError(
+            "A shared client for this token already exists with other arguments: "
+            f"{sorted(entry.kwargs)} vs {sorted(kwargs)}"
+        )
+    entry.users += 1
+    return entry.client
+
+
+async def release_shared_client(client: AsyncCoCClient) -> None:
+    for token, entry in list(_SHARED.items()):
+        if entry.client is client:
+            entry.users -= 1
+            if entry.users <= 0:
+                del _SHARED[token]
+                await client.aclose()
+            return
+
+
+def should_defer(
+    latency: LatencyTracker,
+    elapsed: float,
+    *,
+    window: float = INTERACTION_WINDOW,
+    margin: float = 0.75,
+    percentile: float = 0.95,
+) -> bool:
+    """Whether a pending fetch is unlikely to finish inside the interaction window.
+
+    With no latency samples yet the fetch is given the benefit of the doubt;
+    the caller still defers once the window is about to close.
+    """
+    expected = latency.percentile(percentile)
+    if expected is None:
+        return False
+    return elapsed + expected > window - margin
+
+
+class DiscordCoC:
+    """Ties a shared :class:`AsyncCoCClient` to a discord.py bot.
+
+    ``attach(bot)`` opens the client in ``setup_hook`` and releases it on
+    ``close``. ``respond()`` and the ``command()`` decorator answer an
+    interaction directly when the data arrives in time (e.g. from the cache)
+    and only ``defer()`` when live latency says the 3-second window would be
+    missed.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        *,
+        window: float = INTERACTION_WINDOW,
+        margin: float = 0.75,
+        percentile: float = 0.95,
+        locale: str | None = None,
+        time_fn: Callable[[], float] = time.monotonic,
+        **client_kwargs: Any,
+    ) -> None:
+        if not 0 <= margin < window:
+            raise ValueError("margin must be between 0 and window")
+        self._token = token
+        self._client_kwargs = client_kwargs
+        self._window = float(window)
+        self._margin = float(margin)
+        self._percentile = percentile
+        self._locale = locale
+        self._time = time_fn
+        self._client: AsyncCoCClient | None = None
+
+    @property
+    def client(self) -> AsyncCoCClient:
+        if self._client is None:
+            raise RuntimeError("DiscordCoC is not started; call start() or attach(bot)")
+        return self._client
+
+    async def start(self) -> None:
+        if self._client is None:
+            self._client = shared_client(self._token, **self._client_kwargs)
+
+    async def close(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await release_shared_client(client)
+
+    async def __aenter__(self) -> DiscordCoC:
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type: object, exc: object, tb: object) -> None:
+        await self.close()
+
+    def attach(self, bot: discord.Client) -> None:
+        setup_hook = bot.setup_hook
+        close = bot.close
+
+        async def attached_setup_hook() -> None:
+            await self.start()
+            await setup_hook()
+
+        async def attached_close() -> None:
+            try:
+                await close()
+            finally:
+                await self.close()
+
+        bot.setup_hook = attached_setup_hook  # type: ignore[method-assign]
+        bot.close = attached_close  # type: ignore[method-assign]
+
+    async def respond(
+        self,
+        interaction: discord.Interaction,
+        produce: Callable[[], Awaitable[Reply]],
+        *,
+        ephemeral: bool = False,
+    ) -> None:
+        started = self._time()
+        task = asyncio.ensure_future(produce())
+        deferred = False
+        try:
+            # Let a cache hit finish before deciding anything.
+            await asyncio.sleep(0)
+            if not task.done():
+                elapsed = self._time() - started
+                if should_defer(
+                    self.client.latency,
+                    elapsed,
+                    window=self._window,
+                    margin=self._margin,
+                    percentile=self._percentile,
+                ):
+                    deferred = await self._defer(interaction, ephemeral)
+                else:
+                    wait = self._window - self._margin - elapsed
+                    await asyncio.wait({task}, timeout=max(wait, 0.0))
+                    if not task.done():
+                        deferred = await self._defer(interaction, ephemeral)
+            reply = await task
+        except APIError as exc:
+            error = bot_error_from_exception(exc)
+            reply = {"content": format_bot_error(error, locale=self._locale), "ephemeral": True}
+        finally:
+            task.cancel()
+        await self._send(interaction, reply, ephemeral, deferred)
+
+    def command(
+        self,
+        *,
+        ephemeral: bool = False,
+    ) -> Callable[
+        [Callable[..., Awaitable[Reply]]],
+        Callable[..., Awaitable[None]],
+    ]:
+        def decorator(fn: Callable[..., Awaitable[Reply]]) -> Callable[..., Awaitable[None]]:
+            @functools.wraps(fn)
+            async def wrapper(interaction: discord.Interaction, *args: Any, **kwargs: Any) -> None:
+                await self.respond(
+                    interaction,
+                    functools.partial(fn, interaction, *args, **kwargs),
+                    ephemeral=ephemeral,
+                )
+
+            return wrapper
+
+        return decorator
+
+    @staticmethod
+    async def _defer(interaction: discord.Interaction, ephemeral: bool) -> bool:
+        if interaction.response.is_done():
+            return True
+        await interaction.response.defer(ephemeral=ephemeral, thinking=True)
+        return True
+
+    @staticmethod
+    async def _send(
+        interaction: discord.Interaction,
+        reply: Reply,
+        ephemeral: bool,
+        deferred: bool,
+    ) -> None:
+        kwargs: dict[str, Any] = {"ephemeral": ephemeral}
+        kwargs.update({"content": reply} if isinstance(reply, str) else reply)
+        if deferred or interaction.response.is_done():
+            await interaction.followup.send(**kwargs)
+        else:
+            await interaction.response.send_message(**kwargs)
@@ -1,37 +1,103 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+import functools
 import json
 import logging
-from collections.abc import Awaitable, Callable, Mapping
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Mapping
+from pathlib import Path
 from typing import Any
 
 import httpx
 
-from .cache import TTLCache
-from .exceptions import APIError, NotFound, RateLimited, ServerError, Unauthorized
+from .cache import (
+    CacheKeyStats,
+    CacheStats,
+    CacheStatsExporter,
+    TopKeysBy,
+    TTLCache,
+)
+from .cache_policies import CachePolicyRegistry, default_cache_policies
+from .crawler import CrawlResult, LeaderboardCrawler
+from .deadline import MIN_ATTEMPT_SECONDS, detached_context, remaining, resolve_deadline
+from .exceptions import (
+    APIError,
+    DeadlineExceeded,
+    NotFound,
+    RateLimited,
+    ServerError,
+    Unauthorized,
+)
+from .latency import HedgePolicy, LatencyTracker
+from .lite import (
+    LiteClanMember,
+    LiteClanRanking,
+    LiteLeagueSeasonRank,
+    LitePlayerRanking,
+    LiteRaidSeason,
+    LiteWarLogEntry,
+)
 from .models import (
+    CapitalRanking,
     CapitalRankingPage,
     Clan,
     ClanLabelsPage,
+    ClanMember,
     ClanMembersPage,
+    ClanRanking,
     ClanRankingPage,
+    ClanRoster,
     CurrentWar,
     CWLLeagueGroup,
     CWLLeaguePage,
+    CWLSeason,
     CWLWar,
     GoldPassSeason,
+    LeagueSeasonRank,
     LeagueSeasonRankingsPage,
     LeagueSeasonsPage,
     LeaguesPage,
     LocationsPage,
+    Page,
+    PageWalk,
     Player,
+    PlayerRanking,
     PlayerRankingPage,
+    RaidSeason,
     RaidSeasonsPage,
+    RawResponse,
+    SyncResult,
+    WarLogEntry,
     WarLogPage,
+    advance_watermark,
+    cwl_war_tags,
     ensure_object,
+    split_at_watermark,
 )
-from .utils import cache_key, normalize_tag, paginate, redact_token
+from .projection import CacheProjection, payload_size
+from .scheduler import Priority, RequestScheduler, check_priority, current_priority
+from .store import EntityStore
+from .utils import (
+    QueryParams,
+    cache_key,
+    is_valid_tag,
+    normalize_tag,
+    paginate,
+    path_tags,
+    query_params,
+    raw_path,
+    redact_token,
+)
+from .warmer import CacheWarmer
+from .watchers import WarWatcher
+
+
+@dataclasses.dataclass(slots=True)
+class _Inflight:
+    future: asyncio.Future[Any]
+    waiters: int = 0
 
 
 class AsyncCoCClient:
@@ -46,7 +112,19 @@ class AsyncCoCClient:
         backoff_max: float = 8.0,
         cache_enabled: bool = True,
         cache_ttl: float = 30.0,
+        cache_max_entries: int | None = None,
+        negative_cache_ttl: float = 0.0,
+        validate_tags: bool = False,
+        cache_policies: CachePolicyRegistry | None = None,
+        cache_projection: CacheProjection | None = None,
+        lite_models: bool = False,
+        store: EntityStore | None = None,
         client: httpx.AsyncClient | None = None,
+        total_timeout: float | None = None,
+        max_concurrency: int | None = None,
+        rate_limit: float | None = None,
+        scheduler: RequestScheduler | None = None,
+        hedge: HedgePolicy | None = None,
         sleep_fn: Callable[[float], Awaitable[None]] = asyncio.sleep,
         logger: logging.Logger | None = None,
     ) -> None:
@@ -55,6 +133,8 @@ class AsyncCoCClient:
             raise ValueError("token is required")
 
         self._base_url = base_url.rstrip("/")
+        self._timeout = float(timeout)
+        self._total_timeout = None if total_timeout is None else float(total_timeout)
         self._max_retries = int(max_retries)
         self._backoff_base = float(backoff_base)
         self._backoff_max = float(backoff_max)
@@ -63,7 +143,33 @@ class AsyncCoCClient:
         self._cache: TTLCache[dict[str, Any]] = TTLCache(
             enabled=cache_enabled,
             default_ttl=cache_ttl,
+            max_entries=cache_max_entries,
         )
+        self._validate_tags = validate_tags
+        self._store = store
+        self._lite_models = lite_models
+        self._not_found: TTLCache[NotFound] = TTLCache(
+            enabled=cache_enabled,
+            default_ttl=negative_cache_ttl,
+            max_entries=cache_max_entries,
+        )
+        self._cache_policies = (
+            cache_policies if cache_policies is not None else default_cache_policies()
+        )
+        self._cache_projection = cache_projection
+        self._raw_cache: TTLCache[RawResponse] = TTLCache(
+            enabled=cache_enabled,
+            default_ttl=cache_ttl,
+            max_entries=cache_max_entries,
+        )
+        self._scheduler = scheduler or RequestScheduler(
+            max_concurrency=max_concurrency,
+            rate_limit=rate_limit,
+        )
+        self._inflight: dict[str, _Inflight] = {}
+        self._latency = LatencyTracker()
+        self._hedge = hedge
+        self._hedge_tokens = 0.0
 
         default_headers = {
             "Authorization": f"Bearer {token}",
@@ -75,10 +181,47 @@ class AsyncCoCClient:
         else:
             self._client = httpx.AsyncClient(
                 base_url=self._base_url,
-                timeout=httpx.Timeout(float(timeout)),
+                timeout=httpx.Timeout(self._timeout),
                 headers=default_headers,
             )
 
+    @property
+    def scheduler(self) -> RequestScheduler:
+        return self._scheduler
+
+    @property
+    def latency(self) -> LatencyTracker:
+        return self._latency
+
+    @property
+    def store(self) -> EntityStore | None:
+        return self._store
+
+    def cache_stats(self) -> dict[str, CacheStats]:
+        return {
+            "responses": self._cache.stats(),
+            "not_found": self._not_found.stats(),
+            "raw": self._raw_cache.stats(),
+        }
+
+    def cache_template_stats(self) -> dict[str, dict[str, CacheStats]]:
+        return {
+            "responses": self._cache.template_stats(),
+            "not_found": self._not_found.template_stats(),
+            "raw": self._raw_cache.template_stats(),
+        }
+
+    def cache_top_keys(self, n: int = 10, *, by: TopKeysBy = "bytes") -> list[CacheKeyStats]:
+        return self._cache.top_keys(n, by=by)
+
+    def cache_ttl(self, path: str, params: Mapping[str, Any] | None = None) -> float | None:
+        return self._cache.ttl_remaining(cache_key("GET", raw_path(path), params))
+
+    def export_cache_stats(self, exporter: CacheStatsExporter) -> None:
+        for name, per_template in self.cache_template_stats().items():
+            for template, stats in per_template.items():
+                exporter(name, template, stats)
+
     async def aclose(self) -> None:
         await self._client.aclose()
 
@@ -90,7 +233,10 @@ class AsyncCoCClient:
 
     async def get_clan(self, tag: str) -> Clan:
         payload = await self._request("GET", f"/clans/{normalize_tag(tag)}")
-        return Clan.model_validate(payload)
+        clan = Clan.model_validate(payload)
+        if self._store is not None:
+            self._store.add_clan(clan)
+        return clan
 
     async def get_clan_members(
         self,
@@ -104,11 +250,41 @@ class AsyncCoCClient:
             f"/clans/{normalize_tag(tag)}/members",
             params=paginate(limit=limit, after=after),
         )
-        return ClanMembersPage.model_validate(payload)
+        page = ClanMembersPage.model_validate(payload)
+        if self._store is not None:
+            complete = limit is None and after is None and page.after is None
+            self._store.add_clan_members(tag, page, complete=complete)
+        return page
 
     async def get_player(self, tag: str) -> Player:
         payload = await self._request("GET", f"/players/{normalize_tag(tag)}")
-        return Player.model_validate(payload)
+        player = Player.model_validate(payload)
+        if self._store is not None:
+            self._store.add_player(player)
+        return player
+
+    async def get_clan_roster(self, clan_tag: str, *, concurrency: int = 10) -> ClanRoster:
+        if concurrency <= 0:
+            raise ValueError("concurrency must be positive")
+        members = (await self.get_clan_members(clan_tag)).items
+        semaphore = asyncio.Semaphore(concurrency)
+        players: dict[str, Player] = {}
+        errors: dict[str, APIError] = {}
+
+        async def fetch(tag: str) -> None:
+            async with semaphore:
+                try:
+                    players[tag] = await self.get_player(tag)
+                except APIError as exc:
+                    errors[tag] = exc
+
+        await asyncio.gather(*(fetch(normalize_tag(member.tag)) for member in members))
+        return ClanRoster(
+            clan_tag=normalize_tag(clan_tag),
+            members=members,
+            players=players,
+            errors=errors,
+        )
 
     async def get_current_war(self, clan_tag: str) -> CurrentWar:
         payload = await self._request("GET", f"/clans/{normalize_tag(clan_tag)}/currentwar")
@@ -128,7 +304,22 @@ class AsyncCoCClient:
         )
         return RaidSeasonsPage.model_validate(payload)
 
-    async def get_cwl_group(self, clan_tag: str) -> dict[str, Any]:
+    async def sync_capital_raids(
+        self,
+        clan_tag: str,
+        *,
+        since: str | None = None,
+        page_size: int = 10,
+    ) -> SyncResult[RaidSeason]:
+        return await self._sync_pages(
+            self.get_capital_raids,
+            clan_tag,
+            since,
+            page_size,
+            settled=lambda raid: raid.state != "ongoing",
+        )
+
+    async def get_cwl_group(self, clan_tag: str) -> CWLLeagueGroup:
         payload = await self._request(
             "GET",
             f"/clans/{normalize_tag(clan_tag)}/currentwar/leaguegroup",
@@ -149,6 +340,15 @@ class AsyncCoCClient:
         )
         return WarLogPage.model_validate(payload)
 
+    async def sync_warlog(
+        self,
+        clan_tag: str,
+        *,
+        since: str | None = None,
+        page_size: int = 10,
+    ) -> SyncResult[WarLogEntry]:
+        return await self._sync_pages(self.get_clan_warlog, clan_tag, since, page_size)
+
     async def get_cwl_leagues(
         self,
         *,
@@ -166,6 +366,20 @@ class AsyncCoCClient:
         payload = await self._request("GET", f"/clanwarleagues/wars/{normalize_tag(war_tag)}")
         return CWLWar.model_validate(payload)
 
+    async def get_cwl_season(self, clan_tag: str, *, concurrency: int = 8) -> CWLSeason:
+        if concurrency <= 0:
+            raise ValueError("concurrency must be positive")
+        group = await self.get_cwl_group(clan_tag)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(war_tag: str) -> tuple[str, CWLWar]:
+            async with semaphore:
+                return war_tag, await self.get_cwl_war(war_tag)
+
+        war_tags = cwl_war_tags(group)
+        wars = await asyncio.gather(*(fetch(war_tag) for war_tag in war_tags))
+        return CWLSeason(group=group, wars=dict(wars))
+
     async def get_locations(
         self,
         *,
@@ -189,7 +403,10 @@ class AsyncCoCClient:
             f"/locations/{location_id}/rankings/clans",
             params=paginate(limit=limit, after=after),
         )
-        return ClanRankingPage.model_validate(payload)
+        page = ClanRankingPage.model_validate(payload)
+        if self._store is not None:
+            self._store.add_clan_rankings(location_id, page)
+        return page
 
     async def get_location_player_rankings(
         self,
@@ -203,7 +420,10 @@ class AsyncCoCClient:
             f"/locations/{location_id}/rankings/players",
             params=paginate(limit=limit, after=after),
         )
-        return PlayerRankingPage.model_validate(payload)
+        page = PlayerRankingPage.model_validate(payload)
+        if self._store is not None:
+            self._store.add_player_rankings(location_id, page)
+        return page
 
     async def get_location_capital_rankings(
         self,
@@ -217,7 +437,10 @@ class AsyncCoCClient:
             f"/locations/{location_id}/rankings/capital",
             params=paginate(limit=limit, after=after),
         )
-        return CapitalRankingPage.model_validate(payload)
+        page = CapitalRankingPage.model_validate(payload)
+        if self._store is not None:
+            self._store.add_clan_rankings(location_id, page)
+        return page
 
     async def get_leagues(
         self,
@@ -274,23 +497,286 @@ class AsyncCoCClient:
         payload = await self._request("GET", "/goldpass/seasons/current")
         return GoldPassSeason.model_validate(payload)
 
+    def iter_clan_members(
+        self,
+        tag: str,
+        *,
+        page_size: int | None = None,
+        lite: bool | None = None,
+    ) -> AsyncIterator[ClanMember | LiteClanMember]:
+        return self._iter_items("clan_members", page_size, lite, tag=normalize_tag(tag))
+
+    def iter_clan_warlog(
+        self,
+        tag: str,
+        *,
+        page_size: int | None = None,
+        lite: bool | None = None,
+    ) -> AsyncIterator[WarLogEntry | LiteWarLogEntry]:
+        return self._iter_items("clan_warlog", page_size, lite, tag=normalize_tag(tag))
+
+    def iter_capital_raids(
+        self,
+        clan_tag: str,
+        *,
+        page_size: int | None = None,
+        lite: bool | None = None,
+    ) -> AsyncIterator[RaidSeason | LiteRaidSeason]:
+        return self._iter_items("capital_raids", page_size, lite, tag=normalize_tag(clan_tag))
+
+    def iter_location_clan_rankings(
+        self,
+        location_id: int | str,
+        *,
+        page_size: int | None = None,
+        lite: bool | None = None,
+    ) -> AsyncIterator[ClanRanking | LiteClanRanking]:
+        return self._iter_items("location_clan_rankings", page_size, lite, location_id=location_id)
+
+    def iter_location_player_rankings(
+        self,
+        location_id: int | str,
+        *,
+        page_size: int | None = None,
+        lite: bool | None = None,
+    ) -> AsyncIterator[PlayerRanking | LitePlayerRanking]:
+        return self._iter_items(
+            "location_player_rankings", page_size, lite, location_id=location_id
+        )
+
+    def iter_location_capital_rankings(
+        self,
+        location_id: int | str,
+        *,
+        page_size: int | None = None,
+        lite: bool | None = None,
+    ) -> AsyncIterator[CapitalRanking | LiteClanRanking]:
+        return self._iter_items(
+            "location_capital_rankings", page_size, lite, location_id=location_id
+        )
+
+    def iter_league_season(
+        self,
+        league_id: int | str,
+        season_id: str,
+        *,
+        page_size: int | None = None,
+        lite: bool | None = None,
+    ) -> AsyncIterator[LeagueSeasonRank | LiteLeagueSeasonRank]:
+        return self._iter_items(
+            "league_season", page_size, lite, league_id=league_id, season_id=season_id
+        )
+
+    def cache_warmer(self, **kwargs: Any) -> CacheWarmer:
+        return CacheWarmer(self, **kwargs)
+
+    def watch_wars(self, clan_tags: Iterable[str], **kwargs: Any) -> WarWatcher:
+        return WarWatcher(self, clan_tags, **kwargs)
+
+    async def crawl_leaderboards(self, directory: str | Path, **kwargs: Any) -> CrawlResult:
+        return await LeaderboardCrawler(self, directory, **kwargs).run()
+
+    async def _iter_items(
+        self, stream: str, page_size: int | None, lite: bool | None, **path_params: Any
+    ) -> AsyncIterator[Any]:
+        walk = PageWalk(
+            stream,
+            page_size=page_size,
+            lite=self._lite_models if lite is None else lite,
+            store=self._store,
+            **path_params,
+        )
+        while not walk.done:
+            for item in walk.feed(await self._request("GET", walk.path, params=walk.params())):
+                yield item
+
+    async def _sync_pages(
+        self,
+        fetch: Callable[..., Awaitable[Page[Any]]],
+        clan_tag: str,
+        since: str | None,
+        page_size: int,
+        *,
+        settled: Callable[[Any], bool] | None = None,
+    ) -> SyncResult[Any]:
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+        items: list[Any] = []
+        after: str | None = None
+        pages = 0
+        while True:
+            page = await fetch(clan_tag, limit=page_size, after=after)
+            pages += 1
+            fresh, reached = split_at_watermark(page.items, since)
+            items.extend(item for item in fresh if settled is None or settled(item))
+            after = page.after
+            if reached or not after or not page.items:
+                break
+        return SyncResult(items=items, watermark=advance_watermark(items, since), pages=pages)
+
     async def _request(
         self,
         method: str,
         path: str,
         *,
         params: Mapping[str, Any] | None = None,
+        priority: Priority | None = None,
     ) -> dict[str, Any]:
         method_upper = method.upper()
+        if self._validate_tags:
+            self._check_tags(method_upper, path)
         key = cache_key(method_upper, path, params)
+        if method_upper != "GET":
+            return await self._fetch(method_upper, path, params, key, priority)
+
+        missing = self._not_found.get(key)
+        if missing is not None:
+            raise dataclasses.replace(missing)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        fetch = functools.partial(self._fetch, method_upper, path, params, key, priority)
+        payload: dict[str, Any] = await self._coalesce(
+            key, fetch, f"{self._base_url}{path}", priority
+        )
+        return payload
+
+    async def refresh(
+        self,
+        path: str,
+        params: Mapping[str, Any] | None = None,
+        *,
+        priority: Priority | None = None,
+    ) -> dict[str, Any]:
+        path = raw_path(path)
+        if self._validate_tags:
+            self._check_tags("GET", path)
+        key = cache_key("GET", path, params)
+        fetch = functools.partial(self._fetch, "GET", path, params, key, priority)
+        payload: dict[str, Any] = await self._coalesce(
+            key, fetch, f"{self._base_url}{path}", priority
+        )
+        return payload
+
+    async def get_raw(
+        self,
+        path: str,
+        params: QueryParams | None = None,
+        *,
+        priority: Priority | None = None,
+    ) -> RawResponse:
+        path = raw_path(path)
+        params = query_params(params)
+        if self._validate_tags:
+            self._check_tags("GET", path)
+        key = cache_key("GET", path, params)
+        missing = self._not_found.get(key)
+        if missing is not None:
+            raise dataclasses.replace(missing)
+        cached = self._raw_cache.get(key)
+        if cached is not None:
+            return cached
+        fetch = functools.partial(self._fetch_raw, path, params, key, priority)
+        raw: RawResponse = await self._coalesce(
+            f"raw {key}", fetch, f"{self._base_url}{path}", priority
+        )
+        return raw
+
+    async def _coalesce(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        url: str,
+        priority: Priority | None,
+    ) -> Any:
+        # Callers only share a fetch within one priority class, so an interactive
+        # caller never waits on a background request still queued in the scheduler.
+        rank = check_priority(priority) if priority is not None else current_priority()
+        key = f"{rank} {key}"
+        shared = self._inflight.get(key)
+        if shared is None:
+            # Each caller enforces its own deadline in _await_shared; the fetch
+            # must not inherit the first caller's budget on behalf of the rest.
+            future = asyncio.get_running_loop().create_task(fetch(), context=detached_context())
+            shared = self._inflight[key] = _Inflight(future)
+            future.add_done_callback(lambda done: self._forget_inflight(key, done))
+        return await self._await_shared(shared, "GET", url)
+
+    async def _await_shared(
+        self,
+        shared: _Inflight,
+        method: str,
+        url: str,
+    ) -> Any:
+        shared.waiters += 1
+        try:
+            left = remaining(resolve_deadline(self._total_timeout))
+            if left is None:
+                return await asyncio.shield(shared.future)
+            try:
+                async with asyncio.timeout(left):
+                    return await asyncio.shield(shared.future)
+            except TimeoutError as exc:
+                raise DeadlineExceeded("Deadline exceeded", method=method, url=url) from exc
+        finally:
+            shared.waiters -= 1
+            # The fetch outlives a cancelled caller only while someone else still wants it.
+            if shared.waiters == 0 and not shared.future.done():
+                shared.future.cancel()
+
+    def _forget_inflight(self, key: str, done: asyncio.Future[Any]) -> None:
+        shared = self._inflight.get(key)
+        if shared is not None and shared.future is done:
+            del self._inflight[key]
+        if not done.cancelled():
+            done.exception()
+
+    async def _fetch(
+        self,
+        method_upper: str,
+        path: str,
+        params: Mapping[str, Any] | None,
+        key: str,
+        priority: Priority | None,
+    ) -> dict[str, Any]:
+        response = await self._fetch_response(method_upper, path, params, key, priority)
+        url = f"{self._base_url}{path}"
+        payload = ensure_object(self._parse_json(response, url, method_upper))
         if method_upper == "GET":
-            cached = self._cache.get(key)
-            if cached is not None:
-                return cached
+            ttl = self._cache_policies.ttl_for(path, params, payload)
+            size = len(response.content)
+            if self._cache_projection is not None:
+                payload = self._cache_projection.project(path, payload)
+                size = payload_size(payload)
+            self._cache.set(key, payload, ttl=ttl, size=size)
+        return payload
+
+    async def _fetch_raw(
+        self,
+        path: str,
+        params: Mapping[str, Any] | None,
+        key: str,
+        priority: Priority | None,
+    ) -> RawResponse:
+        response = await self._fetch_response("GET", path, params, key, priority)
+        raw = RawResponse.from_response(response)
+        ttl = self._cache_policies.ttl_for_raw(path, params, raw.content)
+        self._raw_cache.set(key, raw, ttl=ttl, size=len(raw.content))
+        return raw
 
+    async def _fetch_response(
+        self,
+        method_upper: str,
+        path: str,
+        params: Mapping[str, Any] | None,
+        key: str,
+        priority: Priority | None,
+    ) -> httpx.Response:
         url_for_logs = f"{self._base_url}{path}"
         headers_for_logs = redact_token(self._client.headers)
 
+        deadline = resolve_deadline(self._total_timeout)
         last_response: httpx.Response | None = None
         for attempt in range(self._max_retries + 1):
             if self._logger.isEnabledFor(logging.DEBUG):
@@ -303,9 +789,17 @@ class AsyncCoCClient:
                     headers_for_logs,
                 )
             try:
-                response = await self._client.request(method_upper, path, params=params)
+                response = await self._send(
+                    method_upper,
+                    path,
+                    params,
+                    priority,
+                    deadline,
+                    url_for_logs,
+                )
                 last_response = response
             except (httpx.TimeoutException, httpx.NetworkError) as exc:
+                self._check_budget(0.0, deadline, method_upper, url_for_logs)
                 if attempt >= self._max_retries:
                     raise APIError(
                         "Request failed",
@@ -313,14 +807,13 @@ class AsyncCoCClient:
                         url=url_for_logs,
                         payload=str(exc),
                     ) from exc
-                await self._sleep(self._backoff(attempt))
+                await self._sleep_within(
+                    self._backoff(attempt), deadline, method_upper, url_for_logs
+                )
                 continue
 
             if response.status_code == 200:
-                payload = ensure_object(self._parse_json(response, url_for_logs, method_upper))
-                if method_upper == "GET":
-                    self._cache.set(key, payload)
-                return payload
+                return response
 
             if response.status_code in (401, 403):
                 raise Unauthorized(
@@ -331,13 +824,16 @@ class AsyncCoCClient:
                     payload=self._safe_payload(response),
                 )
             if response.status_code == 404:
-                raise NotFound(
+                not_found = NotFound(
                     "Not found",
                     status_code=response.status_code,
                     method=method_upper,
                     url=url_for_logs,
                     payload=self._safe_payload(response),
                 )
+                if method_upper == "GET":
+                    self._not_found.set(key, not_found, size=len(response.content))
+                raise not_found
 
             if response.status_code == 429:
                 retry_after = self._retry_after_seconds(response.headers)
@@ -350,7 +846,13 @@ class AsyncCoCClient:
                         payload=self._safe_payload(response),
                         retry_after=retry_after,
                     )
-                await self._sleep(max(retry_after or 0.0, self._backoff(attempt)))
+                await self._sleep_within(
+                    max(retry_after or 0.0, self._backoff(attempt)),
+                    deadline,
+                    method_upper,
+                    url_for_logs,
+                    response,
+                )
                 continue
 
             if 500 <= response.status_code <= 599:
@@ -362,7 +864,13 @@ class AsyncCoCClient:
                         url=url_for_logs,
                         payload=self._safe_payload(response),
                     )
-                await self._sleep(self._backoff(attempt))
+                await self._sleep_within(
+                    self._backoff(attempt),
+                    deadline,
+                    method_upper,
+                    url_for_logs,
+                    response,
+                )
                 continue
 
             raise APIError(
@@ -380,6 +888,162 @@ class AsyncCoCClient:
             url=url_for_logs,
         )
 
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        params: Mapping[str, Any] | None,
+        priority: Priority | None,
+        deadline: float | None,
+        url: str,
+    ) -> httpx.Response:
+        if method != "GET" or self._hedge is None:
+            return await self._send_once(method, path, params, priority, deadline, url)
+
+        self._hedge_tokens = min(
+            self._hedge.max_burst,
+            self._hedge_tokens + self._hedge.max_fraction,
+        )
+        slotted = asyncio.Event()
+        primary = asyncio.ensure_future(
+            self._send_once(method, path, params, priority, deadline, url, on_slot=slotted.set)
+        )
+        pending: set[asyncio.Future[httpx.Response]] = {primary}
+        try:
+            delay = self._hedge_delay()
+            if delay is not None:
+                # Queue wait in the scheduler must not count toward the hedge delay.
+                waiter = asyncio.ensure_future(slotted.wait())
+                try:
+                    await asyncio.wait({primary, waiter}, return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    waiter.cancel()
+            if delay is not None and not primary.done():
+                done, pending = await asyncio.wait(pending, timeout=delay)
+                if not done and self._hedge_tokens >= 1.0:
+                    self._hedge_tokens -= 1.0
+                    self._logger.debug("hedging %s %s after %.3fs", method, url, delay)
+                    pending.add(
+                        asyncio.ensure_future(
+                            self._send_once(method, path, params, priority, deadline, url)
+                        )
+                    )
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                succeeded = [task for task in done if task.exception() is None]
+                if succeeded:
+                    return succeeded[0].result()
+            return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _send_once(
+        self,
+        method: str,
+        path: str,
+        params: Mapping[str, Any] | None,
+        priority: Priority | None,
+        deadline: float | None,
+        url: str,
+        *,
+        on_slot: Callable[[], None] | None = None,
+    ) -> httpx.Response:
+        await self._acquire_slot(priority, deadline, method, url)
+        try:
+            timeout = self._attempt_timeout(deadline, method, url)
+        except DeadlineExceeded:
+            # Nothing was sent, so there is no latency sample to record.
+            self._scheduler.release()
+            raise
+        if on_slot is not None:
+            on_slot()
+        started = time.monotonic()
+        try:
+            return await self._client.request(method, path, params=params, timeout=timeout)
+        finally:
+            # Cancelled hedge losers are the slow tail; leaving them out would
+            # drag the hedge percentile lower over time.
+            self._latency.record(time.monotonic() - started)
+            self._scheduler.release()
+
+    def _hedge_delay(self) -> float | None:
+        if self._hedge is None or len(self._latency) < self._hedge.min_samples:
+            return None
+        observed = self._latency.percentile(self._hedge.percentile)
+        if observed is None:
+            return None
+        return max(self._hedge.min_delay, observed)
+
+    async def _acquire_slot(
+        self,
+        priority: Priority | None,
+        deadline: float | None,
+        method: str,
+        url: str,
+    ) -> None:
+        if deadline is None:
+            await self._scheduler.acquire(priority)
+            return
+        try:
+            async with asyncio.timeout(remaining(deadline)):
+                await self._scheduler.acquire(priority)
+        except TimeoutError as exc:
+            raise DeadlineExceeded("Deadline exceeded", method=method, url=url) from exc
+
+    def _attempt_timeout(
+        self,
+        deadline: float | None,
+        method: str,
+        url: str,
+    ) -> Any:
+        left = remaining(deadline)
+        if left is None:
+            return httpx.USE_CLIENT_DEFAULT
+        if left < MIN_ATTEMPT_SECONDS:
+            raise DeadlineExceeded("Deadline exceeded", method=method, url=url)
+        # Explicit even when left >= timeout: a user-supplied client may default longer.
+        return httpx.Timeout(min(left, self._timeout))
+
+    def _check_budget(
+        self,
+        delay: float,
+        deadline: float | None,
+        method: str,
+        url: str,
+        response: httpx.Response | None = None,
+    ) -> None:
+        left = remaining(deadline)
+        if left is not None and left - delay < MIN_ATTEMPT_SECONDS:
+            raise DeadlineExceeded(
+                "Deadline exceeded",
+                status_code=response.status_code if response is not None else None,
+                method=method,
+                url=url,
+                payload=self._safe_payload(response) if response is not None else None,
+            )
+
+    async def _sleep_within(
+        self,
+        delay: float,
+        deadline: float | None,
+        method: str,
+        url: str,
+        response: httpx.Response | None = None,
+    ) -> None:
+        self._check_budget(delay, deadline, method, url, response)
+        await self._sleep(delay)
+
+    def _check_tags(self, method: str, path: str) -> None:
+        for tag in path_tags(path):
+            if not is_valid_tag(tag):
+                raise NotFound(
+                    "Invalid tag",
+                    method=method,
+                    url=f"{self._base_url}{path}",
+                    payload={"reason": "invalidTag", "tag": tag},
+                )
+
     def _backoff(self, attempt: int) -> float:
         delay = self._backoff_base * (2**attempt)
         return min(delay, self._backoff_max)
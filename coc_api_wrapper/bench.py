@@ -0,0 +1,441 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import dataclasses
+import gc
+import itertools
+import json
+import math
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+
+import httpx
+
+from .async_client import AsyncCoCClient
+from .client import CoCClient
+from .exceptions import APIError
+from .lite import LiteClanMember, LitePlayerRanking, LiteWarLogEntry, parse_lite
+from .mock import LatencyProfile, MockCoCAPI
+from .models import ClanMember, CoCBaseModel, PlayerRanking, WarLogEntry
+
+
+def _player_ranking(i: int) -> dict[str, Any]:
+    return {
+        "tag": f"#P{i:08d}",
+        "name": f"Player {i}",
+        "expLevel": 200 + i % 300,
+        "trophies": 6500 - i % 1500,
+        "rank": i + 1,
+        "previousRank": i + 2,
+        "clan": {"tag": f"#C{i // 50:06d}", "name": f"Clan {i // 50}", "badgeUrls": {}},
+        "league": {"id": 29000022, "name": "Legend League", "iconUrls": {}},
+    }
+
+
+def _clan_member(i: int) -> dict[str, Any]:
+    return {
+        "tag": f"#P{i:08d}",
+        "name": f"Player {i}",
+        "role": "member",
+        "townHallLevel": 10 + i % 7,
+        "expLevel": 150 + i % 100,
+        "trophies": 4000 + i % 1000,
+        "league": {"id": 29000018, "name": "Titan League I", "iconUrls": {}},
+    }
+
+
+def _warlog_entry(i: int) -> dict[str, Any]:
+    side = {"tag": "#C0", "name": "Clan", "clanLevel": 20, "stars": 40, "badgeUrls": {}}
+    return {
+        "result": "win",
+        "endTime": "20240101T000000.000Z",
+        "teamSize": 30,
+        "attacksPerMember": 2,
+        "clan": {**side, "destructionPercentage": 90.5},
+        "opponent": {**side, "tag": f"#O{i}", "destructionPercentage": 80.0},
+    }
+
+
+DATASETS: dict[str, tuple[Callable[[int], dict[str, Any]], type, type]] = {
+    "player_rankings": (_player_ranking, PlayerRanking, LitePlayerRanking),
+    "clan_members": (_clan_member, ClanMember, LiteClanMember),
+    "warlog": (_warlog_entry, WarLogEntry, LiteWarLogEntry),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ModelBenchResult:
+    dataset: str
+    layer: str
+    rows: int
+    rows_per_second: float
+    bytes_per_row: float
+
+
+def _parse_pydantic(model: type[CoCBaseModel], items: list[dict[str, Any]]) -> list[Any]:
+    validate = model.model_validate
+    return [validate(item) for item in items]
+
+
+def _measure(build: Callable[[], list[Any]], rows: int, repeat: int) -> tuple[float, float]:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        build()
+        best = min(best, time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        built = build()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del built
+    return rows / best, current / rows
+
+
+def bench_models(
+    datasets: Sequence[str] = tuple(DATASETS),
+    *,
+    rows: int = 50_000,
+    repeat: int = 3,
+) -> list[ModelBenchResult]:
+    results: list[ModelBenchResult] = []
+    for name in datasets:
+        make_row, model, lite_model = DATASETS[name]
+        payload = [make_row(i) for i in range(rows)]
+        layers: dict[str, Callable[[], list[Any]]] = {
+            "pydantic": partial(_parse_pydantic, model, payload),
+            "lite": partial(parse_lite, lite_model, payload),
+        }
+        for layer, build in layers.items():
+            per_second, per_row = _measure(build, rows, repeat)
+            results.append(ModelBenchResult(name, layer, rows, per_second, per_row))
+    return results
+
+
+def _print_models(results: Sequence[ModelBenchResult]) -> None:
+    print(f"{'dataset':<16} {'layer':<9} {'rows/s':>12} {'bytes/row':>10}")
+    for result in results:
+        print(
+            f"{result.dataset:<16} {result.layer:<9} "
+            f"{result.rows_per_second:>12,.0f} {result.bytes_per_row:>10,.0f}"
+        )
+
+
+def _op_player(client: Any, api: MockCoCAPI, key: int) -> Any:
+    return client.get_player(api.player_tag(key % api.players))
+
+
+def _op_clan(client: Any, api: MockCoCAPI, key: int) -> Any:
+    return client.get_clan(api.clan_tag(key % api.clans))
+
+
+def _op_war(client: Any, api: MockCoCAPI, key: int) -> Any:
+    return client.get_current_war(api.clan_tag(key % api.clans))
+
+
+def _op_members(client: Any, api: MockCoCAPI, key: int) -> Any:
+    return client.get_clan_members(api.clan_tag(key % api.clans), limit=50)
+
+
+def _op_rankings(client: Any, api: MockCoCAPI, key: int) -> Any:
+    locations = api.location_ids()
+    return client.get_location_player_rankings(locations[key % len(locations)], limit=50)
+
+
+# Each op works for both clients: sync returns the model, async returns a coroutine.
+LOAD_OPS: dict[str, Callable[[Any, MockCoCAPI, int], Any]] = {
+    "player": _op_player,
+    "clan": _op_clan,
+    "war": _op_war,
+    "members": _op_members,
+    "rankings": _op_rankings,
+}
+WORKLOADS: dict[str, dict[str, float]] = {
+    "bot": {"player": 5, "clan": 2, "war": 2, "members": 1},
+    "crawler": {"player": 6, "members": 2, "rankings": 2},
+    "war": {"war": 6, "clan": 2, "player": 2},
+}
+# sync: one plain CoCClient per worker thread; threaded: one thread_safe CoCClient
+# shared by all threads; async: one AsyncCoCClient shared by all tasks.
+LOAD_MODES = ("sync", "threaded", "async")
+_BASE_URL = "https://api.clashofclans.com/v1"
+
+
+@dataclass(frozen=True, slots=True)
+class LoadBenchResult:
+    mode: str
+    concurrency: int
+    requests: int
+    errors: int
+    retries: int
+    requests_per_second: float
+    p50: float
+    p95: float
+    p99: float
+    cpu_per_request: float
+
+
+@dataclass(slots=True)
+class _LoadRun:
+    plan: list[tuple[str, int]]
+    api: MockCoCAPI
+    latencies: list[float] = dataclasses.field(default_factory=list)
+    failures: list[Exception] = dataclasses.field(default_factory=list)
+    _next: Iterator[int] = dataclasses.field(default_factory=itertools.count, init=False)
+
+    def take(self) -> tuple[str, int] | None:
+        index = next(self._next)
+        return self.plan[index] if index < len(self.plan) else None
+
+
+def _percentile(ordered: Sequence[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+def _load_plan(
+    workload: Mapping[str, float], requests: int, keys: int, seed: int
+) -> list[tuple[str, int]]:
+    rng = random.Random(seed)
+    ops = rng.choices(list(workload), weights=list(workload.values()), k=requests)
+    return [(op, rng.randrange(keys)) for op in ops]
+
+
+def _sync_worker(run: _LoadRun, client: CoCClient) -> None:
+    while (step := run.take()) is not None:
+        op, key = step
+        started = time.perf_counter()
+        try:
+            LOAD_OPS[op](client, run.api, key)
+        except Exception as exc:
+            run.failures.append(exc)
+        run.latencies.append(time.perf_counter() - started)
+
+
+async def _async_worker(run: _LoadRun, client: AsyncCoCClient) -> None:
+    while (step := run.take()) is not None:
+        op, key = step
+        started = time.perf_counter()
+        try:
+            await LOAD_OPS[op](client, run.api, key)
+        except Exception as exc:
+            run.failures.append(exc)
+        run.latencies.append(time.perf_counter() - started)
+
+
+def _run_threads(run: _LoadRun, clients: Sequence[CoCClient]) -> None:
+    threads = [threading.Thread(target=_sync_worker, args=(run, client)) for client in clients]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+async def _run_tasks(run: _LoadRun, concurrency: int, **client_kwargs: Any) -> None:
+    http = httpx.AsyncClient(transport=run.api.async_transport(), base_url=_BASE_URL)
+    async with AsyncCoCClient("bench", client=http, **client_kwargs) as client:
+        await asyncio.gather(*(_async_worker(run, client) for _ in range(concurrency)))
+
+
+def _load_once(
+    mode: str, concurrency: int, plan: list[tuple[str, int]], api: MockCoCAPI, **client_kwargs: Any
+) -> LoadBenchResult:
+    run = _LoadRun(plan, api)
+    clients: list[CoCClient] = []
+    if mode == "sync":
+        clients = [
+            CoCClient(
+                "bench",
+                client=httpx.Client(transport=api.sync_transport(), base_url=_BASE_URL),
+                **client_kwargs,
+            )
+            for _ in range(concurrency)
+        ]
+    elif mode == "threaded":
+        shared = CoCClient(
+            "bench",
+            client=httpx.Client(transport=api.sync_transport(), base_url=_BASE_URL),
+            thread_safe=True,
+            **client_kwargs,
+        )
+        clients = [shared] * concurrency
+    elif mode != "async":
+        raise ValueError(f"unknown mode: {mode!r}")
+
+    gc.collect()
+    cpu_started, wall_started = time.process_time(), time.perf_counter()
+    mock_cpu_started = api.cpu_time
+    if mode == "async":
+        asyncio.run(_run_tasks(run, concurrency, **client_kwargs))
+    else:
+        _run_threads(run, clients)
+    wall = time.perf_counter() - wall_started
+    # The mock shares the process; its reply building is not client overhead.
+    cpu = max(time.process_time() - cpu_started - (api.cpu_time - mock_cpu_started), 0.0)
+    for client in dict.fromkeys(clients):
+        client.close()
+
+    statuses = api.status_counts()
+    retryable = sum(count for status, count in statuses.items() if status == 429 or status >= 500)
+    surfaced = sum(
+        1
+        for exc in run.failures
+        if isinstance(exc, APIError)
+        and exc.status_code is not None
+        and (exc.status_code == 429 or exc.status_code >= 500)
+    )
+    ordered = sorted(run.latencies)
+    done = len(ordered)
+    return LoadBenchResult(
+        mode,
+        concurrency,
+        done,
+        len(run.failures),
+        retryable - surfaced,
+        done / wall if wall else 0.0,
+        _percentile(ordered, 0.50),
+        _percentile(ordered, 0.95),
+        _percentile(ordered, 0.99),
+        cpu / done if done else 0.0,
+    )
+
+
+def bench_load(
+    modes: Sequence[str] = LOAD_MODES,
+    concurrency: Sequence[int] = (1, 4, 16, 64),
+    *,
+    requests: int = 2_000,
+    workload: Mapping[str, float] = WORKLOADS["bot"],
+    latency: LatencyProfile | None = None,
+    error_rate: float = 0.0,
+    throttle_rate: float = 0.0,
+    retry_after: float = 0.05,
+    players: int = 1_000_000,
+    keys: int = 100_000,
+    cache: bool = False,
+    seed: int = 0,
+    **client_kwargs: Any,
+) -> list[LoadBenchResult]:
+    unknown = set(workload) - set(LOAD_OPS)
+    if unknown:
+        raise ValueError(f"unknown workload ops: {sorted(unknown)}")
+    if latency is None:
+        latency = LatencyProfile(median=0.02, sigma=0.5, max=0.5)
+    client_kwargs = {"cache_enabled": cache, "backoff_base": 0.05, **client_kwargs}
+    plan = _load_plan(workload, requests, keys, seed)
+    results: list[LoadBenchResult] = []
+    for mode in modes:
+        for level in concurrency:
+            # A fresh mock per run keeps its render cache and fault RNG comparable.
+            api = MockCoCAPI(
+                seed=seed,
+                players=players,
+                latency=latency,
+                error_rate=error_rate,
+                throttle_rate=throttle_rate,
+                retry_after=retry_after,
+            )
+            results.append(_load_once(mode, level, plan, api, **client_kwargs))
+    return results
+
+
+def _print_load(results: Sequence[LoadBenchResult]) -> None:
+    print(
+        f"{'mode':<9} {'conc':>5} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+        f"{'retries':>8} {'errors':>7} {'cpu us/req':>11}"
+    )
+    for result in results:
+        print(
+            f"{result.mode:<9} {result.concurrency:>5} {result.requests_per_second:>9,.0f} "
+            f"{result.p50 * 1e3:>8.1f} {result.p95 * 1e3:>8.1f} {result.p99 * 1e3:>8.1f} "
+            f"{result.retries:>8} {result.errors:>7} {result.cpu_per_request * 1e6:>11,.0f}"
+        )
+    for mode in dict.fromkeys(result.mode for result in results):
+        best = max(
+            (result for result in results if result.mode == mode),
+            key=lambda result: result.requests_per_second,
+        )
+        print(
+            f"{mode}: peak {best.requests_per_second:,.0f} req/s at concurrency {best.concurrency}"
+        )
+
+
+def _parse_mix(value: str) -> dict[str, float]:
+    mix: dict[str, float] = {}
+    for part in value.split(","):
+        op, _, weight = part.partition("=")
+        if op.strip() not in LOAD_OPS:
+            raise argparse.ArgumentTypeError(f"unknown op {op.strip()!r}")
+        try:
+            mix[op.strip()] = float(weight or 1)
+        except ValueError as exc:
+            raise argparse.ArgumentTypeError(f"bad weight in {part!r}") from exc
+    return mix
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m coc_api_wrapper.bench")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    models = commands.add_parser("models", help="pydantic vs lite model construction")
+    models.add_argument("--rows", type=int, default=50_000)
+    models.add_argument("--repeat", type=int, default=3)
+    models.add_argument("--dataset", action="append", choices=sorted(DATASETS))
+
+    load = commands.add_parser("load", help="sync vs threaded vs async clients on a mock API")
+    load.add_argument("--mode", action="append", choices=LOAD_MODES)
+    load.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    load.add_argument("--requests", type=int, default=2_000, help="requests per run")
+    load.add_argument("--workload", choices=sorted(WORKLOADS), default="bot")
+    load.add_argument("--mix", type=_parse_mix, help="custom workload, e.g. player=5,clan=1")
+    load.add_argument("--latency-ms", type=float, default=20.0, help="median mock latency")
+    load.add_argument("--latency-sigma", type=float, default=0.5)
+    load.add_argument("--error-rate", type=float, default=0.0)
+    load.add_argument("--throttle-rate", type=float, default=0.0)
+    load.add_argument("--players", type=int, default=1_000_000)
+    load.add_argument("--keys", type=int, default=100_000, help="distinct tags in the workload")
+    load.add_argument("--cache", action="store_true", help="enable the client cache")
+    load.add_argument("--seed", type=int, default=0)
+    load.add_argument("--json", metavar="PATH", help="also write results as JSON")
+
+    args = parser.parse_args(argv)
+    if args.command == "models":
+        _print_models(
+            bench_models(args.dataset or tuple(DATASETS), rows=args.rows, repeat=args.repeat)
+        )
+    elif args.command == "load":
+        results = bench_load(
+            args.mode or LOAD_MODES,
+            args.concurrency,
+            requests=args.requests,
+            workload=args.mix or WORKLOADS[args.workload],
+            latency=LatencyProfile(args.latency_ms / 1000, args.latency_sigma),
+            error_rate=args.error_rate,
+            throttle_rate=args.throttle_rate,
+            players=args.players,
+            keys=args.keys,
+            cache=args.cache,
+            seed=args.seed,
+        )
+        _print_load(results)
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as fh:
+                json.dump([dataclasses.asdict(result) for result in results], fh, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,13 +3,27 @@ from __future__ import annotations
 import asyncio
 import os
 import time
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass
-from typing import Generic, Literal, TypeVar
-
-from .exceptions import APIError, NotFound, RateLimited, ServerError, Unauthorized
-
-BotErrorKind = Literal["unauthorized", "not_found", "rate_limited", "server_error", "api_error"]
+from typing import Any, Generic, Literal, TypeVar
+
+from .exceptions import (
+    APIError,
+    DeadlineExceeded,
+    NotFound,
+    RateLimited,
+    ServerError,
+    Unauthorized,
+)
+
+BotErrorKind = Literal[
+    "unauthorized",
+    "not_found",
+    "rate_limited",
+    "server_error",
+    "timeout",
+    "api_error",
+]
 
 
 @dataclass(frozen=True, slots=True)
@@ -44,6 +58,8 @@ def bot_error_from_exception(exc: Exception) -> BotError:
         )
     if isinstance(exc, ServerError):
         return BotError(kind="server_error")
+    if isinstance(exc, DeadlineExceeded):
+        return BotError(kind="timeout")
     if isinstance(exc, APIError):
         return BotError(kind="api_error")
     return BotError(kind="api_error")
@@ -55,6 +71,7 @@ _MESSAGES: dict[str, dict[BotErrorKind, str]] = {
         "not_found": "Ничего не найдено по этому тегу.",
         "rate_limited": "Слишком много запросов (rate limit).",
         "server_error": "Проблема на стороне CoC API. Попробуй позже.",
+        "timeout": "CoC API не ответил вовремя. Попробуй позже.",
         "api_error": "Ошибка CoC API.",
     },
     "en": {
@@ -62,6 +79,7 @@ _MESSAGES: dict[str, dict[BotErrorKind, str]] = {
         "not_found": "Nothing found for this tag.",
         "rate_limited": "Too many requests (rate limit).",
         "server_error": "CoC API is having issues. Try again later.",
+        "timeout": "CoC API did not respond in time. Try again later.",
         "api_error": "CoC API error.",
     },
 }
@@ -153,3 +171,55 @@ async def safe_await_with_retry(
             continue
         except Exception as exc:
             return BotResult(error=bot_error_from_exception(exc))
+
+
+@dataclass(slots=True)
+class _RetryGate:
+    resume_at: float
+
+
+async def safe_gather(
+    factories: Iterable[Callable[[], Awaitable[Any]]],
+    *,
+    concurrency: int | None = None,
+    max_retries: int = 1,
+    max_wait: float = 15.0,
+    sleep_fn: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    time_fn: Callable[[], float] = time.monotonic,
+) -> list[BotResult[Any]]:
+    if concurrency is not None and concurrency <= 0:
+        raise ValueError("concurrency must be positive")
+    retries = max(0, int(max_retries))
+    started = time_fn()
+    # One 429 pauses every factory in the group; ``max_wait`` caps the total pause.
+    gate = _RetryGate(resume_at=started)
+    semaphore = asyncio.Semaphore(concurrency) if concurrency is not None else None
+
+    async def wait_gate() -> None:
+        while (delay := gate.resume_at - time_fn()) > 0:
+            await sleep_fn(delay)
+
+    async def attempt(factory: Callable[[], Awaitable[Any]]) -> Any:
+        if semaphore is None:
+            return await factory()
+        async with semaphore:
+            return await factory()
+
+    async def run(factory: Callable[[], Awaitable[Any]]) -> BotResult[Any]:
+        tries = 0
+        while True:
+            await wait_gate()
+            try:
+                return BotResult(value=await attempt(factory))
+            except RateLimited as exc:
+                if tries >= retries or exc.retry_after is None:
+                    return BotResult(error=bot_error_from_exception(exc))
+                resume_at = max(gate.resume_at, time_fn() + exc.retry_after)
+                if resume_at - started > max_wait:
+                    return BotResult(error=bot_error_from_exception(exc))
+                gate.resume_at = resume_at
+                tries += 1
+            except Exception as exc:
+                return BotResult(error=bot_error_from_exception(exc))
+
+    return list(await asyncio.gather(*(run(factory) for factory in factories)))
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import heapq
+import threading
 import time
+from collections import OrderedDict
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Generic, TypeVar
+from typing import Generic, Literal, TypeVar
+
+from .utils import endpoint_template
 
 V = TypeVar("V")
 
@@ -12,6 +17,72 @@ V = TypeVar("V")
 class _CacheItem(Generic[V]):
     expires_at: float
     value: V
+    template: str = ""
+    size: int = 0
+    hits: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    entries: int
+    hits: int
+    misses: int
+    bytes: int = 0
+    expirations: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __add__(self, other: CacheStats) -> CacheStats:
+        return CacheStats(
+            entries=self.entries + other.entries,
+            hits=self.hits + other.hits,
+            misses=self.misses + other.misses,
+            bytes=self.bytes + other.bytes,
+            expirations=self.expirations + other.expirations,
+            evictions=self.evictions + other.evictions,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CacheKeyStats:
+    key: str
+    template: str
+    bytes: int
+    hits: int
+    ttl_remaining: float
+
+
+@dataclass(slots=True)
+class _Counters:
+    entries: int = 0
+    hits: int = 0
+    misses: int = 0
+    bytes: int = 0
+    expirations: int = 0
+    evictions: int = 0
+
+    def snapshot(self) -> CacheStats:
+        return CacheStats(
+            entries=self.entries,
+            hits=self.hits,
+            misses=self.misses,
+            bytes=self.bytes,
+            expirations=self.expirations,
+            evictions=self.evictions,
+        )
+
+
+TopKeysBy = Literal["bytes", "hits"]
+CacheStatsExporter = Callable[[str, str, CacheStats], None]
+
+
+def key_template(key: str) -> str:
+    """Endpoint template of a :func:`~coc_api_wrapper.utils.cache_key`, e.g. ``/clans/{tag}``."""
+    return endpoint_template(key.split(" ", maxsplit=1)[-1])
 
 
 class TTLCache(Generic[V]):
@@ -20,12 +91,18 @@ class TTLCache(Generic[V]):
         *,
         enabled: bool = True,
         default_ttl: float = 30.0,
+        max_entries: int | None = None,
         time_fn: Callable[[], float] = time.monotonic,
     ) -> None:
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError("max_entries must be positive")
         self._enabled = enabled
         self._default_ttl = float(default_ttl)
+        self._max_entries = max_entries
         self._time_fn = time_fn
-        self._items: dict[str, _CacheItem[V]] = {}
+        self._items: OrderedDict[str, _CacheItem[V]] = OrderedDict()
+        # Counters are kept per endpoint template; totals are their sum.
+        self._counters: dict[str, _Counters] = {}
 
     @property
     def enabled(self) -> bool:
@@ -35,30 +112,218 @@ class TTLCache(Generic[V]):
     def enabled(self, value: bool) -> None:
         self._enabled = bool(value)
         if not self._enabled:
-            self._items.clear()
+            self.clear()
 
     @property
     def default_ttl(self) -> float:
         return self._default_ttl
 
+    @property
+    def max_entries(self) -> int | None:
+        return self._max_entries
+
+    def __len__(self) -> int:
+        return len(self._items)
+
     def clear(self) -> None:
         self._items.clear()
+        for counters in self._counters.values():
+            counters.entries = 0
+            counters.bytes = 0
+
+    def stats(self) -> CacheStats:
+        total = CacheStats(entries=0, hits=0, misses=0)
+        for stats in self.template_stats().values():
+            total += stats
+        return total
+
+    def template_stats(self) -> dict[str, CacheStats]:
+        return {template: counters.snapshot() for template, counters in self._counters.items()}
+
+    def top_keys(self, n: int = 10, *, by: TopKeysBy = "bytes") -> list[CacheKeyStats]:
+        if by not in ("bytes", "hits"):
+            raise ValueError("by must be 'bytes' or 'hits'")
+        attribute = "size" if by == "bytes" else "hits"
+        now = self._time_fn()
+        live = [(key, item) for key, item in list(self._items.items()) if item.expires_at > now]
+        ranked = heapq.nlargest(n, live, key=lambda entry: getattr(entry[1], attribute))
+        return [
+            CacheKeyStats(key, item.template, item.size, item.hits, item.expires_at - now)
+            for key, item in ranked
+        ]
+
+    def purge_expired(self) -> int:
+        now = self._time_fn()
+        expired = [key for key, item in list(self._items.items()) if item.expires_at <= now]
+        for key in expired:
+            self._drop(key, "expirations")
+        return len(expired)
+
+    def ttl_remaining(self, key: str) -> float | None:
+        item = self._items.get(key)
+        if item is None:
+            return None
+        left = item.expires_at - self._time_fn()
+        return left if left > 0 else None
 
     def get(self, key: str) -> V | None:
         if not self._enabled:
             return None
         item = self._items.get(key)
         if item is None:
+            self._counter(key_template(key)).misses += 1
             return None
         if item.expires_at <= self._time_fn():
-            self._items.pop(key, None)
+            self._drop(key, "expirations")
+            self._counter(item.template).misses += 1
             return None
+        item.hits += 1
+        self._counter(item.template).hits += 1
+        if self._max_entries is not None:
+            self._items.move_to_end(key)
         return item.value
 
-    def set(self, key: str, value: V, *, ttl: float | None = None) -> None:
+    def set(self, key: str, value: V, *, ttl: float | None = None, size: int = 0) -> None:
         if not self._enabled:
             return
         ttl_value = self._default_ttl if ttl is None else float(ttl)
         if ttl_value <= 0:
             return
-        self._items[key] = _CacheItem(expires_at=self._time_fn() + ttl_value, value=value)
+        template = key_template(key)
+        old = self._items.get(key)
+        self._items[key] = _CacheItem(self._time_fn() + ttl_value, value, template, size)
+        counters = self._counter(template)
+        if old is None:
+            counters.entries += 1
+        else:
+            counters.bytes -= old.size
+        counters.bytes += size
+        if self._max_entries is not None:
+            self._items.move_to_end(key)
+            while len(self._items) > self._max_entries:
+                self._drop(next(iter(self._items)), "evictions")
+
+    def _counter(self, template: str) -> _Counters:
+        counters = self._counters.get(template)
+        if counters is None:
+            counters = self._counters[template] = _Counters()
+        return counters
+
+    def _drop(self, key: str, reason: Literal["expirations", "evictions"]) -> None:
+        item = self._items.pop(key, None)
+        if item is None:
+            return
+        counters = self._counter(item.template)
+        counters.entries -= 1
+        counters.bytes -= item.size
+        setattr(counters, reason, getattr(counters, reason) + 1)
+
+
+class ShardedTTLCache(Generic[V]):
+    """Thread-safe :class:`TTLCache` split into independently locked shards.
+
+    Keys are spread over ``shards`` caches by hash, so threads touching
+    different keys rarely contend for the same lock. ``max_entries`` is
+    divided evenly between shards, which makes LRU eviction per shard.
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = True,
+        default_ttl: float = 30.0,
+        max_entries: int | None = None,
+        shards: int = 16,
+        time_fn: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if shards <= 0:
+            raise ValueError("shards must be positive")
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        per_shard = None if max_entries is None else max(1, -(-max_entries // shards))
+        self._max_entries = max_entries
+        self._shards = [
+            TTLCache[V](
+                enabled=enabled,
+                default_ttl=default_ttl,
+                max_entries=per_shard,
+                time_fn=time_fn,
+            )
+            for _ in range(shards)
+        ]
+        self._locks = [threading.Lock() for _ in range(shards)]
+
+    @property
+    def enabled(self) -> bool:
+        return self._shards[0].enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        for shard, lock in zip(self._shards, self._locks, strict=True):
+            with lock:
+                shard.enabled = value
+
+    @property
+    def default_ttl(self) -> float:
+        return self._shards[0].default_ttl
+
+    @property
+    def max_entries(self) -> int | None:
+        return self._max_entries
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def clear(self) -> None:
+        for shard, lock in zip(self._shards, self._locks, strict=True):
+            with lock:
+                shard.clear()
+
+    def stats(self) -> CacheStats:
+        total = CacheStats(entries=0, hits=0, misses=0)
+        for shard, lock in zip(self._shards, self._locks, strict=True):
+            with lock:
+                total += shard.stats()
+        return total
+
+    def template_stats(self) -> dict[str, CacheStats]:
+        merged: dict[str, CacheStats] = {}
+        for shard, lock in zip(self._shards, self._locks, strict=True):
+            with lock:
+                per_shard = shard.template_stats()
+            for template, stats in per_shard.items():
+                merged[template] = merged[template] + stats if template in merged else stats
+        return merged
+
+    def top_keys(self, n: int = 10, *, by: TopKeysBy = "bytes") -> list[CacheKeyStats]:
+        candidates: list[CacheKeyStats] = []
+        for shard, lock in zip(self._shards, self._locks, strict=True):
+            with lock:
+                candidates.extend(shard.top_keys(n, by=by))
+        attribute = "bytes" if by == "bytes" else "hits"
+        return heapq.nlargest(n, candidates, key=lambda entry: getattr(entry, attribute))
+
+    def purge_expired(self) -> int:
+        purged = 0
+        for shard, lock in zip(self._shards, self._locks, strict=True):
+            with lock:
+                purged += shard.purge_expired()
+        return purged
+
+    def ttl_remaining(self, key: str) -> float | None:
+        index = self._index(key)
+        with self._locks[index]:
+            return self._shards[index].ttl_remaining(key)
+
+    def get(self, key: str) -> V | None:
+        index = self._index(key)
+        with self._locks[index]:
+            return self._shards[index].get(key)
+
+    def set(self, key: str, value: V, *, ttl: float | None = None, size: int = 0) -> None:
+        index = self._index(key)
+        with self._locks[index]:
+            self._shards[index].set(key, value, ttl=ttl, size=size)
+
+    def _index(self, key: str) -> int:
+        return hash(key) % len(self._shards)
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import json
+import math
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from .utils import endpoint_template, parse_api_time
+
+FOREVER = math.inf
+REFERENCE_TTL = 24 * 60 * 60.0
+
+TTLResolver = Callable[[Mapping[str, Any], Mapping[str, Any]], float | None]
+
+
+@dataclass(frozen=True, slots=True)
+class CachePolicy:
+    ttl: float | None = None
+    resolver: TTLResolver | None = None
+
+    def resolve(self, payload: Mapping[str, Any], params: Mapping[str, Any]) -> float | None:
+        if self.resolver is not None:
+            ttl = self.resolver(payload, params)
+            if ttl is not None:
+                return ttl
+        return self.ttl
+
+
+class CachePolicyRegistry:
+    def __init__(self, policies: Mapping[str, CachePolicy] | None = None) -> None:
+        self._policies: dict[str, CachePolicy] = dict(policies or {})
+
+    def register(
+        self,
+        template: str,
+        *,
+        ttl: float | None = None,
+        resolver: TTLResolver | None = None,
+    ) -> None:
+        self._policies[template] = CachePolicy(ttl=ttl, resolver=resolver)
+
+    def unregister(self, template: str) -> None:
+        self._policies.pop(template, None)
+
+    def get(self, template: str) -> CachePolicy | None:
+        return self._policies.get(template)
+
+    def templates(self) -> list[str]:
+        return sorted(self._policies)
+
+    def copy(self) -> CachePolicyRegistry:
+        return CachePolicyRegistry(self._policies)
+
+    def ttl_for(
+        self,
+        path: str,
+        params: Mapping[str, Any] | None,
+        payload: Mapping[str, Any],
+    ) -> float | None:
+        policy = self._policies.get(endpoint_template(path))
+        if policy is None:
+            return None
+        return policy.resolve(payload, params or {})
+
+    def ttl_for_raw(
+        self,
+        path: str,
+        params: Mapping[str, Any] | None,
+        content: bytes,
+    ) -> float | None:
+        policy = self._policies.get(endpoint_template(path))
+        if policy is None:
+            return None
+        if policy.resolver is None:
+            return policy.ttl
+        # Only payload-dependent policies pay for parsing the body.
+        try:
+            payload = json.loads(content)
+        except ValueError:
+            return policy.ttl
+        return policy.resolve(payload if isinstance(payload, dict) else {}, params or {})
+
+
+def forever_if_state(*states: str) -> TTLResolver:
+    def resolver(payload: Mapping[str, Any], params: Mapping[str, Any]) -> float | None:
+        return FOREVER if payload.get("state") in states else None
+
+    return resolver
+
+
+def until_end_time(
+    payload: Mapping[str, Any],
+    params: Mapping[str, Any],
+    *,
+    time_fn: Callable[[], float] = time.time,
+) -> float | None:
+    end_time = payload.get("endTime")
+    if not isinstance(end_time, str):
+        return None
+    try:
+        left = parse_api_time(end_time).timestamp() - time_fn()
+    except ValueError:
+        return None
+    return min(left, REFERENCE_TTL) if left > 0 else None
+
+
+def _settled_raid_page(payload: Mapping[str, Any], params: Mapping[str, Any]) -> float | None:
+    items = payload.get("items")
+    if not items or any(item.get("state") != "ended" for item in items):
+        return None
+    # Pages are addressed by position, so a new raid weekend shifts them: not FOREVER.
+    return 600.0
+
+
+def default_cache_policies() -> CachePolicyRegistry:
+    registry = CachePolicyRegistry()
+    registry.register("/clanwarleagues/wars/{tag}", resolver=forever_if_state("warEnded"))
+    registry.register("/clans/{tag}/capitalraidseasons", resolver=_settled_raid_page)
+    registry.register("/leagues/{id}/seasons/{season_id}", ttl=FOREVER)
+    registry.register("/leagues/{id}/seasons", ttl=60 * 60.0)
+    registry.register("/leagues", ttl=REFERENCE_TTL)
+    registry.register("/clanwarleagues/warleagues", ttl=REFERENCE_TTL)
+    registry.register("/labels/clans", ttl=REFERENCE_TTL)
+    registry.register("/locations", ttl=REFERENCE_TTL)
+    registry.register("/goldpass/seasons/current", resolver=until_end_time)
+    return registry
@@ -1,37 +1,103 @@
 from __future__ import annotations
 
+import contextvars
+import dataclasses
+import functools
 import json
 import logging
+import threading
 import time
-from collections.abc import Callable, Mapping
-from typing import Any
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
 
 import httpx
 
-from .cache import TTLCache
-from .exceptions import APIError, NotFound, RateLimited, ServerError, Unauthorized
+from .cache import (
+    CacheKeyStats,
+    CacheStats,
+    CacheStatsExporter,
+    ShardedTTLCache,
+    TopKeysBy,
+    TTLCache,
+)
+from .cache_policies import CachePolicyRegistry, default_cache_policies
+from .deadline import MIN_ATTEMPT_SECONDS, remaining, resolve_deadline
+from .exceptions import (
+    APIError,
+    DeadlineExceeded,
+    NotFound,
+    RateLimited,
+    ServerError,
+    Unauthorized,
+)
+from .lite import (
+    LiteClanMember,
+    LiteClanRanking,
+    LiteLeagueSeasonRank,
+    LitePlayerRanking,
+    LiteRaidSeason,
+    LiteWarLogEntry,
+)
 from .models import (
+    CapitalRanking,
     CapitalRankingPage,
     Clan,
     ClanLabelsPage,
+    ClanMember,
     ClanMembersPage,
+    ClanRanking,
     ClanRankingPage,
+    ClanRoster,
     CurrentWar,
     CWLLeagueGroup,
     CWLLeaguePage,
+    CWLSeason,
     CWLWar,
     GoldPassSeason,
+    LeagueSeasonRank,
     LeagueSeasonRankingsPage,
     LeagueSeasonsPage,
     LeaguesPage,
     LocationsPage,
+    Page,
+    PageWalk,
     Player,
+    PlayerRanking,
     PlayerRankingPage,
+    RaidSeason,
     RaidSeasonsPage,
+    RawResponse,
+    SyncResult,
+    WarLogEntry,
     WarLogPage,
+    advance_watermark,
+    cwl_war_tags,
     ensure_object,
+    split_at_watermark,
+)
+from .projection import CacheProjection, payload_size
+from .store import EntityStore
+from .utils import (
+    QueryParams,
+    cache_key,
+    is_valid_tag,
+    normalize_tag,
+    paginate,
+    path_tags,
+    query_params,
+    raw_path,
+    redact_token,
 )
-from .utils import cache_key, normalize_tag, paginate, redact_token
+
+R = TypeVar("R")
+
+
+@dataclasses.dataclass(slots=True)
+class _Call:
+    done: threading.Event = dataclasses.field(default_factory=threading.Event)
+    result: Any = None
+    error: BaseException | None = None
 
 
 class CoCClient:
@@ -46,7 +112,17 @@ class CoCClient:
         backoff_max: float = 8.0,
         cache_enabled: bool = True,
         cache_ttl: float = 30.0,
+        cache_max_entries: int | None = None,
+        negative_cache_ttl: float = 0.0,
+        validate_tags: bool = False,
+        cache_policies: CachePolicyRegistry | None = None,
+        cache_projection: CacheProjection | None = None,
+        lite_models: bool = False,
+        store: EntityStore | None = None,
+        thread_safe: bool = False,
+        cache_shards: int = 16,
         client: httpx.Client | None = None,
+        total_timeout: float | None = None,
         sleep_fn: Callable[[float], None] = time.sleep,
         logger: logging.Logger | None = None,
     ) -> None:
@@ -56,14 +132,39 @@ class CoCClient:
 
         self._base_url = base_url.rstrip("/")
         self._timeout = float(timeout)
+        self._total_timeout = None if total_timeout is None else float(total_timeout)
         self._max_retries = int(max_retries)
         self._backoff_base = float(backoff_base)
         self._backoff_max = float(backoff_max)
         self._sleep = sleep_fn
         self._logger = logger or logging.getLogger("coc_api_wrapper")
-        self._cache: TTLCache[dict[str, Any]] = TTLCache(
+        cache_type: Callable[..., Any] = (
+            functools.partial(ShardedTTLCache, shards=cache_shards) if thread_safe else TTLCache
+        )
+        self._cache: TTLCache[dict[str, Any]] | ShardedTTLCache[dict[str, Any]] = cache_type(
+            enabled=cache_enabled,
+            default_ttl=cache_ttl,
+            max_entries=cache_max_entries,
+        )
+        self._validate_tags = validate_tags
+        self._store = store
+        self._lite_models = lite_models
+        self._not_found: TTLCache[NotFound] | ShardedTTLCache[NotFound] = cache_type(
+            enabled=cache_enabled,
+            default_ttl=negative_cache_ttl,
+            max_entries=cache_max_entries,
+        )
+        # Concurrent threads missing the cache on the same key share one fetch.
+        self._inflight: dict[str, _Call] | None = {} if thread_safe else None
+        self._inflight_lock = threading.Lock()
+        self._cache_policies = (
+            cache_policies if cache_policies is not None else default_cache_policies()
+        )
+        self._cache_projection = cache_projection
+        self._raw_cache: TTLCache[RawResponse] | ShardedTTLCache[RawResponse] = cache_type(
             enabled=cache_enabled,
             default_ttl=cache_ttl,
+            max_entries=cache_max_entries,
         )
 
         default_headers = {
@@ -80,6 +181,35 @@ class CoCClient:
                 headers=default_headers,
             )
 
+    @property
+    def store(self) -> EntityStore | None:
+        return self._store
+
+    def cache_stats(self) -> dict[str, CacheStats]:
+        return {
+            "responses": self._cache.stats(),
+            "not_found": self._not_found.stats(),
+            "raw": self._raw_cache.stats(),
+        }
+
+    def cache_template_stats(self) -> dict[str, dict[str, CacheStats]]:
+        return {
+            "responses": self._cache.template_stats(),
+            "not_found": self._not_found.template_stats(),
+            "raw": self._raw_cache.template_stats(),
+        }
+
+    def cache_top_keys(self, n: int = 10, *, by: TopKeysBy = "bytes") -> list[CacheKeyStats]:
+        return self._cache.top_keys(n, by=by)
+
+    def cache_ttl(self, path: str, params: Mapping[str, Any] | None = None) -> float | None:
+        return self._cache.ttl_remaining(cache_key("GET", raw_path(path), params))
+
+    def export_cache_stats(self, exporter: CacheStatsExporter) -> None:
+        for name, per_template in self.cache_template_stats().items():
+            for template, stats in per_template.items():
+                exporter(name, template, stats)
+
     def close(self) -> None:
         self._client.close()
 
@@ -91,7 +221,10 @@ class CoCClient:
 
     def get_clan(self, tag: str) -> Clan:
         payload = self._request("GET", f"/clans/{normalize_tag(tag)}")
-        return Clan.model_validate(payload)
+        clan = Clan.model_validate(payload)
+        if self._store is not None:
+            self._store.add_clan(clan)
+        return clan
 
     def get_clan_members(
         self,
@@ -105,11 +238,50 @@ class CoCClient:
             f"/clans/{normalize_tag(tag)}/members",
             params=paginate(limit=limit, after=after),
         )
-        return ClanMembersPage.model_validate(payload)
+        page = ClanMembersPage.model_validate(payload)
+        if self._store is not None:
+            complete = limit is None and after is None and page.after is None
+            self._store.add_clan_members(tag, page, complete=complete)
+        return page
 
     def get_player(self, tag: str) -> Player:
         payload = self._request("GET", f"/players/{normalize_tag(tag)}")
-        return Player.model_validate(payload)
+        player = Player.model_validate(payload)
+        if self._store is not None:
+            self._store.add_player(player)
+        return player
+
+    def get_clan_roster(self, clan_tag: str, *, max_workers: int = 10) -> ClanRoster:
+        if max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+        members = self.get_clan_members(clan_tag).items
+        tags = [normalize_tag(member.tag) for member in members]
+        players: dict[str, Player] = {}
+        errors: dict[str, APIError] = {}
+        if tags and self._inflight is None:
+            # The plain TTLCache is not thread-safe; fetch one by one.
+            for tag in tags:
+                try:
+                    players[tag] = self.get_player(tag)
+                except APIError as exc:
+                    errors[tag] = exc
+        elif tags:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(tags))) as executor:
+                futures = {
+                    tag: executor.submit(contextvars.copy_context().run, self.get_player, tag)
+                    for tag in tags
+                }
+                for tag, future in futures.items():
+                    try:
+                        players[tag] = future.result()
+                    except APIError as exc:
+                        errors[tag] = exc
+        return ClanRoster(
+            clan_tag=normalize_tag(clan_tag),
+            members=members,
+            players=players,
+            errors=errors,
+        )
 
     def get_current_war(self, clan_tag: str) -> CurrentWar:
         payload = self._request("GET", f"/clans/{normalize_tag(clan_tag)}/currentwar")
@@ -129,7 +301,22 @@ class CoCClient:
         )
         return RaidSeasonsPage.model_validate(payload)
 
-    def get_cwl_group(self, clan_tag: str) -> dict[str, Any]:
+    def sync_capital_raids(
+        self,
+        clan_tag: str,
+        *,
+        since: str | None = None,
+        page_size: int = 10,
+    ) -> SyncResult[RaidSeason]:
+        return self._sync_pages(
+            self.get_capital_raids,
+            clan_tag,
+            since,
+            page_size,
+            settled=lambda raid: raid.state != "ongoing",
+        )
+
+    def get_cwl_group(self, clan_tag: str) -> CWLLeagueGroup:
         payload = self._request(
             "GET",
             f"/clans/{normalize_tag(clan_tag)}/currentwar/leaguegroup",
@@ -150,6 +337,15 @@ class CoCClient:
         )
         return WarLogPage.model_validate(payload)
 
+    def sync_warlog(
+        self,
+        clan_tag: str,
+        *,
+        since: str | None = None,
+        page_size: int = 10,
+    ) -> SyncResult[WarLogEntry]:
+        return self._sync_pages(self.get_clan_warlog, clan_tag, since, page_size)
+
     def get_cwl_leagues(
         self,
         *,
@@ -167,6 +363,23 @@ class CoCClient:
         payload = self._request("GET", f"/clanwarleagues/wars/{normalize_tag(war_tag)}")
         return CWLWar.model_validate(payload)
 
+    def get_cwl_season(self, clan_tag: str, *, max_workers: int = 8) -> CWLSeason:
+        if max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+        group = self.get_cwl_group(clan_tag)
+        war_tags = cwl_war_tags(group)
+        if not war_tags or self._inflight is None:
+            # The plain TTLCache is not thread-safe; fetch one by one.
+            wars = {war_tag: self.get_cwl_war(war_tag) for war_tag in war_tags}
+            return CWLSeason(group=group, wars=wars)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(war_tags))) as executor:
+            futures = {
+                war_tag: executor.submit(contextvars.copy_context().run, self.get_cwl_war, war_tag)
+                for war_tag in war_tags
+            }
+            wars = {war_tag: future.result() for war_tag, future in futures.items()}
+        return CWLSeason(group=group, wars=wars)
+
     def get_locations(
         self,
         *,
@@ -188,7 +401,10 @@ class CoCClient:
             f"/locations/{location_id}/rankings/clans",
             params=paginate(limit=limit, after=after),
         )
-        return ClanRankingPage.model_validate(payload)
+        page = ClanRankingPage.model_validate(payload)
+        if self._store is not None:
+            self._store.add_clan_rankings(location_id, page)
+        return page
 
     def get_location_player_rankings(
         self,
@@ -202,7 +418,10 @@ class CoCClient:
             f"/locations/{location_id}/rankings/players",
             params=paginate(limit=limit, after=after),
         )
-        return PlayerRankingPage.model_validate(payload)
+        page = PlayerRankingPage.model_validate(payload)
+        if self._store is not None:
+            self._store.add_player_rankings(location_id, page)
+        return page
 
     def get_location_capital_rankings(
         self,
@@ -216,7 +435,10 @@ class CoCClient:
             f"/locations/{location_id}/rankings/capital",
             params=paginate(limit=limit, after=after),
         )
-        return CapitalRankingPage.model_validate(payload)
+        page = CapitalRankingPage.model_validate(payload)
+        if self._store is not None:
+            self._store.add_clan_rankings(location_id, page)
+        return page
 
     def get_leagues(
         self,
@@ -273,6 +495,113 @@ class CoCClient:
         payload = self._request("GET", "/goldpass/seasons/current")
         return GoldPassSeason.model_validate(payload)
 
+    def iter_clan_members(
+        self,
+        tag: str,
+        *,
+        page_size: int | None = None,
+        lite: bool | None = None,
+    ) -> Iterator[ClanMember | LiteClanMember]:
+        return self._iter_items("clan_members", page_size, lite, tag=normalize_tag(tag))
+
+    def iter_clan_warlog(
+        self,
+        tag: str,
+        *,
+        page_size: int | None = None,
+        lite: bool | None = None,
+    ) -> Iterator[WarLogEntry | LiteWarLogEntry]:
+        return self._iter_items("clan_warlog", page_size, lite, tag=normalize_tag(tag))
+
+    def iter_capital_raids(
+        self,
+        clan_tag: str,
+        *,
+        page_size: int | None = None,
+        lite: bool | None = None,
+    ) -> Iterator[RaidSeason | LiteRaidSeason]:
+        return self._iter_items("capital_raids", page_size, lite, tag=normalize_tag(clan_tag))
+
+    def iter_location_clan_rankings(
+        self,
+        location_id: int | str,
+        *,
+        page_size: int | None = None,
+        lite: bool | None = None,
+    ) -> Iterator[ClanRanking | LiteClanRanking]:
+        return self._iter_items("location_clan_rankings", page_size, lite, location_id=location_id)
+
+    def iter_location_player_rankings(
+        self,
+        location_id: int | str,
+        *,
+        page_size: int | None = None,
+        lite: bool | None = None,
+    ) -> Iterator[PlayerRanking | LitePlayerRanking]:
+        return self._iter_items(
+            "location_player_rankings", page_size, lite, location_id=location_id
+        )
+
+    def iter_location_capital_rankings(
+        self,
+        location_id: int | str,
+        *,
+        page_size: int | None = None,
+        lite: bool | None = None,
+    ) -> Iterator[CapitalRanking | LiteClanRanking]:
+        return self._iter_items(
+            "location_capital_rankings", page_size, lite, location_id=location_id
+        )
+
+    def iter_league_season(
+        self,
+        league_id: int | str,
+        season_id: str,
+        *,
+        page_size: int | None = None,
+        lite: bool | None = None,
+    ) -> Iterator[LeagueSeasonRank | LiteLeagueSeasonRank]:
+        return self._iter_items(
+            "league_season", page_size, lite, league_id=league_id, season_id=season_id
+        )
+
+    def _iter_items(
+        self, stream: str, page_size: int | None, lite: bool | None, **path_params: Any
+    ) -> Iterator[Any]:
+        walk = PageWalk(
+            stream,
+            page_size=page_size,
+            lite=self._lite_models if lite is None else lite,
+            store=self._store,
+            **path_params,
+        )
+        while not walk.done:
+            yield from walk.feed(self._request("GET", walk.path, params=walk.params()))
+
+    def _sync_pages(
+        self,
+        fetch: Callable[..., Page[Any]],
+        clan_tag: str,
+        since: str | None,
+        page_size: int,
+        *,
+        settled: Callable[[Any], bool] | None = None,
+    ) -> SyncResult[Any]:
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+        items: list[Any] = []
+        after: str | None = None
+        pages = 0
+        while True:
+            page = fetch(clan_tag, limit=page_size, after=after)
+            pages += 1
+            fresh, reached = split_at_watermark(page.items, since)
+            items.extend(item for item in fresh if settled is None or settled(item))
+            after = page.after
+            if reached or not after or not page.items:
+                break
+        return SyncResult(items=items, watermark=advance_watermark(items, since), pages=pages)
+
     def _request(
         self,
         method: str,
@@ -281,17 +610,131 @@ class CoCClient:
         params: Mapping[str, Any] | None = None,
     ) -> dict[str, Any]:
         method_upper = method.upper()
+        if self._validate_tags:
+            self._check_tags(method_upper, path)
         key = cache_key(method_upper, path, params)
         if method_upper == "GET":
+            missing = self._not_found.get(key)
+            if missing is not None:
+                raise dataclasses.replace(missing)
             cached = self._cache.get(key)
             if cached is not None:
                 return cached
+            if self._inflight is not None:
+                fetch = functools.partial(self._fetch, method_upper, path, params, key)
+                return self._fetch_shared(key, fetch, method_upper, path)
+        return self._fetch(method_upper, path, params, key)
+
+    def refresh(self, path: str, params: Mapping[str, Any] | None = None) -> dict[str, Any]:
+        path = raw_path(path)
+        if self._validate_tags:
+            self._check_tags("GET", path)
+        key = cache_key("GET", path, params)
+        fetch = functools.partial(self._fetch, "GET", path, params, key)
+        if self._inflight is not None:
+            return self._fetch_shared(key, fetch, "GET", path)
+        return fetch()
+
+    def get_raw(self, path: str, params: QueryParams | None = None) -> RawResponse:
+        path = raw_path(path)
+        params = query_params(params)
+        if self._validate_tags:
+            self._check_tags("GET", path)
+        key = cache_key("GET", path, params)
+        missing = self._not_found.get(key)
+        if missing is not None:
+            raise dataclasses.replace(missing)
+        cached = self._raw_cache.get(key)
+        if cached is not None:
+            return cached
+        fetch = functools.partial(self._fetch_raw, path, params, key)
+        if self._inflight is not None:
+            return self._fetch_shared(f"raw {key}", fetch, "GET", path)
+        return fetch()
+
+    def _fetch_shared(
+        self,
+        key: str,
+        fetch: Callable[[], R],
+        method_upper: str,
+        path: str,
+    ) -> R:
+        assert self._inflight is not None
+        with self._inflight_lock:
+            call = self._inflight.get(key)
+            leader = call is None
+            if call is None:
+                call = self._inflight[key] = _Call()
+
+        if not leader:
+            left = remaining(resolve_deadline(self._total_timeout))
+            if not call.done.wait(left):
+                raise DeadlineExceeded(
+                    "Deadline exceeded", method=method_upper, url=f"{self._base_url}{path}"
+                )
+            if call.error is not None:
+                if isinstance(call.error, APIError):
+                    raise dataclasses.replace(call.error)
+                raise call.error
+            result: R = call.result
+            return result
 
+        try:
+            call.result = fetch()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+            call.done.set()
+
+    def _fetch(
+        self,
+        method_upper: str,
+        path: str,
+        params: Mapping[str, Any] | None,
+        key: str,
+    ) -> dict[str, Any]:
+        response = self._fetch_response(method_upper, path, params, key)
+        url = f"{self._base_url}{path}"
+        payload = ensure_object(self._parse_json(response, url, method_upper))
+        if method_upper == "GET":
+            ttl = self._cache_policies.ttl_for(path, params, payload)
+            size = len(response.content)
+            if self._cache_projection is not None:
+                payload = self._cache_projection.project(path, payload)
+                size = payload_size(payload)
+            self._cache.set(key, payload, ttl=ttl, size=size)
+        return payload
+
+    def _fetch_raw(
+        self,
+        path: str,
+        params: Mapping[str, Any] | None,
+        key: str,
+    ) -> RawResponse:
+        response = self._fetch_response("GET", path, params, key)
+        raw = RawResponse.from_response(response)
+        ttl = self._cache_policies.ttl_for_raw(path, params, raw.content)
+        self._raw_cache.set(key, raw, ttl=ttl, size=len(raw.content))
+        return raw
+
+    def _fetch_response(
+        self,
+        method_upper: str,
+        path: str,
+        params: Mapping[str, Any] | None,
+        key: str,
+    ) -> httpx.Response:
         url_for_logs = f"{self._base_url}{path}"
         headers_for_logs = redact_token(self._client.headers)
 
+        deadline = resolve_deadline(self._total_timeout)
         last_response: httpx.Response | None = None
         for attempt in range(self._max_retries + 1):
+            attempt_timeout = self._attempt_timeout(deadline, method_upper, url_for_logs)
             if self._logger.isEnabledFor(logging.DEBUG):
                 self._logger.debug(
                     "request attempt=%s %s %s params=%s headers=%s",
@@ -302,9 +745,15 @@ class CoCClient:
                     headers_for_logs,
                 )
             try:
-                response = self._client.request(method_upper, path, params=params)
+                response = self._client.request(
+                    method_upper,
+                    path,
+                    params=params,
+                    timeout=attempt_timeout,
+                )
                 last_response = response
             except (httpx.TimeoutException, httpx.NetworkError) as exc:
+                self._check_budget(0.0, deadline, method_upper, url_for_logs)
                 if attempt >= self._max_retries:
                     raise APIError(
                         "Request failed",
@@ -312,14 +761,11 @@ class CoCClient:
                         url=url_for_logs,
                         payload=str(exc),
                     ) from exc
-                self._sleep(self._backoff(attempt))
+                self._sleep_within(self._backoff(attempt), deadline, method_upper, url_for_logs)
                 continue
 
             if response.status_code == 200:
-                payload = ensure_object(self._parse_json(response, url_for_logs, method_upper))
-                if method_upper == "GET":
-                    self._cache.set(key, payload)
-                return payload
+                return response
 
             if response.status_code in (401, 403):
                 raise Unauthorized(
@@ -330,13 +776,16 @@ class CoCClient:
                     payload=self._safe_payload(response),
                 )
             if response.status_code == 404:
-                raise NotFound(
+                not_found = NotFound(
                     "Not found",
                     status_code=response.status_code,
                     method=method_upper,
                     url=url_for_logs,
                     payload=self._safe_payload(response),
                 )
+                if method_upper == "GET":
+                    self._not_found.set(key, not_found, size=len(response.content))
+                raise not_found
 
             if response.status_code == 429:
                 retry_after = self._retry_after_seconds(response.headers)
@@ -349,7 +798,13 @@ class CoCClient:
                         payload=self._safe_payload(response),
                         retry_after=retry_after,
                     )
-                self._sleep(max(retry_after or 0.0, self._backoff(attempt)))
+                self._sleep_within(
+                    max(retry_after or 0.0, self._backoff(attempt)),
+                    deadline,
+                    method_upper,
+                    url_for_logs,
+                    response,
+                )
                 continue
 
             if 500 <= response.status_code <= 599:
@@ -361,7 +816,13 @@ class CoCClient:
                         url=url_for_logs,
                         payload=self._safe_payload(response),
                     )
-                self._sleep(self._backoff(attempt))
+                self._sleep_within(
+                    self._backoff(attempt),
+                    deadline,
+                    method_upper,
+                    url_for_logs,
+                    response,
+                )
                 continue
 
             raise APIError(
@@ -379,6 +840,54 @@ class CoCClient:
             url=url_for_logs,
         )
 
+    def _attempt_timeout(self, deadline: float | None, method: str, url: str) -> Any:
+        left = remaining(deadline)
+        if left is None:
+            return httpx.USE_CLIENT_DEFAULT
+        if left < MIN_ATTEMPT_SECONDS:
+            raise DeadlineExceeded("Deadline exceeded", method=method, url=url)
+        # Explicit even when left >= timeout: a user-supplied client may default longer.
+        return httpx.Timeout(min(left, self._timeout))
+
+    def _check_budget(
+        self,
+        delay: float,
+        deadline: float | None,
+        method: str,
+        url: str,
+        response: httpx.Response | None = None,
+    ) -> None:
+        left = remaining(deadline)
+        if left is not None and left - delay < MIN_ATTEMPT_SECONDS:
+            raise DeadlineExceeded(
+                "Deadline exceeded",
+                status_code=response.status_code if response is not None else None,
+                method=method,
+                url=url,
+                payload=self._safe_payload(response) if response is not None else None,
+            )
+
+    def _sleep_within(
+        self,
+        delay: float,
+        deadline: float | None,
+        method: str,
+        url: str,
+        response: httpx.Response | None = None,
+    ) -> None:
+        self._check_budget(delay, deadline, method, url, response)
+        self._sleep(delay)
+
+    def _check_tags(self, method: str, path: str) -> None:
+        for tag in path_tags(path):
+            if not is_valid_tag(tag):
+                raise NotFound(
+                    "Invalid tag",
+                    method=method,
+                    url=f"{self._base_url}{path}",
+                    payload={"reason": "invalidTag", "tag": tag},
+                )
+
     def _backoff(self, attempt: int) -> float:
         delay = self._backoff_base * (2**attempt)
         return min(delay, self._backoff_max)
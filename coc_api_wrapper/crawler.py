@@ -0,0 +1,343 @@
+from __future__ import annotations
+
+import abc
+import asyncio
+import csv
+import json
+import os
+from collections.abc import Awaitable, Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+from .exceptions import NotFound
+from .models import Location, Page
+from .scheduler import Priority, request_priority
+
+if TYPE_CHECKING:
+    from .async_client import AsyncCoCClient
+
+RankingKind = Literal["clans", "players", "capital"]
+OutputFormat = Literal["ndjson", "csv", "parquet"]
+
+RANKING_KINDS: tuple[RankingKind, ...] = ("clans", "players", "capital")
+
+_CHECKPOINT_VERSION = 2
+
+COLUMNS: dict[str, tuple[str, ...]] = {
+    "clans": (
+        "location_id",
+        "location_name",
+        "rank",
+        "previous_rank",
+        "tag",
+        "name",
+        "clan_level",
+        "members",
+        "clan_points",
+    ),
+    "players": (
+        "location_id",
+        "location_name",
+        "rank",
+        "previous_rank",
+        "tag",
+        "name",
+        "exp_level",
+        "trophies",
+        "clan_tag",
+        "clan_name",
+    ),
+    "capital": (
+        "location_id",
+        "location_name",
+        "rank",
+        "previous_rank",
+        "tag",
+        "name",
+        "clan_level",
+        "capital_points",
+    ),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class CrawlResult:
+    units: int
+    fetched: int
+    resumed: int
+    missing: int
+    rows: int
+
+
+def ranking_rows(kind: str, location: Location, page: Page[Any]) -> list[dict[str, Any]]:
+    rows = []
+    for item in page.items:
+        row = item.model_dump(exclude={"badge_urls", "clan"})
+        if kind == "players":
+            row["clan_tag"] = item.clan.tag if item.clan else None
+            row["clan_name"] = item.clan.name if item.clan else None
+        row["location_id"] = location.id
+        row["location_name"] = location.name
+        rows.append({column: row.get(column) for column in COLUMNS[kind]})
+    return rows
+
+
+class _AppendFile(abc.ABC):
+    def __init__(self, path: Path, columns: Sequence[str], size: int | None) -> None:
+        self._columns = columns
+        if size is None:
+            path.unlink(missing_ok=True)
+        elif path.exists():
+            with open(path, "r+b") as handle:
+                handle.truncate(size)
+        self._handle = open(path, "a", encoding="utf-8", newline="")  # noqa: SIM115
+        if self._handle.tell() == 0:
+            self._start()
+
+    @abc.abstractmethod
+    def _start(self) -> None: ...
+
+    @abc.abstractmethod
+    def write(self, unit: str, rows: list[dict[str, Any]]) -> None: ...
+
+    async def sync(self) -> int:
+        self._handle.flush()
+        # fsync off the event loop so a slow disk doesn't stall in-flight fetches.
+        await asyncio.to_thread(os.fsync, self._handle.fileno())
+        return self._handle.tell()
+
+    def close(self) -> None:
+        self._handle.close()
+
+
+class _NDJSONFile(_AppendFile):
+    def _start(self) -> None:
+        pass
+
+    def write(self, unit: str, rows: list[dict[str, Any]]) -> None:
+        for row in rows:
+            self._handle.write(json.dumps(row, ensure_ascii=False, separators=(",", ":")))
+            self._handle.write("\n")
+
+
+class _CSVFile(_AppendFile):
+    def _start(self) -> None:
+        csv.writer(self._handle).writerow(self._columns)
+
+    def write(self, unit: str, rows: list[dict[str, Any]]) -> None:
+        csv.DictWriter(self._handle, fieldnames=self._columns).writerows(rows)
+
+
+class _ParquetParts:
+    def __init__(self, path: Path, columns: Sequence[str], size: int | None) -> None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError(
+                "Parquet output requires pyarrow: pip install 'coc-api-wrapper[parquet]'"
+            ) from None
+        self._pa = pa
+        self._pq = pq
+        self._path = path
+        self._columns = columns
+        path.mkdir(parents=True, exist_ok=True)
+        if size is None:
+            for part in path.glob("part-*.parquet"):
+                part.unlink()
+
+    def write(self, unit: str, rows: list[dict[str, Any]]) -> None:
+        table = self._pa.Table.from_pydict(
+            {column: [row[column] for row in rows] for column in self._columns}
+        )
+        target = self._path / f"part-{unit}.parquet"
+        partial = self._path / f"part-{unit}.parquet.tmp"
+        self._pq.write_table(table, partial)
+        os.replace(partial, target)
+
+    async def sync(self) -> int:
+        return 0
+
+    def close(self) -> None:
+        pass
+
+
+_Output = _AppendFile | _ParquetParts
+
+
+def _open_output(output_format: str, directory: Path, kind: str, size: int | None) -> _Output:
+    if output_format == "parquet":
+        return _ParquetParts(directory / kind, COLUMNS[kind], size)
+    if output_format == "csv":
+        return _CSVFile(directory / f"{kind}.csv", COLUMNS[kind], size)
+    return _NDJSONFile(directory / f"{kind}.ndjson", COLUMNS[kind], size)
+
+
+class LeaderboardCrawler:
+    """Crawls clan, player and capital rankings for every location.
+
+    Each ``(kind, location)`` pair is one unit of work. A finished unit's rows
+    are appended to the output before the checkpoint is atomically rewritten
+    with the unit id and the output sizes, so a restarted crawl truncates any
+    half-written tail and fetches only the units that are still missing.
+    """
+
+    def __init__(
+        self,
+        client: AsyncCoCClient,
+        directory: str | Path,
+        *,
+        output_format: OutputFormat = "ndjson",
+        kinds: Iterable[RankingKind] = RANKING_KINDS,
+        limit: int | None = None,
+        concurrency: int = 8,
+        countries_only: bool = False,
+        priority: Priority = "background",
+        resume: bool = True,
+    ) -> None:
+        if concurrency <= 0:
+            raise ValueError("concurrency must be positive")
+        if output_format not in ("ndjson", "csv", "parquet"):
+            raise ValueError(f"Unknown output format: {output_format!r}")
+        self._kinds = tuple(dict.fromkeys(kinds))
+        unknown = set(self._kinds) - set(RANKING_KINDS)
+        if unknown:
+            raise ValueError(f"Unknown ranking kinds: {sorted(unknown)}")
+        self._client = client
+        self._directory = Path(directory)
+        self._format = output_format
+        self._limit = limit
+        self._concurrency = concurrency
+        self._countries_only = countries_only
+        self._priority = priority
+        self._resume = resume
+
+    @property
+    def checkpoint_path(self) -> Path:
+        return self._directory / "checkpoint.json"
+
+    async def run(self) -> CrawlResult:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        checkpoint = self._load_checkpoint()
+        done, sizes = checkpoint or (set(), {})
+        outputs = {
+            kind: _open_output(
+                self._format,
+                self._directory,
+                kind,
+                sizes.get(kind, 0) if checkpoint else None,
+            )
+            for kind in self._kinds
+        }
+        fetched = missing = rows_written = 0
+        # Write, fsync and checkpoint one unit at a time per output, so a saved
+        # size never covers rows of a unit that is not yet marked done.
+        locks = {kind: asyncio.Lock() for kind in self._kinds}
+
+        async def crawl(kind: str, location: Location) -> None:
+            nonlocal fetched, missing, rows_written
+            rows = await self._fetch(kind, location)
+            async with locks[kind]:
+                if rows is None:
+                    missing += 1
+                elif rows:
+                    outputs[kind].write(str(location.id), rows)
+                    sizes[kind] = await outputs[kind].sync()
+                    rows_written += len(rows)
+                fetched += 1
+                done.add(f"{kind}:{location.id}")
+                self._save_checkpoint(done, sizes)
+
+        try:
+            with request_priority(self._priority):
+                locations = await self._locations()
+                units = [(kind, location) for kind in self._kinds for location in locations]
+                todo = iter([unit for unit in units if f"{unit[0]}:{unit[1].id}" not in done])
+
+                async def worker() -> None:
+                    for kind, location in todo:
+                        await crawl(kind, location)
+
+                await _run_workers(worker, self._concurrency)
+        finally:
+            for output in outputs.values():
+                output.close()
+
+        return CrawlResult(
+            units=len(units),
+            fetched=fetched,
+            resumed=len(units) - fetched,
+            missing=missing,
+            rows=rows_written,
+        )
+
+    async def _locations(self) -> list[Location]:
+        locations: list[Location] = []
+        after: str | None = None
+        while True:
+            page = await self._client.get_locations(after=after)
+            locations.extend(
+                location
+                for location in page.items
+                if location.id is not None and (location.is_country or not self._countries_only)
+            )
+            after = page.after
+            if not after or not page.items:
+                return locations
+
+    async def _fetch(self, kind: str, location: Location) -> list[dict[str, Any]] | None:
+        fetchers: dict[str, Callable[..., Awaitable[Page[Any]]]] = {
+            "clans": self._client.get_location_clan_rankings,
+            "players": self._client.get_location_player_rankings,
+            "capital": self._client.get_location_capital_rankings,
+        }
+        assert location.id is not None
+        try:
+            page = await fetchers[kind](location.id, limit=self._limit)
+        except NotFound:
+            return None
+        return ranking_rows(kind, location, page)
+
+    def _load_checkpoint(self) -> tuple[set[str], dict[str, int]] | None:
+        path = self.checkpoint_path
+        if not self._resume or not path.exists():
+            path.unlink(missing_ok=True)
+            return None
+        state = json.loads(path.read_text(encoding="utf-8"))
+        settings = {name: state.get(name) for name in self._settings()}
+        if state.get("version") != _CHECKPOINT_VERSION or settings != self._settings():
+            raise ValueError(
+                f"Checkpoint {path} belongs to a different crawl; pass resume=False to restart"
+            )
+        return set(state["done"]), {kind: int(size) for kind, size in state["sizes"].items()}
+
+    def _settings(self) -> dict[str, Any]:
+        # Resuming under other settings would mix two crawls in one output.
+        return {
+            "format": self._format,
+            "kinds": sorted(self._kinds),
+            "limit": self._limit,
+            "countries_only": self._countries_only,
+        }
+
+    def _save_checkpoint(self, done: set[str], sizes: Mapping[str, int]) -> None:
+        state = {
+            "version": _CHECKPOINT_VERSION,
+            **self._settings(),
+            "done": sorted(done),
+            "sizes": dict(sizes),
+        }
+        partial = self.checkpoint_path.with_suffix(".json.tmp")
+        partial.write_text(json.dumps(state), encoding="utf-8")
+        os.replace(partial, self.checkpoint_path)
+
+
+async def _run_workers(worker: Callable[[], Awaitable[None]], count: int) -> None:
+    tasks = [asyncio.ensure_future(worker()) for _ in range(count)]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import Context, ContextVar, copy_context
+
+_current_deadline: ContextVar[float | None] = ContextVar("coc_request_deadline", default=None)
+
+# An attempt that would start with less than this left is not worth sending.
+MIN_ATTEMPT_SECONDS = 0.05
+
+
+def current_deadline() -> float | None:
+    return _current_deadline.get()
+
+
+@contextmanager
+def time_budget(seconds: float) -> Iterator[float]:
+    if seconds <= 0:
+        raise ValueError("seconds must be positive")
+    deadline = time.monotonic() + float(seconds)
+    outer = _current_deadline.get()
+    if outer is not None:
+        deadline = min(deadline, outer)
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def detached_context() -> Context:
+    context = copy_context()
+    context.run(_current_deadline.set, None)
+    return context
+
+
+def resolve_deadline(total_timeout: float | None) -> float | None:
+    deadline = _current_deadline.get()
+    if total_timeout is not None:
+        own = time.monotonic() + total_timeout
+        deadline = own if deadline is None else min(deadline, own)
+    return deadline
+
+
+def remaining(deadline: float | None) -> float | None:
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(slots=True, eq=False)
 class APIError(Exception):
     message: str
     status_code: int | None = None
@@ -29,10 +29,14 @@ class NotFound(APIError):
     pass
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(slots=True, eq=False)
 class RateLimited(APIError):
     retry_after: float | None = None
 
 
 class ServerError(APIError):
     pass
+
+
+class DeadlineExceeded(APIError):
+    pass
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import json
+import sys
+import time
+from array import array
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .models import Player
+from .utils import encode_tag
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+TRACKED_FIELDS: tuple[str, ...] = ("trophies", "exp_level", "town_hall_level")
+
+_FORMAT_VERSION = 1
+# column name -> (array typecode, numpy dtype); both native-endian, recorded in meta.json
+_COLUMNS: dict[str, tuple[str, str]] = {
+    "tag": ("q", "=i8"),
+    "ts": ("q", "=i8"),
+    "field": ("B", "=u1"),
+    "value": ("i", "=i4"),
+}
+
+
+class PlayerHistory:
+    """Append-only, columnar store of player field changes.
+
+    Only fields whose value differs from the last recorded one are written,
+    one row per change: ``(tag, ts, field, value)``. Tags are stored as
+    :func:`~coc_api_wrapper.utils.encode_tag` integers and each column lives
+    in its own file, which is memory-mapped for queries.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        fields: Iterable[str] = TRACKED_FIELDS,
+        buffer_rows: int = 65536,
+    ) -> None:
+        if np is None:
+            raise ImportError(
+                "PlayerHistory requires numpy: pip install 'coc-api-wrapper[history]'"
+            )
+        self._path = Path(path)
+        self._path.mkdir(parents=True, exist_ok=True)
+        self._fields = tuple(fields)
+        if not self._fields or len(self._fields) > 255:
+            raise ValueError("fields must contain between 1 and 255 names")
+        self._field_ids = {name: index for index, name in enumerate(self._fields)}
+        self._buffer_rows = max(1, int(buffer_rows))
+        self._check_meta()
+        self._truncate_partial_rows()
+
+        self._buffers = {name: array(code) for name, (code, _) in _COLUMNS.items()}
+        self._handles = {name: open(self._file(name), "ab") for name in _COLUMNS}  # noqa: SIM115
+        self._mapped: dict[str, Any] | None = None
+        self._last: dict[tuple[int, int], int] = {}
+        self._last_ts = 0
+        self._restore_state()
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        return self._fields
+
+    def __len__(self) -> int:
+        return self._stored_rows() + len(self._buffers["tag"])
+
+    def __enter__(self) -> PlayerHistory:
+        return self
+
+    def __exit__(self, exc_type: object, exc: object, tb: object) -> None:
+        self.close()
+
+    def record(self, player: Player, *, timestamp: float | None = None) -> int:
+        ts = int(time.time() if timestamp is None else timestamp)
+        if ts < self._last_ts:
+            raise ValueError("timestamps must not go backwards")
+        self._last_ts = ts
+        tag = encode_tag(player.tag)
+        written = 0
+        for name, field_id in self._field_ids.items():
+            value = getattr(player, name, None)
+            if value is None or self._last.get((tag, field_id)) == value:
+                continue
+            self._last[(tag, field_id)] = value
+            self._buffers["tag"].append(tag)
+            self._buffers["ts"].append(ts)
+            self._buffers["field"].append(field_id)
+            self._buffers["value"].append(int(value))
+            written += 1
+        if len(self._buffers["tag"]) >= self._buffer_rows:
+            self.flush()
+        return written
+
+    def record_many(self, players: Iterable[Player], *, timestamp: float | None = None) -> int:
+        ts = time.time() if timestamp is None else timestamp
+        return sum(self.record(player, timestamp=ts) for player in players)
+
+    def flush(self) -> None:
+        if not self._buffers["tag"]:
+            return
+        for name, buffer in self._buffers.items():
+            buffer.tofile(self._handles[name])
+            self._handles[name].flush()
+            del buffer[:]
+        self._mapped = None
+
+    def close(self) -> None:
+        self.flush()
+        for handle in self._handles.values():
+            handle.close()
+        self._mapped = None
+
+    def latest(
+        self,
+        field: str,
+        tags: Iterable[str] | None = None,
+    ) -> tuple[NDArray[Any], NDArray[Any]]:
+        grouped = self._grouped(field, tags)
+        if grouped is None:
+            return self._empty()
+        unique, _, values, _, ends = grouped
+        return unique, values[ends].astype(np.int64)
+
+    def changes_since(
+        self,
+        field: str,
+        since: float,
+        tags: Iterable[str] | None = None,
+    ) -> tuple[NDArray[Any], NDArray[Any]]:
+        grouped = self._grouped(field, tags)
+        if grouped is None:
+            return self._empty()
+        unique, ts, values, starts, ends = grouped
+        # Within a tag rows are in time order, so rows at or before `since` form a prefix.
+        before = np.add.reduceat((ts <= int(since)).astype(np.int64), starts)
+        baseline = np.where(before > 0, starts + before - 1, starts)
+        deltas = values[ends].astype(np.int64) - values[baseline].astype(np.int64)
+        return unique, deltas
+
+    def series(self, tag: str, field: str) -> tuple[NDArray[Any], NDArray[Any]]:
+        columns = self._columns()
+        mask = (columns["tag"] == encode_tag(tag)) & (columns["field"] == self._field_id(field))
+        return columns["ts"][mask].astype(np.int64), columns["value"][mask].astype(np.int64)
+
+    def _grouped(
+        self,
+        field: str,
+        tags: Iterable[str] | None,
+    ) -> tuple[NDArray[Any], ...] | None:
+        columns = self._columns()
+        mask = columns["field"] == self._field_id(field)
+        if tags is not None:
+            wanted = np.fromiter((encode_tag(tag) for tag in tags), dtype=np.int64)
+            mask &= np.isin(columns["tag"], wanted)
+        tag_col = columns["tag"][mask]
+        if tag_col.size == 0:
+            return None
+        order = np.argsort(tag_col, kind="stable")
+        tag_col = tag_col[order]
+        ts = columns["ts"][mask][order]
+        values = columns["value"][mask][order]
+        starts = np.flatnonzero(np.r_[True, tag_col[1:] != tag_col[:-1]])
+        ends = np.r_[starts[1:], tag_col.size] - 1
+        return tag_col[starts], ts, values, starts, ends
+
+    def _columns(self) -> dict[str, Any]:
+        self.flush()
+        if self._mapped is None:
+            rows = self._stored_rows()
+            self._mapped = {
+                name: (
+                    np.memmap(self._file(name), dtype=dtype, mode="r", shape=(rows,))
+                    if rows
+                    else np.empty(0, dtype=dtype)
+                )
+                for name, (_, dtype) in _COLUMNS.items()
+            }
+        return self._mapped
+
+    def _stored_rows(self) -> int:
+        return min(
+            self._file(name).stat().st_size // np.dtype(dtype).itemsize
+            for name, (_, dtype) in _COLUMNS.items()
+        )
+
+    def _restore_state(self) -> None:
+        columns = self._columns()
+        if columns["ts"].size:
+            self._last_ts = int(columns["ts"].max())
+        for name, field_id in self._field_ids.items():
+            tags, values = self.latest(name)
+            for tag, value in zip(tags.tolist(), values.tolist(), strict=True):
+                self._last[(tag, field_id)] = value
+
+    def _truncate_partial_rows(self) -> None:
+        for name in _COLUMNS:
+            self._file(name).touch()
+        rows = self._stored_rows()
+        for name, (_, dtype) in _COLUMNS.items():
+            size = rows * np.dtype(dtype).itemsize
+            if self._file(name).stat().st_size != size:
+                with open(self._file(name), "r+b") as handle:
+                    handle.truncate(size)
+
+    def _field_id(self, field: str) -> int:
+        try:
+            return self._field_ids[field]
+        except KeyError:
+            raise ValueError(f"Field is not tracked: {field!r}") from None
+
+    def _file(self, column: str) -> Path:
+        return self._path / f"{column}.bin"
+
+    def _check_meta(self) -> None:
+        meta_path = self._path / "meta.json"
+        meta = {"version": _FORMAT_VERSION, "byteorder": sys.byteorder, "fields": self._fields}
+        if meta_path.exists():
+            stored = json.loads(meta_path.read_text(encoding="utf-8"))
+            stored["fields"] = tuple(stored.get("fields", ()))
+            if stored != meta:
+                raise ValueError(f"History at {self._path} was written with {stored}")
+        else:
+            meta_path.write_text(json.dumps({**meta, "fields": list(self._fields)}), "utf-8")
+
+    @staticmethod
+    def _empty() -> tuple[NDArray[Any], NDArray[Any]]:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
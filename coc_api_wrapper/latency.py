@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import math
+from collections import deque
+from dataclasses import dataclass
+
+
+class LatencyTracker:
+    def __init__(self, *, window: int = 256) -> None:
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(float(seconds))
+
+    def clear(self) -> None:
+        self._samples.clear()
+
+    def percentile(self, q: float) -> float | None:
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("q must be between 0 and 1")
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = max(0, math.ceil(q * len(ordered)) - 1)
+        return ordered[index]
+
+
+@dataclass(frozen=True, slots=True)
+class HedgePolicy:
+    percentile: float = 0.95
+    max_fraction: float = 0.05
+    min_samples: int = 20
+    min_delay: float = 0.05
+    max_burst: float = 10.0
+
+    def __post_init__(self) -> None:
+        if not 0.0 < self.percentile < 1.0:
+            raise ValueError("percentile must be between 0 and 1")
+        if not 0.0 <= self.max_fraction <= 1.0:
+            raise ValueError("max_fraction must be between 0 and 1")
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any, Protocol, TypeVar
+
+L = TypeVar("L", bound="LiteModel")
+
+
+class LiteModel(Protocol):
+    @classmethod
+    def from_payload(cls: type[L], data: Mapping[str, Any]) -> L: ...
+
+
+def _nested(data: Mapping[str, Any], key: str, field: str) -> Any:
+    value = data.get(key)
+    return value.get(field) if value else None
+
+
+@dataclass(frozen=True, slots=True)
+class LiteClanMember:
+    tag: str
+    name: str
+    role: str | None = None
+    town_hall_level: int | None = None
+    exp_level: int | None = None
+    trophies: int | None = None
+    league_id: int | None = None
+
+    @classmethod
+    def from_payload(cls, data: Mapping[str, Any]) -> LiteClanMember:
+        return cls(
+            data["tag"],
+            data["name"],
+            data.get("role"),
+            data.get("townHallLevel"),
+            data.get("expLevel"),
+            data.get("trophies"),
+            _nested(data, "league", "id"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class LitePlayerRanking:
+    tag: str | None = None
+    name: str | None = None
+    rank: int | None = None
+    previous_rank: int | None = None
+    exp_level: int | None = None
+    trophies: int | None = None
+    clan_tag: str | None = None
+    clan_name: str | None = None
+    league_id: int | None = None
+
+    @classmethod
+    def from_payload(cls, data: Mapping[str, Any]) -> LitePlayerRanking:
+        return cls(
+            data.get("tag"),
+            data.get("name"),
+            data.get("rank"),
+            data.get("previousRank"),
+            data.get("expLevel"),
+            data.get("trophies"),
+            _nested(data, "clan", "tag"),
+            _nested(data, "clan", "name"),
+            _nested(data, "league", "id"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class LiteClanRanking:
+    tag: str | None = None
+    name: str | None = None
+    rank: int | None = None
+    previous_rank: int | None = None
+    clan_level: int | None = None
+    members: int | None = None
+    clan_points: int | None = None
+    capital_points: int | None = None
+
+    @classmethod
+    def from_payload(cls, data: Mapping[str, Any]) -> LiteClanRanking:
+        return cls(
+            data.get("tag"),
+            data.get("name"),
+            data.get("rank"),
+            data.get("previousRank"),
+            data.get("clanLevel"),
+            data.get("members"),
+            data.get("clanPoints"),
+            data.get("capitalPoints"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class LiteLeagueSeasonRank:
+    tag: str | None = None
+    name: str | None = None
+    rank: int | None = None
+    trophies: int | None = None
+    clan_tag: str | None = None
+
+    @classmethod
+    def from_payload(cls, data: Mapping[str, Any]) -> LiteLeagueSeasonRank:
+        return cls(
+            data.get("tag"),
+            data.get("name"),
+            data.get("rank"),
+            data.get("trophies"),
+            _nested(data, "clan", "tag"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class LiteWarLogEntry:
+    result: str | None = None
+    end_time: str | None = None
+    team_size: int | None = None
+    attacks_per_member: int | None = None
+    clan_tag: str | None = None
+    clan_stars: int | None = None
+    clan_destruction: float | None = None
+    opponent_tag: str | None = None
+    opponent_name: str | None = None
+    opponent_stars: int | None = None
+    opponent_destruction: float | None = None
+
+    @classmethod
+    def from_payload(cls, data: Mapping[str, Any]) -> LiteWarLogEntry:
+        return cls(
+            data.get("result"),
+            data.get("endTime"),
+            data.get("teamSize"),
+            data.get("attacksPerMember"),
+            _nested(data, "clan", "tag"),
+            _nested(data, "clan", "stars"),
+            _nested(data, "clan", "destructionPercentage"),
+            _nested(data, "opponent", "tag"),
+            _nested(data, "opponent", "name"),
+            _nested(data, "opponent", "stars"),
+            _nested(data, "opponent", "destructionPercentage"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class LiteRaidSeason:
+    state: str | None = None
+    start_time: str | None = None
+    end_time: str | None = None
+    capital_total_loot: int | None = None
+    raids_completed: int | None = None
+    total_attacks: int | None = None
+    enemy_districts_destroyed: int | None = None
+    offensive_reward: int | None = None
+    defensive_reward: int | None = None
+
+    @classmethod
+    def from_payload(cls, data: Mapping[str, Any]) -> LiteRaidSeason:
+        return cls(
+            data.get("state"),
+            data.get("startTime"),
+            data.get("endTime"),
+            data.get("capitalTotalLoot"),
+            data.get("raidsCompleted"),
+            data.get("totalAttacks"),
+            data.get("enemyDistrictsDestroyed"),
+            data.get("offensiveReward"),
+            data.get("defensiveReward"),
+        )
+
+
+def parse_lite(model: type[L], items: Iterable[Mapping[str, Any]]) -> list[L]:
+    from_payload = model.from_payload
+    return [from_payload(item) for item in items]
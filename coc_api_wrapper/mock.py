@@ -0,0 +1,827 @@
+"""Deterministic synthetic CoC API for load tests: ``python -m coc_api_wrapper.mock``."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import binascii
+import contextlib
+import functools
+import json
+import logging
+import math
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+import httpx
+
+from ._http import HTTPReply, LocalHTTPServer, json_reply
+from .utils import decode_tag, encode_tag, is_valid_tag
+
+# Encoded-tag offsets keep players, clans and CWL wars in disjoint tag spaces.
+PLAYER_TAG_BASE = 10**9
+CLAN_TAG_BASE = 2 * 10**9
+WAR_TAG_BASE = 3 * 10**9
+CLAN_CAPACITY = 50
+CWL_GROUP_SIZE = 8
+CWL_ROUNDS = CWL_GROUP_SIZE - 1
+LEGEND_LEAGUE_ID = 29000022
+# All timestamps are relative to this instant so payloads never drift.
+EPOCH = datetime(2024, 1, 15, 8, tzinfo=UTC)
+
+_SYLLABLES = (
+    "ka", "zor", "mi", "lo", "ra", "th", "en", "vi", "dra", "gon", "ul", "ix",
+    "shi", "bo", "ne", "ar", "qu", "el", "to", "fy", "ma", "rek", "sa", "don",
+)  # fmt: skip
+_ROLES = ("member", "admin", "coLeader")
+_TROOPS = (
+    "Barbarian", "Archer", "Giant", "Goblin", "Wall Breaker", "Balloon", "Wizard", "Healer",
+    "Dragon", "P.E.K.K.A", "Baby Dragon", "Miner", "Electro Dragon", "Yeti", "Minion",
+    "Hog Rider", "Valkyrie", "Golem", "Witch", "Lava Hound", "Bowler", "Ice Golem",
+)  # fmt: skip
+_HEROES = ("Barbarian King", "Archer Queen", "Grand Warden", "Royal Champion")
+_ACHIEVEMENTS = (
+    "Bigger Coffers", "Get those Goblins!", "Bigger & Better", "Nice and Tidy",
+    "Discover New Troops", "Gold Grab", "Elixir Escapade", "Sweet Victory!",
+    "Empire Builder", "Wall Buster", "Humiliator", "Union Buster", "Conqueror",
+    "Unbreakable", "Friend in Need", "War Hero", "Clan War Wealth", "Games Champion",
+)  # fmt: skip
+_TIERS = ("Bronze", "Silver", "Gold", "Crystal", "Master", "Champion", "Titan")
+_TIERED = tuple(f"{tier} League {rank}" for tier in _TIERS for rank in ("III", "II", "I"))
+_HOME_LEAGUES = ("Unranked", *_TIERED, "Legend League")
+_WAR_LEAGUES = ("Unranked", *_TIERED[:-3])
+_SEASONS = tuple(
+    f"{2015 + (6 + i) // 12}-{(6 + i) % 12 + 1:02d}"
+    for i in range((EPOCH.year - 2015) * 12 + EPOCH.month - 7)
+)
+_REGIONS = ("Europe", "North America", "South America", "Asia", "Australia", "Africa")
+_COUNTRIES = (
+    ("US", "United States"), ("DE", "Germany"), ("GB", "United Kingdom"), ("FR", "France"),
+    ("RU", "Russia"), ("BR", "Brazil"), ("IN", "India"), ("JP", "Japan"), ("KR", "South Korea"),
+    ("CN", "China"), ("ID", "Indonesia"), ("TR", "Turkey"), ("IT", "Italy"), ("ES", "Spain"),
+    ("MX", "Mexico"), ("CA", "Canada"), ("AU", "Australia"), ("VN", "Vietnam"),
+    ("PL", "Poland"), ("UA", "Ukraine"), ("NL", "Netherlands"), ("SE", "Sweden"),
+    ("IR", "Iran"), ("SA", "Saudi Arabia"), ("TH", "Thailand"), ("PH", "Philippines"),
+)  # fmt: skip
+_LABELS = (
+    "Clan Wars", "Clan War League", "Trophy Pushing", "Friendly Wars", "Clan Games",
+    "Builder Base", "Base Designing", "International", "Farming", "Donations", "Competitive",
+    "Casual", "Relaxed", "Newbie Friendly", "Talkative", "Underdog",
+)  # fmt: skip
+_WAR_STATES = ("notInWar", "preparation", "inWar", "inWar", "warEnded")
+
+
+class _MockError(Exception):
+    def __init__(self, status: int, reason: str, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.reason = reason
+
+
+def _not_found(what: str) -> _MockError:
+    return _MockError(404, "notFound", f"{what} not found")
+
+
+def _api_time(moment: datetime) -> str:
+    return moment.strftime("%Y%m%dT%H%M%S.000Z")
+
+
+def _name(rng: random.Random, parts: int = 3) -> str:
+    return "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, parts))).title()
+
+
+def _urls(kind: str, key: object) -> dict[str, str]:
+    base = f"https://api-assets.clashofclans.com/{kind}"
+    sizes = {"small": 70, "medium": 200, "large": 512}
+    return {size: f"{base}/{px}/{key}.png" for size, px in sizes.items()}
+
+
+def _cursor(position: int) -> str:
+    raw = json.dumps({"pos": position}, separators=(",", ":")).encode()
+    return base64.b64encode(raw).decode().rstrip("=")
+
+
+def _cursor_position(cursor: str) -> int:
+    try:
+        decoded = base64.b64decode(cursor + "=" * (-len(cursor) % 4), validate=True)
+        position = json.loads(decoded)["pos"]
+    except (binascii.Error, ValueError, KeyError, TypeError) as exc:
+        raise _MockError(400, "badRequest", "Invalid cursor") from exc
+    if not isinstance(position, int) or position < 0:
+        raise _MockError(400, "badRequest", "Invalid cursor")
+    return position
+
+
+def _page(
+    total: int, item: Callable[[int], dict[str, Any]], params: Mapping[str, str]
+) -> dict[str, Any]:
+    try:
+        limit = int(params["limit"]) if "limit" in params else total
+    except ValueError as exc:
+        raise _MockError(400, "badRequest", "Invalid limit") from exc
+    if limit <= 0:
+        raise _MockError(400, "badRequest", "Invalid limit")
+    if "after" in params:
+        start = min(_cursor_position(params["after"]), total)
+        end = min(start + limit, total)
+    elif "before" in params:
+        end = min(_cursor_position(params["before"]), total)
+        start = max(end - limit, 0)
+    else:
+        start, end = 0, min(limit, total)
+    cursors: dict[str, str] = {}
+    if start > 0:
+        cursors["before"] = _cursor(start)
+    if end < total:
+        cursors["after"] = _cursor(end)
+    return {"items": [item(index) for index in range(start, end)], "paging": {"cursors": cursors}}
+
+
+def _round_pairs(round_index: int) -> list[tuple[int, int]]:
+    # Circle method: slot 0 stays put, the rest rotate one step per round.
+    rest = list(range(1, CWL_GROUP_SIZE))
+    shift = round_index % len(rest)
+    rest = rest[shift:] + rest[:shift]
+    slots = [0, *rest]
+    half = CWL_GROUP_SIZE // 2
+    return [(slots[i], slots[CWL_GROUP_SIZE - 1 - i]) for i in range(half)]
+
+
+@dataclass(frozen=True, slots=True)
+class LatencyProfile:
+    """Lognormal response delay in seconds; ``median=0`` disables it."""
+
+    median: float = 0.0
+    sigma: float = 0.5
+    max: float | None = None
+
+    def sample(self, rng: random.Random) -> float:
+        if self.median <= 0:
+            return 0.0
+        delay = rng.lognormvariate(math.log(self.median), self.sigma)
+        return delay if self.max is None else min(delay, self.max)
+
+
+class MockCoCAPI:
+    """Synthetic CoC API covering every endpoint the clients call.
+
+    Data is generated lazily and deterministically from ``seed``: player
+    ``i`` of clan ``j`` is always the same payload, so millions of players
+    cost nothing until requested. Pages use API-style base64 cursors.
+    ``latency``, ``error_rate`` (5xx), ``throttle_rate`` and ``rate_limit``
+    (429 with ``Retry-After``) shape the responses; ``token`` enables the
+    auth check. Use :meth:`sync_transport` / :meth:`async_transport` with
+    ``httpx`` in-process, or :meth:`server` for a local HTTP endpoint.
+    """
+
+    def __init__(
+        self,
+        *,
+        seed: int = 0,
+        players: int = 1_000_000,
+        clans: int | None = None,
+        ranking_size: int = 200,
+        season_ranking_size: int = 25_000,
+        warlog_size: int = 100,
+        raid_seasons: int = 50,
+        latency: LatencyProfile | None = None,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        rate_limit: float | None = None,
+        retry_after: float = 1.0,
+        token: str | None = None,
+        prefix: str = "/v1",
+        cache_size: int = 4096,
+        time_fn: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 0 < players < CLAN_TAG_BASE - PLAYER_TAG_BASE:
+            raise ValueError("players out of range")
+        if not 0 <= error_rate + throttle_rate <= 1:
+            raise ValueError("error_rate + throttle_rate must be within [0, 1]")
+        self.seed = seed
+        self.players = players
+        self.clans = clans if clans is not None else max(players // CLAN_CAPACITY, 1)
+        if not 0 < self.clans < WAR_TAG_BASE - CLAN_TAG_BASE:
+            raise ValueError("clans out of range")
+        self.ranking_size = ranking_size
+        self.season_ranking_size = season_ranking_size
+        self.warlog_size = warlog_size
+        self.raid_seasons = raid_seasons
+        self.latency = latency or LatencyProfile()
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self.token = token
+        self._prefix = prefix.rstrip("/")
+        self._time = time_fn
+        self._lock = threading.Lock()
+        self._rng = random.Random(f"{seed}:faults")
+        self._tokens = float(rate_limit or 0.0)
+        self._refilled = time_fn()
+        self._requests = 0
+        self._statuses: Counter[int] = Counter()
+        self._cpu_time = 0.0
+        self._locations = self._build_locations()
+        self._render = functools.lru_cache(maxsize=cache_size)(self._render_uncached)
+
+    # -- tags ---------------------------------------------------------------
+
+    def player_tag(self, index: int) -> str:
+        return decode_tag(PLAYER_TAG_BASE + index)
+
+    def clan_tag(self, index: int) -> str:
+        return decode_tag(CLAN_TAG_BASE + index)
+
+    def war_tag(self, index: int) -> str:
+        return decode_tag(WAR_TAG_BASE + index)
+
+    def location_ids(self) -> list[int]:
+        return [location["id"] for location in self._locations]
+
+    @staticmethod
+    def _index(tag: str, base: int, count: int, what: str) -> int:
+        if not is_valid_tag(tag):
+            raise _MockError(400, "badRequest", f"Invalid tag {tag!r}")
+        index = encode_tag(tag) - base
+        if not 0 <= index < count:
+            raise _not_found(what)
+        return index
+
+    # -- stats --------------------------------------------------------------
+
+    @property
+    def requests(self) -> int:
+        return self._requests
+
+    @property
+    def cpu_time(self) -> float:
+        """CPU seconds spent building replies, so benchmarks can leave the mock out."""
+        return self._cpu_time
+
+    def status_counts(self) -> dict[int, int]:
+        with self._lock:
+            return dict(self._statuses)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._requests = 0
+            self._statuses.clear()
+            self._cpu_time = 0.0
+
+    # -- request handling -----------------------------------------------------
+
+    def respond(
+        self, method: str, target: str, headers: Mapping[str, str] | None = None
+    ) -> HTTPReply:
+        started = time.thread_time()
+        reply = self._respond(method.upper(), target, headers or {})
+        spent = time.thread_time() - started
+        with self._lock:
+            self._requests += 1
+            self._statuses[reply.status] += 1
+            self._cpu_time += spent
+        return reply
+
+    def sample_latency(self) -> float:
+        with self._lock:
+            return self.latency.sample(self._rng)
+
+    def _respond(self, method: str, target: str, headers: Mapping[str, str]) -> HTTPReply:
+        if method not in ("GET", "HEAD"):
+            return json_reply(405, {"reason": "methodNotAllowed", "message": "GET only"})
+        if self.token is not None:
+            auth = {name.lower(): value for name, value in headers.items()}.get("authorization")
+            if auth != f"Bearer {self.token}":
+                return json_reply(
+                    403, {"reason": "accessDenied", "message": "Invalid authorization"}
+                )
+        fault = self._fault()
+        if fault is not None:
+            return fault
+        parts = urlsplit(target)
+        path = parts.path
+        if self._prefix and path.startswith(f"{self._prefix}/"):
+            path = path[len(self._prefix) :]
+        query = tuple(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+        try:
+            body = self._render(path, query)
+        except _MockError as exc:
+            return json_reply(exc.status, {"reason": exc.reason, "message": str(exc)})
+        return HTTPReply(200, body, {"Content-Type": "application/json; charset=utf-8"})
+
+    def _fault(self) -> HTTPReply | None:
+        with self._lock:
+            if self.rate_limit is not None:
+                now = self._time()
+                elapsed, self._refilled = now - self._refilled, now
+                self._tokens = min(self.rate_limit, self._tokens + elapsed * self.rate_limit)
+                if self._tokens < 1:
+                    wait = (1 - self._tokens) / self.rate_limit
+                    return self._throttled(max(math.ceil(wait), 1))
+                self._tokens -= 1
+            roll = self._rng.random()
+            maintenance = self._rng.random() < 0.3
+        if roll < self.throttle_rate:
+            return self._throttled(self.retry_after)
+        if roll < self.throttle_rate + self.error_rate:
+            status, reason = (503, "inMaintenance") if maintenance else (500, "unknownException")
+            return json_reply(status, {"reason": reason, "message": "Synthetic failure"})
+        return None
+
+    @staticmethod
+    def _throttled(retry_after: float) -> HTTPReply:
+        return json_reply(
+            429,
+            {"reason": "requestThrottled", "message": "Request was throttled"},
+            {"Retry-After": f"{retry_after:g}"},
+        )
+
+    def _render_uncached(self, path: str, query: tuple[tuple[str, str], ...]) -> bytes:
+        segments = [unquote(segment) for segment in path.strip("/").split("/")]
+        payload = self._route(segments, dict(query))
+        return json.dumps(payload, separators=(",", ":")).encode()
+
+    def _route(self, segments: list[str], params: dict[str, str]) -> dict[str, Any]:
+        match segments:
+            case ["players", tag]:
+                return self._player(self._index(tag, PLAYER_TAG_BASE, self.players, "player"))
+            case ["clans", tag, *rest]:
+                clan = self._index(tag, CLAN_TAG_BASE, self.clans, "clan")
+                return self._clan_route(clan, rest, params)
+            case ["clanwarleagues", "warleagues"]:
+                return _page(len(_WAR_LEAGUES), self._war_league, params)
+            case ["clanwarleagues", "wars", tag]:
+                groups = math.ceil(self.clans / CWL_GROUP_SIZE)
+                total = groups * CWL_ROUNDS * CWL_GROUP_SIZE // 2
+                return self._cwl_war(self._index(tag, WAR_TAG_BASE, total, "war"))
+            case ["locations"]:
+                return _page(len(self._locations), self._locations.__getitem__, params)
+            case ["locations", location_id, "rankings", kind]:
+                return self._rankings(self._location(location_id), kind, params)
+            case ["leagues"]:
+                return _page(len(_HOME_LEAGUES), self._home_league, params)
+            case ["leagues", league_id, "seasons"]:
+                self._legend_only(league_id)
+                return _page(len(_SEASONS), lambda index: {"id": _SEASONS[index]}, params)
+            case ["leagues", league_id, "seasons", season_id]:
+                self._legend_only(league_id)
+                if season_id not in _SEASONS:
+                    raise _not_found("season")
+                return _page(
+                    min(self.season_ranking_size, self.players),
+                    functools.partial(self._season_rank, season_id),
+                    params,
+                )
+            case ["labels", "clans"]:
+                return _page(len(_LABELS), self._label, params)
+            case ["goldpass", "seasons", "current"]:
+                start = EPOCH.replace(day=1, hour=0)
+                end = (start + timedelta(days=32)).replace(day=1)
+                return {"startTime": _api_time(start), "endTime": _api_time(end)}
+        raise _not_found("resource")
+
+    def _clan_route(self, clan: int, rest: list[str], params: dict[str, str]) -> dict[str, Any]:
+        match rest:
+            case []:
+                return self._clan(clan)
+            case ["members"]:
+                return _page(self._clan_size(clan), functools.partial(self._member, clan), params)
+            case ["currentwar"]:
+                return self._current_war(clan)
+            case ["currentwar", "leaguegroup"]:
+                return self._league_group(clan)
+            case ["warlog"]:
+                return _page(self.warlog_size, functools.partial(self._warlog_entry, clan), params)
+            case ["capitalraidseasons"]:
+                return _page(self.raid_seasons, functools.partial(self._raid, clan), params)
+        raise _not_found("resource")
+
+    # -- transports / server ----------------------------------------------------
+
+    def sync_transport(self) -> httpx.MockTransport:
+        def handler(request: httpx.Request) -> httpx.Response:
+            reply = self.respond(request.method, request.url.raw_path.decode(), request.headers)
+            delay = self.sample_latency()
+            if delay:
+                time.sleep(delay)
+            return httpx.Response(reply.status, headers=dict(reply.headers), content=reply.body)
+
+        return httpx.MockTransport(handler)
+
+    def async_transport(self) -> httpx.MockTransport:
+        async def handler(request: httpx.Request) -> httpx.Response:
+            reply = await self._handle(
+                request.method, request.url.raw_path.decode(), request.headers
+            )
+            return httpx.Response(reply.status, headers=dict(reply.headers), content=reply.body)
+
+        return httpx.MockTransport(handler)
+
+    def server(self, *, host: str = "127.0.0.1", port: int = 0) -> LocalHTTPServer:
+        return LocalHTTPServer(self._handle, host=host, port=port)
+
+    async def _handle(self, method: str, target: str, headers: Mapping[str, str]) -> HTTPReply:
+        reply = self.respond(method, target, headers)
+        delay = self.sample_latency()
+        if delay:
+            await asyncio.sleep(delay)
+        return reply
+
+    # -- synthetic entities -----------------------------------------------------
+
+    def _rng_for(self, kind: str, *key: object) -> random.Random:
+        return random.Random(":".join(map(str, (self.seed, kind, *key))))
+
+    def _clan_size(self, clan: int) -> int:
+        available = min(CLAN_CAPACITY, self.players - clan * CLAN_CAPACITY)
+        if available <= 0:
+            return 0
+        return min(self._rng_for("clan-size", clan).randint(10, CLAN_CAPACITY), available)
+
+    def _player_clan(self, player: int) -> int | None:
+        clan, slot = divmod(player, CLAN_CAPACITY)
+        if clan < self.clans and slot < self._clan_size(clan):
+            return clan
+        return None
+
+    def _player_name(self, player: int) -> str:
+        return _name(self._rng_for("player-name", player))
+
+    def _clan_name(self, clan: int) -> str:
+        return _name(self._rng_for("clan-name", clan), 4)
+
+    def _clan_ref(self, clan: int) -> dict[str, Any]:
+        return {
+            "tag": self.clan_tag(clan),
+            "name": self._clan_name(clan),
+            "clanLevel": self._rng_for("clan", clan).randint(1, 30),
+            "badgeUrls": _urls("badges", clan % 500),
+        }
+
+    def _league_for(self, trophies: int) -> dict[str, Any]:
+        index = 0 if trophies < 400 else min(1 + (trophies - 400) // 220, len(_HOME_LEAGUES) - 1)
+        return self._home_league(index)
+
+    def _home_league(self, index: int) -> dict[str, Any]:
+        league_id = 29000000 + index
+        return {"id": league_id, "name": _HOME_LEAGUES[index], "iconUrls": _urls("leagues", index)}
+
+    def _war_league(self, index: int) -> dict[str, Any]:
+        return {"id": 48000000 + index, "name": _WAR_LEAGUES[index]}
+
+    def _label(self, index: int) -> dict[str, Any]:
+        return {"id": 56000000 + index, "name": _LABELS[index], "iconUrls": _urls("labels", index)}
+
+    def _player_core(self, player: int) -> dict[str, Any]:
+        rng = self._rng_for("player", player)
+        town_hall = min(16, max(1, round(rng.gauss(12, 2.5))))
+        trophies = max(0, int(rng.gauss(town_hall * 330, 500)))
+        return {
+            "tag": self.player_tag(player),
+            "name": self._player_name(player),
+            "townHallLevel": town_hall,
+            "expLevel": max(1, town_hall * 18 + rng.randint(-20, 60)),
+            "trophies": trophies,
+            "league": self._league_for(trophies),
+        }
+
+    def _player(self, player: int) -> dict[str, Any]:
+        core = self._player_core(player)
+        rng = self._rng_for("player-detail", player)
+        town_hall = core["townHallLevel"]
+        payload = {
+            **core,
+            "bestTrophies": core["trophies"] + rng.randint(0, 900),
+            "warStars": rng.randint(0, 2500),
+            "attackWins": rng.randint(0, 400),
+            "defenseWins": rng.randint(0, 80),
+            "builderHallLevel": min(10, max(1, town_hall - 3)),
+            "donations": rng.randint(0, 5000),
+            "donationsReceived": rng.randint(0, 3000),
+            "warPreference": rng.choice(("in", "out")),
+            "troops": [
+                {"name": name, "level": rng.randint(1, town_hall), "village": "home"}
+                for name in _TROOPS[: 6 + town_hall]
+            ],
+            "heroes": [
+                {"name": name, "level": rng.randint(1, town_hall * 5), "village": "home"}
+                for name in _HEROES[: max(0, town_hall - 6)]
+            ],
+            "achievements": [
+                {"name": name, "stars": rng.randint(0, 3), "value": rng.randint(0, 10**6)}
+                for name in _ACHIEVEMENTS
+            ],
+        }
+        clan = self._player_clan(player)
+        if clan is not None:
+            payload["clan"] = self._clan_ref(clan)
+            payload["role"] = self._member_role(clan, player % CLAN_CAPACITY)
+        return payload
+
+    def _member_role(self, clan: int, slot: int) -> str:
+        if slot == 0:
+            return "leader"
+        return _ROLES[self._rng_for("role", clan, slot).choices((0, 1, 2), (70, 20, 10))[0]]
+
+    def _member(self, clan: int, slot: int) -> dict[str, Any]:
+        player = clan * CLAN_CAPACITY + slot
+        core = self._player_core(player)
+        rng = self._rng_for("member", player)
+        return {
+            **core,
+            "role": self._member_role(clan, slot),
+            "clanRank": slot + 1,
+            "previousClanRank": slot + 1,
+            "donations": rng.randint(0, 3000),
+            "donationsReceived": rng.randint(0, 2000),
+        }
+
+    def _clan(self, clan: int) -> dict[str, Any]:
+        rng = self._rng_for("clan-detail", clan)
+        size = self._clan_size(clan)
+        location = self._locations[clan % len(self._locations)]
+        return {
+            **self._clan_ref(clan),
+            "type": rng.choice(("open", "inviteOnly", "closed")),
+            "description": f"Synthetic clan #{clan}",
+            "location": location,
+            "members": size,
+            "clanPoints": rng.randint(10_000, 60_000),
+            "clanCapitalPoints": rng.randint(0, 5_000),
+            "warWins": rng.randint(0, 1_500),
+            "warWinStreak": rng.randint(0, 30),
+            "isWarLogPublic": True,
+            "warLeague": self._war_league(rng.randrange(len(_WAR_LEAGUES))),
+            "labels": [self._label(index) for index in rng.sample(range(len(_LABELS)), 3)],
+            "memberList": [self._member(clan, slot) for slot in range(size)],
+        }
+
+    def _war_side(
+        self, clan: int, rng: random.Random, team_size: int, *, cwl: bool = False
+    ) -> dict[str, Any]:
+        members = [
+            {
+                "tag": self.player_tag(clan * CLAN_CAPACITY + slot),
+                "name": self._player_name(clan * CLAN_CAPACITY + slot),
+                "townHallLevel": rng.randint(9, 16),
+                "mapPosition": slot + 1,
+            }
+            for slot in range(min(team_size, max(self._clan_size(clan), 1)))
+        ]
+        return {
+            **self._clan_ref(clan),
+            "attacks": rng.randint(0, team_size * (1 if cwl else 2)),
+            "stars": rng.randint(0, team_size * 3),
+            "destructionPercentage": round(rng.uniform(0, 100), 2),
+            "members": members,
+        }
+
+    def _current_war(self, clan: int) -> dict[str, Any]:
+        rng = self._rng_for("war", clan)
+        state = rng.choice(_WAR_STATES)
+        if state == "notInWar":
+            return {"state": state}
+        team_size = rng.choice((5, 10, 15, 20, 25, 30, 40, 50))
+        opponent = (clan + 1 + rng.randrange(max(self.clans - 1, 1))) % self.clans
+        start = EPOCH - timedelta(hours=rng.randint(0, 23))
+        return {
+            "state": state,
+            "teamSize": team_size,
+            "attacksPerMember": 2,
+            "preparationStartTime": _api_time(start - timedelta(days=1)),
+            "startTime": _api_time(start),
+            "endTime": _api_time(start + timedelta(days=1)),
+            "clan": self._war_side(clan, rng, team_size),
+            "opponent": self._war_side(opponent, rng, team_size),
+        }
+
+    def _warlog_entry(self, clan: int, index: int) -> dict[str, Any]:
+        rng = self._rng_for("warlog", clan, index)
+        team_size = rng.choice((10, 15, 20, 30))
+        opponent = (clan + 1 + rng.randrange(max(self.clans - 1, 1))) % self.clans
+
+        def side(tag_clan: int) -> dict[str, Any]:
+            return {
+                **self._clan_ref(tag_clan),
+                "attacks": rng.randint(team_size, team_size * 2),
+                "stars": rng.randint(0, team_size * 3),
+                "destructionPercentage": round(rng.uniform(30, 100), 2),
+                "expEarned": rng.randint(0, 500),
+            }
+
+        ours, theirs = side(clan), side(opponent)
+        result = "win" if ours["stars"] > theirs["stars"] else "lose"
+        if ours["stars"] == theirs["stars"]:
+            result = "tie"
+        return {
+            "result": result,
+            "endTime": _api_time(EPOCH - timedelta(days=2 * index + 1)),
+            "teamSize": team_size,
+            "attacksPerMember": 2,
+            "clan": ours,
+            "opponent": theirs,
+        }
+
+    def _raid(self, clan: int, index: int) -> dict[str, Any]:
+        rng = self._rng_for("raid", clan, index)
+        start = EPOCH - timedelta(days=7 * index + 3)
+        attacks = rng.randint(0, 300)
+        return {
+            "state": "ongoing" if index == 0 else "ended",
+            "startTime": _api_time(start),
+            "endTime": _api_time(start + timedelta(days=3)),
+            "capitalTotalLoot": attacks * rng.randint(1_500, 3_000),
+            "raidsCompleted": rng.randint(0, 6),
+            "totalAttacks": attacks,
+            "enemyDistrictsDestroyed": rng.randint(0, 50),
+            "offensiveReward": rng.randint(0, 1_500),
+            "defensiveReward": rng.randint(0, 500),
+        }
+
+    def _cwl_group_clans(self, group: int) -> list[int]:
+        first = group * CWL_GROUP_SIZE
+        return [(first + offset) % self.clans for offset in range(CWL_GROUP_SIZE)]
+
+    def _league_group(self, clan: int) -> dict[str, Any]:
+        group = clan // CWL_GROUP_SIZE
+        wars_per_round = CWL_GROUP_SIZE // 2
+        played = self._rng_for("cwl", group).randint(1, CWL_ROUNDS)
+        rounds = [
+            {
+                "warTags": [
+                    self.war_tag((group * CWL_ROUNDS + round_index) * wars_per_round + war)
+                    if round_index < played
+                    else "#0"
+                    for war in range(wars_per_round)
+                ]
+            }
+            for round_index in range(CWL_ROUNDS)
+        ]
+        return {
+            "tag": self.war_tag(group * CWL_ROUNDS * wars_per_round),
+            "state": "inWar" if played < CWL_ROUNDS else "ended",
+            "season": EPOCH.strftime("%Y-%m"),
+            "clans": [self._clan_ref(member) for member in self._cwl_group_clans(group)],
+            "rounds": rounds,
+        }
+
+    def _cwl_war(self, war: int) -> dict[str, Any]:
+        wars_per_round = CWL_GROUP_SIZE // 2
+        group, rest = divmod(war, CWL_ROUNDS * wars_per_round)
+        round_index, slot = divmod(rest, wars_per_round)
+        clans = self._cwl_group_clans(group)
+        home, away = _round_pairs(round_index)[slot]
+        rng = self._rng_for("cwl-war", war)
+        start = EPOCH + timedelta(days=round_index - CWL_ROUNDS)
+        return {
+            "state": "warEnded" if round_index < CWL_ROUNDS - 1 else "inWar",
+            "teamSize": 15,
+            "startTime": _api_time(start),
+            "endTime": _api_time(start + timedelta(days=1)),
+            "clan": self._war_side(clans[home], rng, 15, cwl=True),
+            "opponent": self._war_side(clans[away], rng, 15, cwl=True),
+        }
+
+    @staticmethod
+    def _build_locations() -> list[dict[str, Any]]:
+        locations: list[dict[str, Any]] = [
+            {"id": 32000000 + index, "name": name, "isCountry": False}
+            for index, name in enumerate(_REGIONS)
+        ]
+        locations.append({"id": 32000006, "name": "International", "isCountry": False})
+        locations.extend(
+            {"id": 32000007 + index, "name": name, "isCountry": True, "countryCode": code}
+            for index, (code, name) in enumerate(_COUNTRIES)
+        )
+        return locations
+
+    def _location(self, location_id: str) -> int:
+        for index, location in enumerate(self._locations):
+            if str(location["id"]) == location_id:
+                return index
+        raise _not_found("location")
+
+    @staticmethod
+    def _ranked(offset: int, rank: int, size: int, count: int) -> int:
+        # Evenly strided picks keep one table free of duplicates.
+        stride = max(count // size, 1)
+        return (offset % stride + rank * stride) % count
+
+    def _rankings(self, location: int, kind: str, params: dict[str, str]) -> dict[str, Any]:
+        if kind == "players":
+            size, item = min(self.ranking_size, self.players), self._player_rank
+        elif kind in ("clans", "capital"):
+            size = min(self.ranking_size, self.clans)
+            item = functools.partial(self._clan_rank, capital=kind == "capital")
+        else:
+            raise _not_found("resource")
+        return _page(size, functools.partial(item, location), params)
+
+    def _player_rank(self, location: int, rank: int) -> dict[str, Any]:
+        player = self._ranked(location, rank, self.ranking_size, self.players)
+        core = self._player_core(player)
+        rng = self._rng_for("rank", location, rank)
+        entry = {
+            **core,
+            "trophies": 6_500 - rank * 3 - location,
+            "rank": rank + 1,
+            "previousRank": max(1, rank + 1 + rng.randint(-5, 5)),
+            "attackWins": rng.randint(0, 300),
+            "defenseWins": rng.randint(0, 50),
+        }
+        entry.pop("townHallLevel")
+        clan = self._player_clan(player)
+        if clan is not None:
+            entry["clan"] = self._clan_ref(clan)
+        return entry
+
+    def _clan_rank(self, location: int, rank: int, *, capital: bool) -> dict[str, Any]:
+        clan = self._ranked(location, rank, self.ranking_size, self.clans)
+        rng = self._rng_for("clan-rank", location, rank, capital)
+        points = (5_500 if capital else 60_000) - rank * (10 if capital else 100) - location
+        entry = {
+            **self._clan_ref(clan),
+            "rank": rank + 1,
+            "previousRank": max(1, rank + 1 + rng.randint(-5, 5)),
+            "location": self._locations[location],
+            "capitalPoints" if capital else "clanPoints": points,
+        }
+        if not capital:
+            entry["members"] = self._clan_size(clan)
+        return entry
+
+    def _legend_only(self, league_id: str) -> None:
+        if league_id != str(LEGEND_LEAGUE_ID):
+            raise _not_found("league seasons")
+
+    def _season_rank(self, season_id: str, rank: int) -> dict[str, Any]:
+        rng = self._rng_for("season", season_id, rank)
+        offset = _SEASONS.index(season_id)
+        player = self._ranked(offset, rank, self.season_ranking_size, self.players)
+        core = self._player_core(player)
+        entry = {
+            "tag": core["tag"],
+            "name": core["name"],
+            "expLevel": core["expLevel"],
+            "trophies": max(5_000, 7_000 - rank // 10),
+            "attackWins": rng.randint(0, 300),
+            "defenseWins": rng.randint(0, 50),
+            "rank": rank + 1,
+        }
+        clan = self._player_clan(player)
+        if clan is not None:
+            entry["clan"] = self._clan_ref(clan)
+        return entry
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m coc_api_wrapper.mock")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--players", type=int, default=1_000_000)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="median response delay")
+    parser.add_argument("--latency-sigma", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 5xx replies")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="share of 429 replies")
+    parser.add_argument("--rate-limit", type=float, help="requests per second before 429")
+    parser.add_argument("--token", help="require this bearer token")
+    args = parser.parse_args(argv)
+
+    api = MockCoCAPI(
+        seed=args.seed,
+        players=args.players,
+        latency=LatencyProfile(args.latency_ms / 1000, args.latency_sigma),
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        rate_limit=args.rate_limit,
+        token=args.token,
+    )
+
+    async def run() -> None:
+        server = api.server(host=args.host, port=args.port)
+        await server.start()
+        logging.getLogger("coc_api_wrapper").info("mock CoC API on %s/v1", server.base_url)
+        try:
+            await server.serve_forever()
+        finally:
+            await server.stop()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(run())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,30 @@
 from __future__ import annotations
 
-from typing import Any, Generic, TypeVar
+import json
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from .exceptions import APIError
+from .lite import (
+    LiteClanMember,
+    LiteClanRanking,
+    LiteLeagueSeasonRank,
+    LiteModel,
+    LitePlayerRanking,
+    LiteRaidSeason,
+    LiteWarLogEntry,
+    parse_lite,
+)
+from .utils import normalize_tag, paginate
+
+if TYPE_CHECKING:
+    import httpx
+
+    from .store import EntityStore
+
 
 class CoCBaseModel(BaseModel):
     model_config = ConfigDict(extra="ignore")
@@ -21,6 +42,25 @@ class IconUrls(CoCBaseModel):
     large: str | None = None
 
 
+class Label(CoCBaseModel):
+    id: int | None = None
+    name: str | None = None
+    icon_urls: IconUrls | None = Field(default=None, alias="iconUrls")
+
+
+class League(CoCBaseModel):
+    id: int | None = None
+    name: str | None = None
+    icon_urls: IconUrls | None = Field(default=None, alias="iconUrls")
+
+
+class Location(CoCBaseModel):
+    id: int | None = None
+    name: str | None = None
+    is_country: bool | None = Field(default=None, alias="isCountry")
+    country_code: str | None = Field(default=None, alias="countryCode")
+
+
 class Clan(CoCBaseModel):
     tag: str
     name: str
@@ -28,6 +68,8 @@ class Clan(CoCBaseModel):
     members: int | None = None
     description: str | None = None
     badge_urls: BadgeUrls | None = Field(default=None, alias="badgeUrls")
+    location: Location | None = None
+    member_list: list[ClanMember] | None = Field(default=None, alias="memberList")
 
 
 class PlayerClan(CoCBaseModel):
@@ -43,33 +85,17 @@ class Player(CoCBaseModel):
     exp_level: int | None = Field(default=None, alias="expLevel")
     trophies: int | None = None
     clan: PlayerClan | None = None
+    league: League | None = None
 
 
 class ClanMember(CoCBaseModel):
     tag: str
     name: str
     role: str | None = None
+    town_hall_level: int | None = Field(default=None, alias="townHallLevel")
     exp_level: int | None = Field(default=None, alias="expLevel")
     trophies: int | None = None
-
-
-class Label(CoCBaseModel):
-    id: int | None = None
-    name: str | None = None
-    icon_urls: IconUrls | None = Field(default=None, alias="iconUrls")
-
-
-class League(CoCBaseModel):
-    id: int | None = None
-    name: str | None = None
-    icon_urls: IconUrls | None = Field(default=None, alias="iconUrls")
-
-
-class Location(CoCBaseModel):
-    id: int | None = None
-    name: str | None = None
-    is_country: bool | None = Field(default=None, alias="isCountry")
-    country_code: str | None = Field(default=None, alias="countryCode")
+    league: League | None = None
 
 
 class Cursors(CoCBaseModel):
@@ -191,6 +217,88 @@ class CWLWar(CoCBaseModel):
     opponent: CWLWarClan | None = None
 
 
+class CWLSeason(CoCBaseModel):
+    group: CWLLeagueGroup
+    wars: dict[str, CWLWar] = Field(default_factory=dict)
+
+    def round_wars(self, index: int) -> list[CWLWar]:
+        rounds = self.group.rounds or []
+        war_tags = rounds[index].war_tags or []
+        return [self.wars[tag] for tag in war_tags if tag in self.wars]
+
+    def clan_wars(self, clan_tag: str) -> list[CWLWar]:
+        tag = normalize_tag(clan_tag)
+        return [
+            war
+            for war in self.wars.values()
+            if any(
+                side is not None and side.tag and normalize_tag(side.tag) == tag
+                for side in (war.clan, war.opponent)
+            )
+        ]
+
+
+@dataclass(frozen=True, slots=True)
+class ClanRoster:
+    clan_tag: str
+    members: list[ClanMember]
+    players: dict[str, Player] = field(default_factory=dict)
+    errors: dict[str, APIError] = field(default_factory=dict)
+
+    @property
+    def complete(self) -> bool:
+        return not self.errors
+
+    def player(self, tag: str) -> Player | None:
+        return self.players.get(normalize_tag(tag))
+
+    def __iter__(self) -> Iterator[tuple[ClanMember, Player | None]]:
+        for member in self.members:
+            yield member, self.players.get(normalize_tag(member.tag))
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+
+@dataclass(frozen=True, slots=True)
+class SyncResult(Generic[T]):
+    items: list[T]
+    watermark: str | None
+    pages: int = 0
+
+
+# httpx has already decoded the body, and the length changes when it is re-sent.
+_DROPPED_HEADERS = frozenset(
+    {"connection", "content-encoding", "content-length", "keep-alive", "transfer-encoding"}
+)
+
+
+@dataclass(frozen=True, slots=True)
+class RawResponse:
+    status_code: int
+    content: bytes
+    headers: Mapping[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_response(cls, response: httpx.Response) -> RawResponse:
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name.lower() not in _DROPPED_HEADERS
+        }
+        return cls(response.status_code, response.content, headers)
+
+    @property
+    def content_type(self) -> str | None:
+        return next(
+            (value for name, value in self.headers.items() if name.lower() == "content-type"),
+            None,
+        )
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
 class RaidSeason(CoCBaseModel):
     state: str | None = None
     start_time: str | None = Field(default=None, alias="startTime")
@@ -223,6 +331,7 @@ class PlayerRanking(Ranking):
     exp_level: int | None = Field(default=None, alias="expLevel")
     trophies: int | None = None
     clan: PlayerClan | None = None
+    league: League | None = None
 
 
 class CapitalRanking(Ranking):
@@ -285,6 +394,105 @@ class LeagueSeasonRankingsPage(Page[LeagueSeasonRank]):
     items: list[LeagueSeasonRank]
 
 
+def cwl_war_tags(group: CWLLeagueGroup) -> list[str]:
+    seen: dict[str, None] = {}
+    for round_ in group.rounds or []:
+        for war_tag in round_.war_tags or []:
+            if war_tag and war_tag != "#0":
+                seen.setdefault(war_tag, None)
+    return list(seen)
+
+
+def split_at_watermark(items: list[T], since: str | None) -> tuple[list[T], bool]:
+    # API timestamps ("20240101T000000.000Z") sort lexicographically.
+    fresh: list[T] = []
+    for item in items:
+        end_time = getattr(item, "end_time", None)
+        if since is not None and end_time is not None and end_time <= since:
+            return fresh, True
+        fresh.append(item)
+    return fresh, False
+
+
+# iter_* listings: path template, page model, lite row model.
+PAGE_STREAMS: dict[str, tuple[str, type[Page[Any]], type[LiteModel]]] = {
+    "clan_members": ("/clans/{tag}/members", ClanMembersPage, LiteClanMember),
+    "clan_warlog": ("/clans/{tag}/warlog", WarLogPage, LiteWarLogEntry),
+    "capital_raids": ("/clans/{tag}/capitalraidseasons", RaidSeasonsPage, LiteRaidSeason),
+    "location_clan_rankings": (
+        "/locations/{location_id}/rankings/clans",
+        ClanRankingPage,
+        LiteClanRanking,
+    ),
+    "location_player_rankings": (
+        "/locations/{location_id}/rankings/players",
+        PlayerRankingPage,
+        LitePlayerRanking,
+    ),
+    "location_capital_rankings": (
+        "/locations/{location_id}/rankings/capital",
+        CapitalRankingPage,
+        LiteClanRanking,
+    ),
+    "league_season": (
+        "/leagues/{league_id}/seasons/{season_id}",
+        LeagueSeasonRankingsPage,
+        LiteLeagueSeasonRank,
+    ),
+}
+
+
+class PageWalk:
+    """Cursor state of one ``iter_*`` listing, shared by the sync and async clients.
+
+    The client requests ``path`` with ``params()`` until ``done`` and passes
+    each payload to ``feed()``, which returns the parsed rows. Pages also go
+    to ``store`` like the matching ``get_*`` call would send them.
+    """
+
+    def __init__(
+        self,
+        stream: str,
+        *,
+        page_size: int | None = None,
+        lite: bool = False,
+        store: EntityStore | None = None,
+        **path_params: Any,
+    ) -> None:
+        template, self._page_model, self._lite_model = PAGE_STREAMS[stream]
+        self.path = template.format(**path_params)
+        self._page_size = page_size
+        self._lite = lite
+        self._store = store
+        self._after: str | None = None
+        self.done = False
+
+    def params(self) -> dict[str, Any]:
+        return paginate(limit=self._page_size, after=self._after)
+
+    def feed(self, payload: Mapping[str, Any]) -> list[Any]:
+        items = payload.get("items") or []
+        cursors = (payload.get("paging") or {}).get("cursors") or {}
+        self._after = cursors.get("after")
+        self.done = not self._after or not items
+        page = None
+        if self._store is not None or not self._lite:
+            page = self._page_model.model_validate(payload)
+            if self._store is not None:
+                self._store.add_page(self.path, page)
+        if self._lite:
+            return parse_lite(self._lite_model, items)
+        assert page is not None
+        return list(page.items)
+
+
+def advance_watermark(items: list[Any], since: str | None) -> str | None:
+    end_times = [item.end_time for item in items if item.end_time]
+    if since is not None:
+        end_times.append(since)
+    return max(end_times, default=None)
+
+
 def ensure_object(payload: Any) -> dict[str, Any]:
     if not isinstance(payload, dict):
         raise TypeError(f"Expected JSON object, got {type(payload).__name__}")
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import functools
+import json
+from collections.abc import Iterable, Mapping
+from typing import Any, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+from .models import (
+    CapitalRankingPage,
+    Clan,
+    ClanLabelsPage,
+    ClanMembersPage,
+    ClanRankingPage,
+    CurrentWar,
+    CWLLeagueGroup,
+    CWLLeaguePage,
+    CWLWar,
+    GoldPassSeason,
+    LeagueSeasonRankingsPage,
+    LeagueSeasonsPage,
+    LeaguesPage,
+    LocationsPage,
+    Player,
+    PlayerRankingPage,
+    RaidSeasonsPage,
+    WarLogPage,
+)
+from .utils import endpoint_template
+
+# Payload keys to keep; ``None`` keeps the value whole, a nested mapping projects it.
+Projection = dict[str, Union["Projection", None]]
+
+ENDPOINT_MODELS: dict[str, type[BaseModel]] = {
+    "/clans/{tag}": Clan,
+    "/clans/{tag}/members": ClanMembersPage,
+    "/clans/{tag}/currentwar": CurrentWar,
+    "/clans/{tag}/currentwar/leaguegroup": CWLLeagueGroup,
+    "/clans/{tag}/warlog": WarLogPage,
+    "/clans/{tag}/capitalraidseasons": RaidSeasonsPage,
+    "/players/{tag}": Player,
+    "/clanwarleagues/warleagues": CWLLeaguePage,
+    "/clanwarleagues/wars/{tag}": CWLWar,
+    "/locations": LocationsPage,
+    "/locations/{id}/rankings/clans": ClanRankingPage,
+    "/locations/{id}/rankings/players": PlayerRankingPage,
+    "/locations/{id}/rankings/capital": CapitalRankingPage,
+    "/leagues": LeaguesPage,
+    "/leagues/{id}/seasons": LeagueSeasonsPage,
+    "/leagues/{id}/seasons/{season_id}": LeagueSeasonRankingsPage,
+    "/labels/clans": ClanLabelsPage,
+    "/goldpass/seasons/current": GoldPassSeason,
+}
+
+# Top-level keys left out by default: a clan's member list is most of its payload
+# and /clans/{tag}/members serves the roster.
+DEFAULT_EXCLUDE: dict[str, frozenset[str]] = {"/clans/{tag}": frozenset({"memberList"})}
+
+
+@functools.cache
+def model_projection(model: type[BaseModel]) -> Projection:
+    if not model.__pydantic_complete__:
+        model.model_rebuild()
+    return {
+        field.alias or name: _annotation_projection(field.annotation)
+        for name, field in model.model_fields.items()
+    }
+
+
+def _annotation_projection(annotation: Any) -> Projection | None:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return model_projection(annotation)
+    if get_origin(annotation) in (dict, Mapping):
+        # Mapping values would need per-key projection; keep them whole.
+        return None
+    for arg in get_args(annotation):
+        projection = _annotation_projection(arg)
+        if projection is not None:
+            return projection
+    return None
+
+
+def project(value: Any, projection: Projection) -> Any:
+    if isinstance(value, list):
+        return [project(item, projection) for item in value]
+    if not isinstance(value, dict):
+        return value
+    return {
+        key: value[key] if nested is None else project(value[key], nested)
+        for key, nested in projection.items()
+        if key in value
+    }
+
+
+def payload_size(payload: Any) -> int:
+    return len(json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode())
+
+
+class CacheProjection:
+    """Trims cached GET payloads to the fields their response model reads.
+
+    Projections are derived once per endpoint template from the model's field
+    aliases, nested models included. Paths without a registered model are
+    cached unchanged. Register a subclass to keep extra fields for it.
+    Top-level keys in ``exclude`` are dropped even if the model reads them;
+    by default that is ``memberList`` of ``/clans/{tag}``, so pass
+    ``exclude={}`` to keep clan rosters in the cache.
+    """
+
+    def __init__(
+        self,
+        models: Mapping[str, type[BaseModel]] | None = None,
+        *,
+        exclude: Mapping[str, Iterable[str]] | None = None,
+    ) -> None:
+        self._models: dict[str, type[BaseModel]] = dict(
+            ENDPOINT_MODELS if models is None else models
+        )
+        self._exclude: dict[str, frozenset[str]] = {
+            template: frozenset(keys)
+            for template, keys in (DEFAULT_EXCLUDE if exclude is None else exclude).items()
+        }
+
+    def register(self, template: str, model: type[BaseModel]) -> None:
+        self._models[template] = model
+
+    def unregister(self, template: str) -> None:
+        self._models.pop(template, None)
+
+    def templates(self) -> list[str]:
+        return sorted(self._models)
+
+    def projection_for(self, path: str) -> Projection | None:
+        template = endpoint_template(path)
+        model = self._models.get(template)
+        if model is None:
+            return None
+        projection = model_projection(model)
+        dropped = self._exclude.get(template)
+        if not dropped:
+            return projection
+        return {key: nested for key, nested in projection.items() if key not in dropped}
+
+    def project(self, path: str, payload: dict[str, Any]) -> dict[str, Any]:
+        projection = self.projection_for(path)
+        if projection is None:
+            return payload
+        projected: dict[str, Any] = project(payload, projection)
+        return projected
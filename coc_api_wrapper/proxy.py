@@ -0,0 +1,193 @@
+"""Local caching proxy for the CoC API: ``python -m coc_api_wrapper.proxy``."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import dataclasses
+import logging
+import os
+import sys
+from collections.abc import Mapping, Sequence
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+
+import httpx
+
+from ._http import HTTPReply, LocalHTTPServer, json_reply
+from .async_client import AsyncCoCClient
+from .exceptions import APIError, DeadlineExceeded, RateLimited
+from .tokens import TokenPool
+
+
+def _error_reply(exc: APIError) -> HTTPReply:
+    if isinstance(exc, DeadlineExceeded):
+        return json_reply(504, {"reason": "deadlineExceeded", "message": str(exc)})
+    if exc.status_code is None:
+        return json_reply(502, {"reason": "upstreamUnavailable", "message": str(exc)})
+    headers: dict[str, str] = {}
+    if isinstance(exc, RateLimited) and exc.retry_after is not None:
+        headers["Retry-After"] = f"{exc.retry_after:g}"
+    payload = exc.payload if isinstance(exc.payload, dict) else {"reason": exc.message}
+    return json_reply(exc.status_code, payload, headers)
+
+
+class CoCProxy:
+    """Serves the CoC REST paths on a local port through one :class:`AsyncCoCClient`.
+
+    Every service pointed at the proxy shares the client's cache, request
+    coalescing and rate limit. Responses are forwarded as raw bytes via
+    :meth:`AsyncCoCClient.get_raw`; API errors keep their status code and
+    body. ``GET /_proxy/stats`` reports cache statistics.
+    """
+
+    def __init__(
+        self,
+        client: AsyncCoCClient,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        prefix: str = "/v1",
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self._client = client
+        self._prefix = prefix.rstrip("/")
+        self._server = LocalHTTPServer(self._dispatch, host=host, port=port, logger=logger)
+
+    @property
+    def address(self) -> tuple[str, int]:
+        return self._server.address
+
+    @property
+    def url(self) -> str:
+        return f"{self._server.base_url}{self._prefix}"
+
+    @property
+    def requests(self) -> int:
+        return self._server.requests
+
+    async def start(self) -> None:
+        await self._server.start()
+
+    async def stop(self) -> None:
+        await self._server.stop()
+
+    async def serve_forever(self) -> None:
+        await self._server.serve_forever()
+
+    async def __aenter__(self) -> CoCProxy:
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type: object, exc: object, tb: object) -> None:
+        await self.stop()
+
+    async def handle(self, method: str, target: str) -> HTTPReply:
+        if method not in ("GET", "HEAD"):
+            return json_reply(405, {"reason": "methodNotAllowed"}, {"Allow": "GET, HEAD"})
+        parts = urlsplit(target)
+        path = parts.path
+        if path == "/_proxy/stats":
+            stats = {
+                name: dataclasses.asdict(value)
+                for name, value in self._client.cache_stats().items()
+            }
+            return json_reply(200, {"requests": self.requests, "cache": stats})
+        if self._prefix and path.startswith(f"{self._prefix}/"):
+            path = path[len(self._prefix) :]
+        params = parse_qsl(parts.query, keep_blank_values=True)
+        try:
+            raw = await self._client.get_raw(path, params or None)
+        except APIError as exc:
+            return _error_reply(exc)
+        headers = dict(raw.headers)
+        if raw.content_type is None:
+            headers["Content-Type"] = "application/json"
+        return HTTPReply(raw.status_code, raw.content, headers)
+
+    async def _dispatch(self, method: str, target: str, headers: Mapping[str, str]) -> HTTPReply:
+        return await self.handle(method, target)
+
+
+def _tokens(values: Sequence[str] | None) -> list[str]:
+    if values:
+        return list(values)
+    raw = os.environ.get("COC_API_TOKENS") or os.environ.get("COC_API_TOKEN", "")
+    return [token for token in raw.split(",") if token.strip()]
+
+
+def build_client(
+    tokens: Sequence[str],
+    *,
+    base_url: str = "https://api.clashofclans.com/v1",
+    timeout: float = 10.0,
+    **kwargs: Any,
+) -> AsyncCoCClient:
+    pool = TokenPool(tokens)
+    http_client = httpx.AsyncClient(
+        base_url=base_url.rstrip("/"),
+        timeout=httpx.Timeout(timeout),
+        auth=pool,
+        limits=httpx.Limits(max_connections=None, max_keepalive_connections=100),
+    )
+    return AsyncCoCClient(
+        tokens[0], base_url=base_url, timeout=timeout, client=http_client, **kwargs
+    )
+
+
+async def serve(
+    tokens: Sequence[str],
+    *,
+    host: str = "127.0.0.1",
+    port: int = 8080,
+    **client_kwargs: Any,
+) -> None:
+    async with (
+        build_client(tokens, **client_kwargs) as client,
+        CoCProxy(client, host=host, port=port) as proxy,
+    ):
+        logging.getLogger("coc_api_wrapper").info("CoC proxy listening on %s", proxy.url)
+        await proxy.serve_forever()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m coc_api_wrapper.proxy")
+    parser.add_argument(
+        "--token",
+        action="append",
+        help="API token; repeat to pool several (default: $COC_API_TOKENS or $COC_API_TOKEN)",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--base-url", default="https://api.clashofclans.com/v1")
+    parser.add_argument("--cache-ttl", type=float, default=30.0)
+    parser.add_argument("--cache-max-entries", type=int)
+    parser.add_argument("--negative-cache-ttl", type=float, default=30.0)
+    parser.add_argument("--rate-limit", type=float, help="requests per second to the API")
+    parser.add_argument("--max-concurrency", type=int)
+    args = parser.parse_args(argv)
+
+    tokens = _tokens(args.token)
+    if not tokens:
+        parser.error("no API token: pass --token or set COC_API_TOKENS / COC_API_TOKEN")
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(
+            serve(
+                tokens,
+                host=args.host,
+                port=args.port,
+                base_url=args.base_url,
+                cache_ttl=args.cache_ttl,
+                cache_max_entries=args.cache_max_entries,
+                negative_cache_ttl=args.negative_cache_ttl,
+                rate_limit=args.rate_limit,
+                max_concurrency=args.max_concurrency,
+            )
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Literal
+
+Priority = Literal["interactive", "normal", "background"]
+
+PRIORITIES: tuple[Priority, ...] = ("interactive", "normal", "background")
+_RANKS: dict[str, int] = {name: rank for rank, name in enumerate(PRIORITIES)}
+
+_current_priority: ContextVar[Priority] = ContextVar("coc_request_priority", default="normal")
+
+
+def current_priority() -> Priority:
+    return _current_priority.get()
+
+
+def check_priority(priority: str) -> Priority:
+    if priority not in _RANKS:
+        raise ValueError(f"Unknown priority: {priority!r}")
+    return priority  # type: ignore[return-value]
+
+
+@contextmanager
+def request_priority(priority: Priority) -> Iterator[None]:
+    token = _current_priority.set(check_priority(priority))
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+@dataclass(slots=True)
+class _Waiter:
+    future: asyncio.Future[None]
+    enqueued_at: float
+
+
+class RequestScheduler:
+    """Hands out request slots by priority under a concurrency and rate limit.
+
+    Waiters of the same class are served FIFO. To keep background work from
+    starving, a waiter gains one priority class for every ``aging`` seconds it
+    has spent in the queue.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int | None = None,
+        rate_limit: float | None = None,
+        burst: int | None = None,
+        aging: float = 5.0,
+        time_fn: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_concurrency is not None and max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
+        if rate_limit is not None and rate_limit <= 0:
+            raise ValueError("rate_limit must be positive")
+        if aging <= 0:
+            raise ValueError("aging must be positive")
+
+        self._max_concurrency = max_concurrency
+        self._rate = None if rate_limit is None else float(rate_limit)
+        self._burst = float(burst if burst is not None else max(1, int(self._rate or 1)))
+        self._aging = float(aging)
+        self._time_fn = time_fn
+        self._queues: dict[str, deque[_Waiter]] = {name: deque() for name in PRIORITIES}
+        self._active = 0
+        self._tokens = self._burst
+        self._refilled_at = time_fn()
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def max_concurrency(self) -> int | None:
+        return self._max_concurrency
+
+    @property
+    def rate_limit(self) -> float | None:
+        return self._rate
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    def pending(self, priority: Priority | None = None) -> int:
+        if priority is not None:
+            queues = [self._queues[check_priority(priority)]]
+        else:
+            queues = list(self._queues.values())
+        return sum(1 for queue in queues for waiter in queue if not waiter.future.done())
+
+    async def acquire(self, priority: Priority | None = None) -> None:
+        name = check_priority(priority) if priority is not None else current_priority()
+        idle = not any(self._queues.values())
+        if idle and self._has_capacity() and self._token_wait() <= 0:
+            self._grant()
+            return
+
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), self._time_fn())
+        self._queues[name].append(waiter)
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        if self._active <= 0:
+            raise RuntimeError("release() called more times than acquire()")
+        self._active -= 1
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority | None = None) -> AsyncIterator[None]:
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def _has_capacity(self) -> bool:
+        return self._max_concurrency is None or self._active < self._max_concurrency
+
+    def _token_wait(self) -> float:
+        if self._rate is None:
+            return 0.0
+        now = self._time_fn()
+        elapsed = max(0.0, now - self._refilled_at)
+        self._tokens = min(self._burst, self._tokens + elapsed * self._rate)
+        self._refilled_at = now
+        if self._tokens >= 1.0:
+            return 0.0
+        return (1.0 - self._tokens) / self._rate
+
+    def _grant(self) -> None:
+        if self._rate is not None:
+            self._tokens -= 1.0
+        self._active += 1
+
+    def _next_queue(self) -> deque[_Waiter] | None:
+        now = self._time_fn()
+        best: deque[_Waiter] | None = None
+        best_score = 0.0
+        for name in PRIORITIES:
+            queue = self._queues[name]
+            while queue and queue[0].future.done():
+                queue.popleft()
+            if not queue:
+                continue
+            score = _RANKS[name] - (now - queue[0].enqueued_at) / self._aging
+            if best is None or score < best_score:
+                best, best_score = queue, score
+        return best
+
+    def _dispatch(self) -> None:
+        while self._has_capacity():
+            queue = self._next_queue()
+            if queue is None:
+                return
+            wait = self._token_wait()
+            if wait > 0:
+                self._schedule(wait)
+                return
+            waiter = queue.popleft()
+            self._grant()
+            waiter.future.set_result(None)
+
+    def _schedule(self, delay: float) -> None:
+        if self._timer is not None:
+            return
+        self._timer = asyncio.get_running_loop().call_later(delay, self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._dispatch()
@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import dataclasses
+import threading
+from collections.abc import Hashable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from .models import (
+    CapitalRankingPage,
+    Clan,
+    ClanMember,
+    ClanMembersPage,
+    ClanRankingPage,
+    Page,
+    Player,
+    PlayerRanking,
+    PlayerRankingPage,
+)
+from .utils import normalize_tag
+
+PLAYER_INDEXES = ("clan_tag", "town_hall_level", "league_id", "location_id")
+CLAN_INDEXES = ("location_id",)
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerRecord:
+    tag: str
+    name: str | None = None
+    clan_tag: str | None = None
+    town_hall_level: int | None = None
+    exp_level: int | None = None
+    trophies: int | None = None
+    league_id: int | None = None
+    location_id: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ClanRecord:
+    tag: str
+    name: str | None = None
+    clan_level: int | None = None
+    members: int | None = None
+    location_id: int | None = None
+
+
+class _Table:
+    def __init__(self, indexes: Iterable[str]) -> None:
+        self.rows: dict[str, Any] = {}
+        self.indexes: dict[str, dict[Hashable, set[str]]] = {name: {} for name in indexes}
+
+    def upsert(self, factory: type, key: str, values: Mapping[str, Any]) -> None:
+        old = self.rows.get(key)
+        new = factory(tag=key, **values) if old is None else dataclasses.replace(old, **values)
+        if new == old:
+            return
+        self.rows[key] = new
+        for name, index in self.indexes.items():
+            before = getattr(old, name, None)
+            after = getattr(new, name)
+            if before == after:
+                continue
+            if before is not None:
+                bucket = index.get(before)
+                if bucket is not None:
+                    bucket.discard(key)
+                    if not bucket:
+                        del index[before]
+            if after is not None:
+                index.setdefault(after, set()).add(key)
+
+    def remove(self, key: str) -> None:
+        old = self.rows.pop(key, None)
+        if old is None:
+            return
+        for name, index in self.indexes.items():
+            value = getattr(old, name)
+            bucket = index.get(value)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del index[value]
+
+    def query(self, filters: Mapping[str, Hashable | None]) -> list[Any]:
+        buckets = [
+            self.indexes[name].get(value, set())
+            for name, value in filters.items()
+            if value is not None
+        ]
+        if not buckets:
+            return list(self.rows.values())
+        buckets.sort(key=len)
+        first, *rest = buckets
+        return [self.rows[key] for key in first if all(key in bucket for bucket in rest)]
+
+
+def _key(tag: str) -> str:
+    return "#" + normalize_tag(tag)[3:]
+
+
+def _location_id(value: int | str) -> int | None:
+    return int(value) if str(value).isdigit() else None
+
+
+def _known(**values: Any) -> dict[str, Any]:
+    return {name: value for name, value in values.items() if value is not None}
+
+
+class EntityStore:
+    """Latest known players and clans, indexed for lookups without API calls.
+
+    Clients created with ``store=...`` feed it from player, clan, member and
+    ranking responses. Fields missing from a response keep their previous
+    value; clan membership is replaced whenever a full member list is seen.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._players = _Table(PLAYER_INDEXES)
+        self._clans = _Table(CLAN_INDEXES)
+
+    def __len__(self) -> int:
+        return len(self._players.rows) + len(self._clans.rows)
+
+    def player(self, tag: str) -> PlayerRecord | None:
+        return self._players.rows.get(_key(tag))
+
+    def clan(self, tag: str) -> ClanRecord | None:
+        return self._clans.rows.get(_key(tag))
+
+    def players(
+        self,
+        *,
+        clan: str | None = None,
+        town_hall: int | None = None,
+        league: int | None = None,
+        location: int | None = None,
+    ) -> list[PlayerRecord]:
+        with self._lock:
+            return self._players.query(
+                {
+                    "clan_tag": _key(clan) if clan is not None else None,
+                    "town_hall_level": town_hall,
+                    "league_id": league,
+                    "location_id": location,
+                }
+            )
+
+    def clans(self, *, location: int | None = None) -> list[ClanRecord]:
+        with self._lock:
+            return self._clans.query({"location_id": location})
+
+    def clan_members(self, clan_tag: str) -> list[PlayerRecord]:
+        return self.players(clan=clan_tag)
+
+    def forget_player(self, tag: str) -> None:
+        with self._lock:
+            self._players.remove(_key(tag))
+
+    def forget_clan(self, tag: str) -> None:
+        key = _key(tag)
+        with self._lock:
+            self._clans.remove(key)
+            for member in list(self._players.indexes["clan_tag"].get(key, ())):
+                self._players.upsert(PlayerRecord, member, {"clan_tag": None})
+
+    def clear(self) -> None:
+        with self._lock:
+            self._players = _Table(PLAYER_INDEXES)
+            self._clans = _Table(CLAN_INDEXES)
+
+    def add_player(self, player: Player) -> None:
+        values = _known(
+            name=player.name,
+            town_hall_level=player.town_hall_level,
+            exp_level=player.exp_level,
+            trophies=player.trophies,
+            league_id=player.league.id if player.league else None,
+        )
+        # A player profile is authoritative about clan membership, including "no clan".
+        values["clan_tag"] = _key(player.clan.tag) if player.clan else None
+        with self._lock:
+            self._players.upsert(PlayerRecord, _key(player.tag), values)
+
+    def add_clan(self, clan: Clan) -> None:
+        values = _known(
+            name=clan.name,
+            clan_level=clan.clan_level,
+            members=clan.members,
+            location_id=clan.location.id if clan.location else None,
+        )
+        with self._lock:
+            self._clans.upsert(ClanRecord, _key(clan.tag), values)
+            if clan.member_list is not None:
+                self._set_members(clan.tag, clan.member_list)
+
+    def add_clan_members(
+        self,
+        clan_tag: str,
+        page: ClanMembersPage,
+        *,
+        complete: bool = False,
+    ) -> None:
+        with self._lock:
+            if complete:
+                self._set_members(clan_tag, page.items)
+            else:
+                for member in page.items:
+                    self._add_member(_key(clan_tag), member)
+
+    def add_player_rankings(self, location_id: int | str, page: PlayerRankingPage) -> None:
+        location = _location_id(location_id)
+        with self._lock:
+            for row in page.items:
+                if row.tag:
+                    self._add_ranked_player(location, row)
+
+    def add_clan_rankings(
+        self,
+        location_id: int | str,
+        page: ClanRankingPage | CapitalRankingPage,
+    ) -> None:
+        location = _location_id(location_id)
+        with self._lock:
+            for row in page.items:
+                if not row.tag:
+                    continue
+                values = _known(
+                    name=row.name,
+                    clan_level=row.clan_level,
+                    members=getattr(row, "members", None),
+                    location_id=location,
+                )
+                self._clans.upsert(ClanRecord, _key(row.tag), values)
+
+    def add_page(self, path: str, page: Page[Any]) -> None:
+        # Pages walked by ``iter_*``; the owner (clan tag or location id) is the path's 3rd segment.
+        owner = path.split("/")[2]
+        if isinstance(page, ClanMembersPage):
+            self.add_clan_members(owner, page)
+        elif isinstance(page, PlayerRankingPage):
+            self.add_player_rankings(owner, page)
+        elif isinstance(page, ClanRankingPage | CapitalRankingPage):
+            self.add_clan_rankings(owner, page)
+
+    def _add_ranked_player(self, location: int | None, row: PlayerRanking) -> None:
+        assert row.tag is not None
+        values = _known(
+            name=row.name,
+            exp_level=row.exp_level,
+            trophies=row.trophies,
+            league_id=row.league.id if row.league else None,
+            location_id=location,
+        )
+        values["clan_tag"] = _key(row.clan.tag) if row.clan else None
+        self._players.upsert(PlayerRecord, _key(row.tag), values)
+
+    def _add_member(self, clan_key: str, member: ClanMember) -> None:
+        values = _known(
+            name=member.name,
+            town_hall_level=member.town_hall_level,
+            exp_level=member.exp_level,
+            trophies=member.trophies,
+            league_id=member.league.id if member.league else None,
+        )
+        values["clan_tag"] = clan_key
+        self._players.upsert(PlayerRecord, _key(member.tag), values)
+
+    def _set_members(self, clan_tag: str, members: Iterable[ClanMember]) -> None:
+        clan_key = _key(clan_tag)
+        current = set()
+        for member in members:
+            self._add_member(clan_key, member)
+            current.add(_key(member.tag))
+        for key in list(self._players.indexes["clan_tag"].get(clan_key, ())):
+            if key not in current:
+                self._players.upsert(PlayerRecord, key, {"clan_tag": None})
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Generator, Iterable
+
+import httpx
+
+
+class TokenPool(httpx.Auth):
+    """Spreads requests over several API tokens, skipping rate-limited ones.
+
+    Pass it as ``auth=`` to the ``httpx`` client handed to a CoC client. Each
+    request takes the next token in turn; a 429 parks that token for its
+    ``Retry-After`` (or ``cooldown``) seconds. If every token is parked, the
+    one that recovers first is used.
+    """
+
+    def __init__(
+        self,
+        tokens: Iterable[str],
+        *,
+        cooldown: float = 1.0,
+        time_fn: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._tokens = [token.strip() for token in tokens if token.strip()]
+        if not self._tokens:
+            raise ValueError("at least one token is required")
+        self._cooldown = float(cooldown)
+        self._time = time_fn
+        self._parked_until = [0.0] * len(self._tokens)
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def available(self) -> int:
+        now = self._time()
+        return sum(until <= now for until in self._parked_until)
+
+    def auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, httpx.Response, None]:
+        index = self._take()
+        request.headers["Authorization"] = f"Bearer {self._tokens[index]}"
+        response = yield request
+        if response.status_code == 429:
+            self._park(index, response.headers.get("Retry-After"))
+
+    def _take(self) -> int:
+        with self._lock:
+            now = self._time()
+            count = len(self._tokens)
+            for offset in range(count):
+                index = (self._next + offset) % count
+                if self._parked_until[index] <= now:
+                    self._next = index + 1
+                    return index
+            return min(range(count), key=self._parked_until.__getitem__)
+
+    def _park(self, index: int, retry_after: str | None) -> None:
+        try:
+            delay = float(retry_after) if retry_after else self._cooldown
+        except ValueError:
+            delay = self._cooldown
+        with self._lock:
+            self._parked_until[index] = max(self._parked_until[index], self._time() + delay)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+import re
+from collections.abc import Iterable, Mapping
+from datetime import UTC, datetime
 from typing import Any
 from urllib.parse import urlencode
 
@@ -23,6 +25,60 @@ def normalize_tag(tag: str) -> str:
     return f"%23{rest}"
 
 
+TAG_ALPHABET = "0289PYLQGRJCUV"
+_TAG_BASE = len(TAG_ALPHABET)
+_TAG_DIGITS = {char: index for index, char in enumerate(TAG_ALPHABET)}
+# Bijective base-14 keeps leading "0"s and fits 15 symbols into a signed 64-bit int.
+MAX_TAG_LENGTH = 15
+
+
+def is_valid_tag(tag: str) -> bool:
+    try:
+        body = normalize_tag(tag)[3:]
+    except ValueError:
+        return False
+    return len(body) <= MAX_TAG_LENGTH and all(char in _TAG_DIGITS for char in body)
+
+
+def validate_tag(tag: str) -> str:
+    if not is_valid_tag(tag):
+        raise ValueError(f"Invalid tag: {tag!r}")
+    return normalize_tag(tag)
+
+
+def encode_tag(tag: str) -> int:
+    value = 0
+    for char in validate_tag(tag)[3:]:
+        value = value * _TAG_BASE + _TAG_DIGITS[char] + 1
+    return value
+
+
+def decode_tag(value: int) -> str:
+    if value <= 0:
+        raise ValueError("Encoded tag must be positive")
+    chars: list[str] = []
+    while value:
+        value, digit = divmod(value - 1, _TAG_BASE)
+        chars.append(TAG_ALPHABET[digit])
+    if len(chars) > MAX_TAG_LENGTH:
+        raise ValueError("Encoded tag is too long")
+    return "#" + "".join(reversed(chars))
+
+
+def path_tags(path: str) -> list[str]:
+    return [segment for segment in path.split("/") if segment.lower().startswith("%23")]
+
+
+def raw_path(path: str) -> str:
+    """Normalize an API path for raw requests: leading slash, ``#TAG`` segments encoded."""
+    segments = path.strip().split("/")
+    encoded = [
+        normalize_tag(segment) if segment.startswith("#") else segment for segment in segments
+    ]
+    joined = "/".join(encoded)
+    return joined if joined.startswith("/") else f"/{joined}"
+
+
 def paginate(*, limit: int | None = None, after: str | None = None) -> dict[str, Any]:
     params: dict[str, Any] = {}
     if limit is not None:
@@ -34,6 +90,19 @@ def paginate(*, limit: int | None = None, after: str | None = None) -> dict[str,
     return params
 
 
+QueryParams = Mapping[str, Any] | Iterable[tuple[str, Any]]
+
+
+def query_params(params: QueryParams | None) -> Mapping[str, Any] | None:
+    """Fold ``(name, value)`` pairs into a mapping; repeated names become lists."""
+    if params is None or isinstance(params, Mapping):
+        return params
+    grouped: dict[str, list[Any]] = {}
+    for name, value in params:
+        grouped.setdefault(name, []).append(value)
+    return {name: values[0] if len(values) == 1 else values for name, values in grouped.items()}
+
+
 def cache_key(method: str, path: str, params: Mapping[str, Any] | None) -> str:
     if not params:
         return f"{method.upper()} {path}"
@@ -50,3 +119,24 @@ def redact_token(headers: Mapping[str, str]) -> dict[str, str]:
             else:
                 redacted[key] = "***"
     return redacted
+
+
+def parse_api_time(value: str) -> datetime:
+    return datetime.strptime(value, "%Y%m%dT%H%M%S.%fZ").replace(tzinfo=UTC)
+
+
+_SEASON_ID = re.compile(r"\d{4}-\d{2}")
+
+
+def endpoint_template(path: str) -> str:
+    segments: list[str] = []
+    for segment in path.split("?", maxsplit=1)[0].split("/"):
+        if segment.lower().startswith("%23") or segment.startswith("#"):
+            segments.append("{tag}")
+        elif segment.isdigit():
+            segments.append("{id}")
+        elif _SEASON_ID.fullmatch(segment):
+            segments.append("{season_id}")
+        else:
+            segments.append(segment)
+    return "/".join(segments)
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+import time
+import zlib
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .exceptions import APIError
+from .scheduler import Priority
+from .utils import cache_key, normalize_tag, raw_path
+
+if TYPE_CHECKING:
+    from .async_client import AsyncCoCClient
+
+
+@dataclass(frozen=True, slots=True)
+class _WarmKey:
+    path: str
+    params: tuple[tuple[str, Any], ...] = ()
+
+
+class CacheWarmer:
+    """Re-fetches registered GET endpoints shortly before their cache entries expire.
+
+    A key is refreshed once its remaining TTL drops below ``margin`` plus a
+    per-key offset of up to ``spread`` seconds, which keeps keys cached at
+    the same moment from being refreshed together. Refreshes go through the
+    client's scheduler at ``priority`` and never exceed ``concurrency``.
+    """
+
+    def __init__(
+        self,
+        client: AsyncCoCClient,
+        *,
+        margin: float = 5.0,
+        spread: float = 5.0,
+        concurrency: int = 4,
+        max_interval: float = 300.0,
+        error_interval: float = 60.0,
+        priority: Priority = "background",
+        logger: logging.Logger | None = None,
+        time_fn: Callable[[], float] = time.monotonic,
+        sleep_fn: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        if margin < 0 or spread < 0:
+            raise ValueError("margin and spread must not be negative")
+        if concurrency <= 0:
+            raise ValueError("concurrency must be positive")
+        self._client = client
+        self._margin = float(margin)
+        self._spread = float(spread)
+        self._concurrency = concurrency
+        self._max_interval = float(max_interval)
+        self._error_interval = float(error_interval)
+        self._priority = priority
+        self._logger = logger or logging.getLogger("coc_api_wrapper")
+        self._time_fn = time_fn
+        self._sleep = sleep_fn
+        self._keys: dict[str, _WarmKey] = {}
+        self._due: list[tuple[float, str]] = []
+        self._next_due: dict[str, float] = {}
+        self._changed: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._refreshes = 0
+
+    @property
+    def keys(self) -> frozenset[str]:
+        return frozenset(self._keys)
+
+    @property
+    def refreshes(self) -> int:
+        return self._refreshes
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def add(self, path: str, params: Mapping[str, Any] | None = None) -> str:
+        path = raw_path(path)
+        key = cache_key("GET", path, params)
+        if key not in self._keys:
+            self._keys[key] = _WarmKey(path, tuple(sorted((params or {}).items())))
+            self._schedule(key, self._offset(key))
+        return key
+
+    def add_clans(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            self.add(f"/clans/{normalize_tag(tag)}")
+
+    def add_players(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            self.add(f"/players/{normalize_tag(tag)}")
+
+    def discard(self, path: str, params: Mapping[str, Any] | None = None) -> None:
+        key = cache_key("GET", raw_path(path), params)
+        self._keys.pop(key, None)
+        self._next_due.pop(key, None)
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        # While stopped, due times are kept relative to the moment of start().
+        self._shift(self._time_fn())
+        self._changed = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        self._shift(-self._time_fn())
+        self._changed = None
+
+    async def __aenter__(self) -> CacheWarmer:
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type: object, exc: object, tb: object) -> None:
+        await self.stop()
+
+    def _offset(self, key: str) -> float:
+        return (zlib.crc32(key.encode()) % 1000) / 1000 * self._spread
+
+    def _now(self) -> float:
+        return self._time_fn() if self._task is not None else 0.0
+
+    def _shift(self, delta: float) -> None:
+        self._due = [(due + delta, key) for due, key in self._due]
+        heapq.heapify(self._due)
+        self._next_due = {key: due + delta for key, due in self._next_due.items()}
+
+    def _schedule(self, key: str, delay: float) -> None:
+        due = self._now() + delay
+        self._next_due[key] = due
+        heapq.heappush(self._due, (due, key))
+        if self._changed is not None:
+            self._changed.set()
+
+    def _ttl_remaining(self, key: str) -> float | None:
+        spec = self._keys.get(key)
+        if spec is None:
+            return None
+        return self._client.cache_ttl(spec.path, dict(spec.params) or None)
+
+    def _next_delay(self, key: str) -> float:
+        left = self._ttl_remaining(key)
+        if left is None:
+            return self._max_interval
+        delay = left - self._margin - self._offset(key)
+        # A TTL shorter than the margin would otherwise be refreshed back to back.
+        return min(delay if delay > 0 else left / 2, self._max_interval)
+
+    def _refresh_in(self, key: str) -> float | None:
+        left = self._ttl_remaining(key)
+        if left is None:
+            return None
+        return left - self._margin - self._offset(key)
+
+    async def _run(self) -> None:
+        assert self._changed is not None
+        semaphore = asyncio.Semaphore(self._concurrency)
+        refreshing: set[asyncio.Task[None]] = set()
+        try:
+            while True:
+                if not self._due:
+                    self._changed.clear()
+                    await self._changed.wait()
+                    continue
+                due, key = self._due[0]
+                wait = due - self._time_fn()
+                if wait > 0:
+                    self._changed.clear()
+                    await self._wait_changed(wait)
+                    continue
+                heapq.heappop(self._due)
+                if self._next_due.get(key) != due:
+                    continue
+                del self._next_due[key]
+                refresh_in = self._refresh_in(key)
+                if refresh_in is not None and refresh_in > 0:
+                    self._schedule(key, min(refresh_in, self._max_interval))
+                    continue
+                await semaphore.acquire()
+                task = asyncio.create_task(self._refresh(key, semaphore))
+                refreshing.add(task)
+                task.add_done_callback(refreshing.discard)
+        finally:
+            for task in list(refreshing):
+                task.cancel()
+            await asyncio.gather(*refreshing, return_exceptions=True)
+
+    async def _wait_changed(self, timeout: float) -> None:
+        assert self._changed is not None
+        changed = asyncio.ensure_future(self._changed.wait())
+        sleeping = asyncio.ensure_future(self._sleep(timeout))
+        try:
+            await asyncio.wait({changed, sleeping}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            changed.cancel()
+            sleeping.cancel()
+            await asyncio.gather(changed, sleeping, return_exceptions=True)
+
+    async def _refresh(self, key: str, semaphore: asyncio.Semaphore) -> None:
+        spec = self._keys.get(key)
+        try:
+            if spec is None:
+                return
+            try:
+                await self._client.refresh(
+                    spec.path, dict(spec.params) or None, priority=self._priority
+                )
+            except APIError as exc:
+                self._logger.debug("cache warmer refresh failed for %s: %s", spec.path, exc)
+                self._schedule(key, self._error_interval)
+                return
+            except Exception:
+                # Unwrapped transport errors or odd payloads must not drop the key for good.
+                self._logger.exception("cache warmer refresh crashed for %s", spec.path)
+                self._schedule(key, self._error_interval)
+                return
+            self._refreshes += 1
+            self._schedule(key, self._next_delay(key))
+        finally:
+            semaphore.release()
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import zlib
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+from .exceptions import APIError
+from .models import CurrentWar
+from .scheduler import Priority, request_priority
+from .utils import normalize_tag, parse_api_time
+
+if TYPE_CHECKING:
+    from .async_client import AsyncCoCClient
+
+WarEventKind = Literal["preparation_started", "war_started", "stars_changed", "war_ended"]
+
+
+@dataclass(frozen=True, slots=True)
+class WarEvent:
+    kind: WarEventKind
+    clan_tag: str
+    war: CurrentWar
+    previous: CurrentWar | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class WarPollIntervals:
+    not_in_war: float = 900.0
+    preparation: float = 300.0
+    in_war: float = 180.0
+    closing: float = 30.0
+    closing_window: float = 600.0
+    ended: float = 600.0
+    error: float = 300.0
+
+
+def _war_id(war: CurrentWar) -> tuple[str | None, str | None]:
+    return war.start_time, war.opponent.tag if war.opponent else None
+
+
+def _stars(war: CurrentWar) -> tuple[int | None, int | None]:
+    return (
+        war.clan.stars if war.clan else None,
+        war.opponent.stars if war.opponent else None,
+    )
+
+
+def diff_wars(clan_tag: str, previous: CurrentWar | None, current: CurrentWar) -> list[WarEvent]:
+    if previous is None:
+        return []
+
+    events: list[WarEvent] = []
+    same_war = _war_id(previous) == _war_id(current)
+    if previous.state in ("preparation", "inWar") and (not same_war or current.state == "notInWar"):
+        events.append(WarEvent("war_ended", clan_tag, current, previous))
+
+    if current.state != previous.state or not same_war:
+        if current.state == "preparation":
+            events.append(WarEvent("preparation_started", clan_tag, current, previous))
+        elif current.state == "inWar":
+            events.append(WarEvent("war_started", clan_tag, current, previous))
+        elif current.state == "warEnded" and same_war:
+            if _stars(current) != _stars(previous):
+                events.append(WarEvent("stars_changed", clan_tag, current, previous))
+            events.append(WarEvent("war_ended", clan_tag, current, previous))
+        return events
+
+    if current.state == "inWar" and _stars(current) != _stars(previous):
+        events.append(WarEvent("stars_changed", clan_tag, current, previous))
+    return events
+
+
+class WarWatcher:
+    """Polls ``currentwar`` for many clans and yields :class:`WarEvent` objects.
+
+    Each clan is re-polled on its own schedule derived from the war state, so
+    idle clans cost one request every ``not_in_war`` seconds while wars close
+    to their end are checked every ``closing`` seconds.
+    """
+
+    def __init__(
+        self,
+        client: AsyncCoCClient,
+        clan_tags: Iterable[str] = (),
+        *,
+        intervals: WarPollIntervals | None = None,
+        concurrency: int = 10,
+        spread: float = 10.0,
+        priority: Priority = "background",
+        time_fn: Callable[[], float] = time.time,
+        sleep_fn: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        if concurrency <= 0:
+            raise ValueError("concurrency must be positive")
+        self._client = client
+        self._intervals = intervals or WarPollIntervals()
+        self._spread = max(0.0, float(spread))
+        self._priority = priority
+        self._time_fn = time_fn
+        self._sleep = sleep_fn
+        self._logger = logger or logging.getLogger("coc_api_wrapper")
+        self._concurrency = concurrency
+        self._semaphore: asyncio.Semaphore | None = None
+        self._queue: asyncio.Queue[WarEvent] | None = None
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+        self._wars: dict[str, CurrentWar] = {}
+        self._tags: set[str] = {normalize_tag(tag) for tag in clan_tags}
+
+    @property
+    def clan_tags(self) -> frozenset[str]:
+        return frozenset(self._tags)
+
+    def last_war(self, clan_tag: str) -> CurrentWar | None:
+        return self._wars.get(normalize_tag(clan_tag))
+
+    def add(self, clan_tag: str) -> None:
+        tag = normalize_tag(clan_tag)
+        self._tags.add(tag)
+        if self._queue is not None and tag not in self._tasks:
+            self._start(tag)
+
+    def discard(self, clan_tag: str) -> None:
+        tag = normalize_tag(clan_tag)
+        self._tags.discard(tag)
+        self._wars.pop(tag, None)
+        task = self._tasks.pop(tag, None)
+        if task is not None:
+            task.cancel()
+
+    def next_interval(self, war: CurrentWar | None) -> float:
+        intervals = self._intervals
+        if war is None:
+            return intervals.error
+        if war.state == "preparation":
+            return self._until(war.start_time, intervals.preparation)
+        if war.state == "inWar":
+            left = self._seconds_left(war.end_time)
+            if left is None:
+                return intervals.in_war
+            if left <= intervals.closing_window:
+                return intervals.closing
+            return max(intervals.closing, min(intervals.in_war, left - intervals.closing_window))
+        if war.state == "warEnded":
+            return intervals.ended
+        return intervals.not_in_war
+
+    async def poll(self, clan_tag: str) -> list[WarEvent]:
+        tag = normalize_tag(clan_tag)
+        with request_priority(self._priority):
+            current = await self._client.get_current_war(tag)
+        previous = self._wars.get(tag)
+        if previous == current:
+            return []
+
+        self._wars[tag] = current
+        return diff_wars(tag, previous, current)
+
+    async def events(self) -> AsyncIterator[WarEvent]:
+        if self._queue is not None:
+            raise RuntimeError("WarWatcher is already running")
+        self._queue = asyncio.Queue()
+        self._semaphore = asyncio.Semaphore(self._concurrency)
+        try:
+            for tag in sorted(self._tags):
+                self._start(tag)
+            while True:
+                yield await self._queue.get()
+        finally:
+            tasks = list(self._tasks.values())
+            self._tasks.clear()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._queue = None
+            self._semaphore = None
+
+    def __aiter__(self) -> AsyncIterator[WarEvent]:
+        return self.events()
+
+    def _start(self, tag: str) -> None:
+        self._tasks[tag] = asyncio.create_task(self._watch(tag))
+
+    async def _watch(self, tag: str) -> None:
+        assert self._queue is not None and self._semaphore is not None
+        if self._spread:
+            await self._sleep((zlib.crc32(tag.encode()) % 1000) / 1000 * self._spread)
+        while tag in self._tags:
+            try:
+                async with self._semaphore:
+                    events = await self.poll(tag)
+            except APIError as exc:
+                self._logger.debug("war watcher poll failed for %s: %s", tag, exc)
+                await self._sleep(self._intervals.error)
+                continue
+            except Exception:
+                # Odd payloads or unwrapped transport errors must not end this clan's task.
+                self._logger.exception("war watcher poll crashed for %s", tag)
+                await self._sleep(self._intervals.error)
+                continue
+            for event in events:
+                self._queue.put_nowait(event)
+            await self._sleep(self.next_interval(self._wars.get(tag)))
+
+    def _seconds_left(self, value: str | None) -> float | None:
+        if not value:
+            return None
+        try:
+            return parse_api_time(value).timestamp() - self._time_fn()
+        except ValueError:
+            return None
+
+    def _until(self, value: str | None, interval: float) -> float:
+        left = self._seconds_left(value)
+        if left is None:
+            return interval
+        return max(self._intervals.closing, min(interval, left))
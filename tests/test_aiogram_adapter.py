@@ -0,0 +1,108 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+
+from coc_api_wrapper import AsyncCoCClient
+from coc_api_wrapper.adapters.aiogram import InlineDebouncer
+
+
+class FakeQuery:
+    def __init__(self, text: str, user_id: int = 1, offset: str = "") -> None:
+        self.query = text
+        self.offset = offset
+        self.from_user = SimpleNamespace(id=user_id)
+        self.answers: list[dict] = []
+
+    async def answer(self, **kwargs) -> None:
+        self.answers.append(kwargs)
+
+
+def slow_client(seen: list[str], cancelled: list[str], delay: float) -> AsyncCoCClient:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.raw_path.decode()
+        seen.append(path)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(path)
+            raise
+        return httpx.Response(200, json={"tag": "#P", "name": path.rsplit("%23", 1)[-1]})
+
+    http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler),
+        base_url="https://api.clashofclans.com/v1",
+    )
+    return AsyncCoCClient(token="token", client=http_client, max_retries=0)
+
+
+async def test_typing_burst_runs_only_the_last_query() -> None:
+    debouncer = InlineDebouncer(delay=0.05)
+    calls: list[str] = []
+
+    @debouncer.handler
+    async def lookup(query: FakeQuery) -> list[str]:
+        calls.append(query.query)
+        return [query.query.upper()]
+
+    queries = [FakeQuery(text) for text in ("#a", "#ab", "#abc")]
+    tasks = []
+    for query in queries:
+        tasks.append(asyncio.create_task(lookup(query)))
+        await asyncio.sleep(0.01)
+    await asyncio.gather(*tasks)
+
+    assert calls == ["#abc"]
+    assert [query.answers for query in queries] == [[], [], [{"results": ["#ABC"]}]]
+    assert debouncer.superseded == 2
+
+    again = FakeQuery("  #ABC ")
+    await lookup(again)
+    assert calls == ["#abc"]
+    assert again.answers == [{"results": ["#ABC"]}]
+
+
+async def test_newer_query_cancels_obsolete_fetch_but_not_shared_ones() -> None:
+    seen: list[str] = []
+    cancelled: list[str] = []
+    debouncer = InlineDebouncer(delay=0.0)
+    async with slow_client(seen, cancelled, delay=0.2) as client:
+
+        @debouncer.handler
+        async def lookup(query: FakeQuery) -> list[str]:
+            return [(await client.get_player(query.query)).name]
+
+        first = asyncio.create_task(lookup(FakeQuery("#OLD")))
+        shared = FakeQuery("#SHARED", user_id=2)
+        other_user = asyncio.create_task(lookup(shared))
+        await asyncio.sleep(0.05)
+        joined = asyncio.create_task(lookup(FakeQuery("#SHARED")))
+        await asyncio.sleep(0.05)
+        newest = FakeQuery("#NEW")
+        await asyncio.gather(first, joined, other_user, lookup(newest))
+
+    assert seen == ["/v1/players/%23OLD", "/v1/players/%23SHARED", "/v1/players/%23NEW"]
+    assert cancelled == ["/v1/players/%23OLD"]
+    assert shared.answers == [{"results": ["SHARED"]}]
+    assert newest.answers == [{"results": ["NEW"]}]
+
+
+async def test_cancelled_callers_cancel_an_unshared_fetch() -> None:
+    seen: list[str] = []
+    cancelled: list[str] = []
+    async with slow_client(seen, cancelled, delay=0.2) as client:
+        first = asyncio.create_task(client.get_player("#P"))
+        second = asyncio.create_task(client.get_player("#P"))
+        await asyncio.sleep(0.05)
+        first.cancel()
+        assert (await second).name == "P"
+        assert cancelled == []
+
+        lone = asyncio.create_task(client.get_player("#Q"))
+        await asyncio.sleep(0.05)
+        lone.cancel()
+        await asyncio.gather(lone, return_exceptions=True)
+        await asyncio.sleep(0)
+
+    assert seen == ["/v1/players/%23P", "/v1/players/%23Q"]
+    assert cancelled == ["/v1/players/%23Q"]
@@ -1,6 +1,15 @@
+import asyncio
+
 import httpx
+import pytest
 
-from coc_api_wrapper import AsyncCoCClient
+from coc_api_wrapper import (
+    AsyncCoCClient,
+    DeadlineExceeded,
+    HedgePolicy,
+    request_priority,
+    time_budget,
+)
 
 
 async def test_async_get_player_works() -> None:
@@ -13,3 +22,197 @@ async def test_async_get_player_works() -> None:
     async with AsyncCoCClient(token="token", client=http_client, max_retries=0) as client:
         player = await client.get_player("#p")
         assert player.name == "Player"
+
+
+async def test_async_interactive_requests_overtake_background_queue() -> None:
+    seen: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.raw_path.decode())
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"tag": "%23P", "name": "Player"})
+
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.AsyncClient(transport=transport, base_url="https://api.clashofclans.com/v1")
+    async with AsyncCoCClient(
+        token="token",
+        client=http_client,
+        max_retries=0,
+        max_concurrency=1,
+        cache_enabled=False,
+    ) as client:
+        with request_priority("background"):
+            background = [asyncio.create_task(client.get_player(f"#B{i}")) for i in range(3)]
+        await asyncio.sleep(0)
+        with request_priority("interactive"):
+            player = await client.get_player("#USER")
+        assert player.name == "Player"
+        await asyncio.gather(*background)
+
+    assert seen.index("/v1/players/%23USER") == 1
+
+
+async def test_async_interactive_caller_does_not_join_queued_background_fetch() -> None:
+    calls = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        return httpx.Response(200, json={"tag": "%23P", "name": "Player"})
+
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.AsyncClient(transport=transport, base_url="https://api.clashofclans.com/v1")
+    done: list[str] = []
+
+    async def fetch(name: str) -> None:
+        await client.get_player("#P")
+        done.append(name)
+
+    async with AsyncCoCClient(
+        token="token", client=http_client, max_retries=0, max_concurrency=1
+    ) as client:
+        await client.scheduler.acquire()
+        with request_priority("background"):
+            background = asyncio.create_task(fetch("background"))
+        await asyncio.sleep(0)
+        with request_priority("interactive"):
+            interactive = asyncio.create_task(fetch("interactive"))
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert client.scheduler.pending("background") == 1
+        assert client.scheduler.pending("interactive") == 1
+        client.scheduler.release()
+        await asyncio.gather(background, interactive)
+
+    assert done == ["interactive", "background"]
+    assert calls["n"] == 2
+
+
+async def test_async_deadline_bounds_scheduler_wait() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"tag": "%23P", "name": "Player"})
+
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.AsyncClient(transport=transport, base_url="https://api.clashofclans.com/v1")
+    async with AsyncCoCClient(token="token", client=http_client, max_concurrency=1) as client:
+        await client.scheduler.acquire()
+        with pytest.raises(DeadlineExceeded), time_budget(0.1):
+            await client.get_player("#P")
+        client.scheduler.release()
+        assert client.scheduler.active == 0
+
+
+async def test_async_shared_fetch_ignores_first_callers_deadline() -> None:
+    calls = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        return httpx.Response(200, json={"tag": "%23P", "name": "Player"})
+
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.AsyncClient(transport=transport, base_url="https://api.clashofclans.com/v1")
+    async with AsyncCoCClient(token="token", client=http_client, max_concurrency=1) as client:
+        await client.scheduler.acquire()
+        with time_budget(0.1):
+            short = asyncio.create_task(client.get_player("#P"))
+        await asyncio.sleep(0)
+        patient = asyncio.create_task(client.get_player("#P"))
+        with pytest.raises(DeadlineExceeded):
+            await short
+        client.scheduler.release()
+        assert (await patient).name == "Player"
+
+    assert calls["n"] == 1
+
+
+async def test_async_deadline_hit_before_send_records_no_latency() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"tag": "%23P", "name": "Player"})
+
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.AsyncClient(transport=transport, base_url="https://api.clashofclans.com/v1")
+    async with AsyncCoCClient(
+        token="token", client=http_client, max_concurrency=1, total_timeout=0.2
+    ) as client:
+        await client.scheduler.acquire()
+        task = asyncio.create_task(client.get_player("#P"))
+        await asyncio.sleep(0.17)
+        client.scheduler.release()
+        with pytest.raises(DeadlineExceeded):
+            await task
+        assert len(client.latency) == 0
+        assert client.scheduler.active == 0
+
+
+async def test_async_hedges_slow_get_and_uses_first_answer() -> None:
+    calls = {"n": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        if calls["n"] == 1:
+            await asyncio.sleep(1.0)
+        return httpx.Response(200, json={"tag": "%23P", "name": f"Player{calls['n']}"})
+
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.AsyncClient(transport=transport, base_url="https://api.clashofclans.com/v1")
+    policy = HedgePolicy(min_samples=5, min_delay=0.01, max_fraction=1.0)
+    async with AsyncCoCClient(token="token", client=http_client, hedge=policy) as client:
+        for _ in range(5):
+            client.latency.record(0.02)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        player = await client.get_player("#P")
+        assert loop.time() - started < 0.5
+        assert player.name == "Player2"
+        assert calls["n"] == 2
+        await asyncio.sleep(0)
+        assert client.scheduler.active == 0
+        # The cancelled slow primary is recorded too, not just the winner.
+        assert len(client.latency) == 7
+        assert client.latency.percentile(1.0) >= 0.01
+
+
+async def test_async_hedge_delay_starts_after_scheduler_slot() -> None:
+    calls = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        return httpx.Response(200, json={"tag": "%23P", "name": "Player"})
+
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.AsyncClient(transport=transport, base_url="https://api.clashofclans.com/v1")
+    policy = HedgePolicy(min_samples=1, min_delay=0.02, max_fraction=1.0)
+    async with AsyncCoCClient(
+        token="token", client=http_client, hedge=policy, max_concurrency=2
+    ) as client:
+        client.latency.record(0.02)
+        await client.scheduler.acquire()
+        await client.scheduler.acquire()
+        task = asyncio.create_task(client.get_player("#P"))
+        await asyncio.sleep(0.1)
+        client.scheduler.release()
+        client.scheduler.release()
+        await task
+    assert calls["n"] == 1
+
+
+async def test_async_hedging_respects_traffic_fraction() -> None:
+    calls = {"n": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"tag": "%23P", "name": "Player"})
+
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.AsyncClient(transport=transport, base_url="https://api.clashofclans.com/v1")
+    policy = HedgePolicy(min_samples=1, min_delay=0.01, max_fraction=0.0)
+    async with AsyncCoCClient(
+        token="token",
+        client=http_client,
+        hedge=policy,
+        cache_enabled=False,
+    ) as client:
+        client.latency.record(0.001)
+        await client.get_player("#P")
+        await client.get_player("#P")
+    assert calls["n"] == 2
@@ -0,0 +1,66 @@
+import json
+
+import pytest
+
+from coc_api_wrapper.bench import LOAD_MODES, LOAD_OPS, bench_load, main
+from coc_api_wrapper.mock import LatencyProfile
+
+
+def test_bench_load_sweeps_modes_and_counts_retries() -> None:
+    results = bench_load(
+        concurrency=(1, 4),
+        requests=60,
+        workload={"player": 3, "clan": 1, "rankings": 1},
+        latency=LatencyProfile(median=0.001, max=0.002),
+        throttle_rate=0.1,
+        retry_after=0.001,
+        players=5_000,
+        keys=500,
+        backoff_base=0.001,
+    )
+
+    assert [(result.mode, result.concurrency) for result in results] == [
+        (mode, level) for mode in LOAD_MODES for level in (1, 4)
+    ]
+    for result in results:
+        assert result.requests == 60
+        assert result.requests_per_second > 0
+        assert 0 < result.p50 <= result.p95 <= result.p99
+        assert result.retries > 0
+        assert result.cpu_per_request > 0
+
+
+def test_bench_load_counts_unexpected_exceptions_as_errors(monkeypatch) -> None:
+    def flaky(client, api, key):
+        if key % 3 == 0:
+            raise RuntimeError("odd payload")
+        return LOAD_OPS["player"](client, api, key)
+
+    monkeypatch.setitem(LOAD_OPS, "flaky", flaky)
+    results = bench_load(
+        concurrency=(2,), requests=30, workload={"flaky": 1}, players=1_000, keys=30
+    )
+
+    assert len({result.errors for result in results}) == 1
+    for result in results:
+        assert result.requests == 30
+        assert 0 < result.errors < 30
+        assert result.retries == 0
+
+
+def test_bench_load_rejects_unknown_ops() -> None:
+    with pytest.raises(ValueError, match="unknown workload ops"):
+        bench_load(workload={"teleport": 1})
+
+
+def test_bench_load_cli_writes_json(tmp_path, capsys) -> None:
+    out = tmp_path / "load.json"
+    argv = ["load", "--mode", "async", "--concurrency", "2", "--requests", "20"]
+    argv += ["--latency-ms", "0", "--players", "1000", "--mix", "war=1,members", "--json", str(out)]
+    assert main(argv) == 0
+
+    rows = json.loads(out.read_text())
+    assert [(row["mode"], row["concurrency"], row["requests"]) for row in rows] == [
+        ("async", 2, 20)
+    ]
+    assert "async: peak" in capsys.readouterr().out
@@ -1,12 +1,19 @@
+import asyncio
+
 import httpx
 import pytest
 
 from coc_api_wrapper import (
     AsyncCoCClient,
     BotError,
+    DeadlineExceeded,
+    NotFound,
+    RateLimited,
     format_bot_error,
     safe_await,
     safe_await_with_retry,
+    safe_call,
+    safe_gather,
 )
 
 
@@ -67,3 +74,73 @@ def test_format_bot_error_uses_env_default(monkeypatch: pytest.MonkeyPatch) -> N
     monkeypatch.setenv("BOT_LOCALE", "en")
     error = BotError(kind="not_found")
     assert format_bot_error(error) == "Nothing found for this tag."
+
+
+def test_format_bot_error_timeout() -> None:
+    result = safe_call(lambda: (_ for _ in ()).throw(DeadlineExceeded("Deadline exceeded")))
+    assert result.error == BotError(kind="timeout")
+    assert format_bot_error(result.error, locale="en") == (
+        "CoC API did not respond in time. Try again later."
+    )
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def time(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        target = self.now + seconds
+        await asyncio.sleep(0)
+        self.now = max(self.now, target)
+
+
+def limited_until(clock: FakeClock, value: str, until: float):
+    async def factory() -> str:
+        await asyncio.sleep(0)
+        if clock.now < until:
+            raise RateLimited("Rate limited", status_code=429, retry_after=until - clock.now)
+        return value
+
+    return factory
+
+
+async def test_safe_gather_shares_one_rate_limit_wait_and_keeps_order() -> None:
+    clock = FakeClock()
+
+    async def missing() -> str:
+        raise NotFound("Not found", status_code=404)
+
+    results = await safe_gather(
+        [
+            limited_until(clock, "clan", 2.0),
+            limited_until(clock, "war", 2.0),
+            missing,
+            limited_until(clock, "raids", 2.0),
+        ],
+        concurrency=2,
+        sleep_fn=clock.sleep,
+        time_fn=clock.time,
+    )
+
+    assert [result.value for result in results] == ["clan", "war", None, "raids"]
+    assert results[2].error is not None and results[2].error.kind == "not_found"
+    assert clock.now == 2.0
+
+
+async def test_safe_gather_stops_retrying_when_wait_budget_is_spent() -> None:
+    clock = FakeClock()
+    results = await safe_gather(
+        [limited_until(clock, "a", 10.0), limited_until(clock, "b", 1.0)],
+        max_wait=5.0,
+        sleep_fn=clock.sleep,
+        time_fn=clock.time,
+    )
+
+    assert [result.ok for result in results] == [False, True]
+    assert results[0].error.retry_after == 10.0
+    assert clock.now == 1.0
@@ -1,4 +1,15 @@
-from coc_api_wrapper.cache import TTLCache
+import httpx
+
+from coc_api_wrapper import CoCClient
+from coc_api_wrapper.cache import CacheStats, TTLCache
+from coc_api_wrapper.cache_policies import (
+    FOREVER,
+    REFERENCE_TTL,
+    CachePolicyRegistry,
+    default_cache_policies,
+    until_end_time,
+)
+from coc_api_wrapper.utils import parse_api_time
 
 
 def test_ttl_cache_expires() -> None:
@@ -13,3 +24,122 @@ def test_ttl_cache_expires() -> None:
 
     now[0] = 2.0
     assert cache.get("k") is None
+
+
+def test_ttl_cache_evicts_least_recently_used() -> None:
+    cache: TTLCache[int] = TTLCache(default_ttl=60.0, max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert len(cache) == 2
+
+
+def test_default_policies_pick_ttl_from_payload() -> None:
+    policies = default_cache_policies()
+    war_path = "/clanwarleagues/wars/%23W"
+    assert policies.ttl_for(war_path, None, {"state": "warEnded"}) == FOREVER
+    assert policies.ttl_for(war_path, None, {"state": "inWar"}) is None
+    assert policies.ttl_for("/leagues/29000022/seasons/2024-01", {"limit": 5}, {}) == FOREVER
+    assert policies.ttl_for("/labels/clans", None, {"items": []}) == REFERENCE_TTL
+    assert policies.ttl_for("/clans/%23A", None, {"tag": "#A"}) is None
+
+
+def test_until_end_time_caps_ttl_at_season_end() -> None:
+    payload = {"endTime": "20240101T001000.000Z"}
+    now = parse_api_time("20240101T000000.000Z").timestamp()
+    assert until_end_time(payload, {}, time_fn=lambda: now) == 600.0
+    assert until_end_time(payload, {}, time_fn=lambda: now + 3600) is None
+
+
+def test_client_caches_by_policy() -> None:
+    calls = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        return httpx.Response(200, json={"tag": "%23A", "name": "Clan"})
+
+    policies = CachePolicyRegistry()
+    policies.register("/clans/{tag}", ttl=0)
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.Client(transport=transport, base_url="https://api.clashofclans.com/v1")
+    client = CoCClient(token="token", client=http_client, cache_policies=policies)
+
+    client.get_clan("#A")
+    client.get_clan("#A")
+    assert calls["n"] == 2
+
+
+def test_client_refresh_bypasses_and_replaces_cache() -> None:
+    calls = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        return httpx.Response(200, json={"tag": "#A", "name": f"Clan {calls['n']}"})
+
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.Client(transport=transport, base_url="https://api.clashofclans.com/v1")
+    client = CoCClient(token="token", client=http_client, cache_ttl=60.0)
+
+    assert client.cache_ttl("/clans/#A") is None
+    assert client.get_clan("#A").name == "Clan 1"
+    assert client.refresh("/clans/#A")["name"] == "Clan 2"
+    assert client.get_clan("#A").name == "Clan 2"
+    assert calls["n"] == 2
+    ttl = client.cache_ttl("/clans/%23A")
+    assert ttl is not None and 59 < ttl <= 60
+
+
+def test_ttl_cache_accounts_per_template() -> None:
+    now = [0.0]
+    cache: TTLCache[dict[str, int]] = TTLCache(
+        default_ttl=10.0, max_entries=3, time_fn=lambda: now[0]
+    )
+    cache.set("GET /players/%23A", {}, size=500)
+    cache.set("GET /players/%23B", {}, size=300, ttl=1.0)
+    cache.set("GET /clans/%23C?limit=5", {}, size=200)
+    assert cache.get("GET /players/%23A") == {}
+    assert cache.get("GET /players/%23Z") is None
+
+    now[0] = 2.0
+    assert cache.get("GET /players/%23B") is None
+    cache.set("GET /clans/%23D", {}, size=100)
+    cache.set("GET /clans/%23E", {}, size=50)
+
+    per_template = cache.template_stats()
+    assert per_template["/players/{tag}"] == CacheStats(
+        entries=1, hits=1, misses=2, bytes=500, expirations=1, evictions=0
+    )
+    assert per_template["/clans/{tag}"] == CacheStats(
+        entries=2, hits=0, misses=0, bytes=150, expirations=0, evictions=1
+    )
+    assert cache.stats() == CacheStats(
+        entries=3, hits=1, misses=2, bytes=650, expirations=1, evictions=1
+    )
+    assert [entry.key for entry in cache.top_keys(2)] == ["GET /players/%23A", "GET /clans/%23D"]
+
+
+def test_client_exports_cache_stats_by_template() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"tag": "#A", "name": "Clan"})
+
+    http_client = httpx.Client(
+        transport=httpx.MockTransport(handler),
+        base_url="https://api.clashofclans.com/v1",
+    )
+    client = CoCClient(token="token", client=http_client)
+    client.get_clan("#A")
+    client.get_clan("#A")
+    client.get_player("#B")
+
+    exported: dict[tuple[str, str], CacheStats] = {}
+    client.export_cache_stats(
+        lambda name, template, stats: exported.update({(name, template): stats})
+    )
+
+    clans = exported["responses", "/clans/{tag}"]
+    assert (clans.entries, clans.hits, clans.misses) == (1, 1, 1)
+    assert clans.bytes == len(b'{"tag":"#A","name":"Clan"}')
+    assert client.cache_top_keys(1, by="hits")[0].key == "GET /clans/%23A"
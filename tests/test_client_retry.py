@@ -1,8 +1,8 @@
 import httpx
 import pytest
 
-from coc_api_wrapper import CoCClient
-from coc_api_wrapper.exceptions import NotFound, RateLimited
+from coc_api_wrapper import CoCClient, time_budget
+from coc_api_wrapper.exceptions import DeadlineExceeded, NotFound, RateLimited
 
 
 def test_client_retries_on_5xx_then_succeeds() -> None:
@@ -62,3 +62,100 @@ def test_client_not_found_raises() -> None:
 
     with pytest.raises(NotFound):
         client.get_player("#missing")
+
+
+def test_client_gives_up_when_retry_after_exceeds_budget() -> None:
+    calls = {"n": 0, "slept": []}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        return httpx.Response(429, headers={"Retry-After": "5"}, json={"reason": "limit"})
+
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.Client(transport=transport, base_url="https://api.clashofclans.com/v1")
+    client = CoCClient(
+        token="token",
+        client=http_client,
+        max_retries=3,
+        sleep_fn=calls["slept"].append,
+    )
+
+    with pytest.raises(DeadlineExceeded) as exc, time_budget(1.0):
+        client.get_clan("#abc")
+    assert exc.value.status_code == 429
+    assert calls["n"] == 1
+    assert calls["slept"] == []
+
+
+def test_client_shrinks_attempt_timeout_to_remaining_budget() -> None:
+    seen: list[float] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.extensions["timeout"]["read"])
+        return httpx.Response(200, json={"tag": "%23ABC", "name": "Test Clan"})
+
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.Client(transport=transport, base_url="https://api.clashofclans.com/v1")
+    client = CoCClient(token="token", client=http_client, timeout=10.0, total_timeout=2.0)
+
+    client.get_clan("#abc")
+    assert 0 < seen[0] <= 2.0
+
+
+def test_client_caps_attempt_timeout_when_user_client_defaults_longer() -> None:
+    seen: list[float] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.extensions["timeout"]["read"])
+        return httpx.Response(200, json={"tag": "%23ABC", "name": "Test Clan"})
+
+    http_client = httpx.Client(
+        transport=httpx.MockTransport(handler),
+        base_url="https://api.clashofclans.com/v1",
+        timeout=60.0,
+    )
+    client = CoCClient(token="token", client=http_client, timeout=5.0, total_timeout=30.0)
+
+    client.get_clan("#abc")
+    assert seen == [5.0]
+
+
+def test_client_negative_cache_reraises_not_found_locally() -> None:
+    now = [0.0]
+    calls = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        return httpx.Response(404, json={"reason": "notFound"})
+
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.Client(transport=transport, base_url="https://api.clashofclans.com/v1")
+    client = CoCClient(token="token", client=http_client, max_retries=0, negative_cache_ttl=5.0)
+    client._not_found._time_fn = lambda: now[0]
+
+    for _ in range(3):
+        with pytest.raises(NotFound) as exc:
+            client.get_player("#missing")
+    assert exc.value.status_code == 404
+    assert calls["n"] == 1
+    stats = client.cache_stats()
+    assert stats["not_found"].hits == 2
+    assert stats["responses"].hits == 0
+
+    now[0] = 6.0
+    with pytest.raises(NotFound):
+        client.get_player("#missing")
+    assert calls["n"] == 2
+
+
+def test_client_rejects_impossible_tags_without_request() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("no request expected")
+
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.Client(transport=transport, base_url="https://api.clashofclans.com/v1")
+    client = CoCClient(token="token", client=http_client, validate_tags=True)
+
+    with pytest.raises(NotFound) as exc:
+        client.get_player("#HELLO")
+    assert exc.value.payload == {"reason": "invalidTag", "tag": "%23HELLO"}
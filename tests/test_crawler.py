@@ -0,0 +1,151 @@
+import csv
+import json
+import os
+import threading
+
+import httpx
+import pytest
+
+from coc_api_wrapper import APIError, AsyncCoCClient, LeaderboardCrawler
+
+LOCATIONS = [
+    {"id": 32000000, "name": "Europe", "isCountry": False},
+    {"id": 32000006, "name": "International", "isCountry": False},
+    {"id": 32000218, "name": "Russia", "isCountry": True, "countryCode": "RU"},
+]
+
+
+def make_client(handler) -> AsyncCoCClient:
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.AsyncClient(transport=transport, base_url="https://api.clashofclans.com/v1")
+    return AsyncCoCClient(token="token", client=http_client, max_retries=0, cache_enabled=False)
+
+
+def rankings_handler(calls: list[str], fail: set[str] = frozenset()):
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        calls.append(path)
+        if path == "/v1/locations":
+            return httpx.Response(200, json={"items": LOCATIONS})
+        if path in fail:
+            return httpx.Response(503, json={"reason": "inMaintenance"})
+        location_id = int(path.split("/")[3])
+        kind = path.rsplit("/", 1)[1]
+        if kind == "capital" and location_id == 32000006:
+            return httpx.Response(404, json={"reason": "notFound"})
+        items = [
+            {
+                "tag": f"#{kind[0].upper()}{location_id % 1000}{rank}",
+                "name": f"{kind} {rank}",
+                "rank": rank,
+                "previousRank": rank + 1,
+                "trophies": 6000 - rank,
+                "clanPoints": 50000 - rank,
+                "capitalPoints": 4000 - rank,
+                "clan": {"tag": "#CLAN", "name": "Clan"},
+            }
+            for rank in (1, 2)
+        ]
+        return httpx.Response(200, json={"items": items})
+
+    return handler
+
+
+def read_ndjson(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+async def test_crawler_streams_rows_for_every_location_and_kind(tmp_path) -> None:
+    calls: list[str] = []
+    async with make_client(rankings_handler(calls)) as client:
+        result = await client.crawl_leaderboards(tmp_path, concurrency=2)
+
+    assert (result.units, result.fetched, result.resumed, result.missing) == (9, 9, 0, 1)
+    assert result.rows == 16
+    players = read_ndjson(tmp_path / "players.ndjson")
+    assert len(players) == 6
+    assert players[0].keys() >= {"location_id", "location_name", "rank", "clan_tag"}
+    assert {row["clan_tag"] for row in players} == {"#CLAN"}
+    capital = read_ndjson(tmp_path / "capital.ndjson")
+    assert {row["location_id"] for row in capital} == {32000000, 32000218}
+
+
+async def test_crawler_fsyncs_off_the_event_loop(tmp_path, monkeypatch) -> None:
+    real_fsync = os.fsync
+    threads: list[threading.Thread] = []
+
+    def fsync(fd: int) -> None:
+        threads.append(threading.current_thread())
+        real_fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", fsync)
+    async with make_client(rankings_handler([])) as client:
+        result = await client.crawl_leaderboards(tmp_path, concurrency=4)
+
+    assert len(threads) == 8
+    assert threading.main_thread() not in threads
+    checkpoint = json.loads((tmp_path / "checkpoint.json").read_text(encoding="utf-8"))
+    assert checkpoint["sizes"]["players"] == (tmp_path / "players.ndjson").stat().st_size
+    assert result.rows == 16
+
+
+async def test_crawler_resumes_from_checkpoint_after_failure(tmp_path) -> None:
+    calls: list[str] = []
+    broken = {"/v1/locations/32000218/rankings/players"}
+    async with make_client(rankings_handler(calls, broken)) as client:
+        with pytest.raises(APIError):
+            await client.crawl_leaderboards(tmp_path, kinds=["players"], concurrency=1)
+
+    checkpoint = json.loads((tmp_path / "checkpoint.json").read_text())
+    assert checkpoint["done"] == ["players:32000000", "players:32000006"]
+    with open(tmp_path / "players.ndjson", "a", encoding="utf-8") as handle:
+        handle.write('{"half-written":')
+
+    calls.clear()
+    async with make_client(rankings_handler(calls)) as client:
+        result = await client.crawl_leaderboards(tmp_path, kinds=["players"])
+
+    assert calls == ["/v1/locations", "/v1/locations/32000218/rankings/players"]
+    assert (result.units, result.fetched, result.resumed) == (3, 1, 2)
+    rows = read_ndjson(tmp_path / "players.ndjson")
+    assert [row["location_id"] for row in rows] == [32000000] * 2 + [32000006] * 2 + [32000218] * 2
+
+
+async def test_crawler_writes_csv_with_header(tmp_path) -> None:
+    async with make_client(rankings_handler([])) as client:
+        crawler = LeaderboardCrawler(
+            client, tmp_path, output_format="csv", kinds=["clans"], countries_only=True
+        )
+        result = await crawler.run()
+
+    assert result.units == 1
+    with open(tmp_path / "clans.csv", encoding="utf-8", newline="") as handle:
+        rows = list(csv.DictReader(handle))
+    assert [row["rank"] for row in rows] == ["1", "2"]
+    assert rows[0]["clan_points"] == "49999"
+
+
+async def test_crawler_writes_parquet_parts(tmp_path) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    async with make_client(rankings_handler([])) as client:
+        await client.crawl_leaderboards(tmp_path, output_format="parquet", kinds=["capital"])
+
+    table = pq.read_table(tmp_path / "capital")
+    assert table.num_rows == 4
+    assert sorted(set(table.column("location_id").to_pylist())) == [32000000, 32000218]
+
+
+async def test_crawler_rejects_checkpoint_of_other_settings(tmp_path) -> None:
+    async with make_client(rankings_handler([])) as client:
+        await client.crawl_leaderboards(tmp_path, kinds=["clans"])
+        with pytest.raises(ValueError):
+            await client.crawl_leaderboards(tmp_path, output_format="csv", kinds=["clans"])
+        for settings in ({"kinds": ["clans", "players"]}, {"limit": 10}, {"countries_only": True}):
+            with pytest.raises(ValueError, match="resume=False"):
+                await client.crawl_leaderboards(tmp_path, **{"kinds": ["clans"], **settings})
+        resumed = await client.crawl_leaderboards(tmp_path, kinds=["clans"])
+        assert resumed.fetched == 0
+        result = await client.crawl_leaderboards(
+            tmp_path, output_format="csv", kinds=["clans"], resume=False
+        )
+    assert result.fetched == 3
@@ -0,0 +1,99 @@
+import asyncio
+import threading
+
+import httpx
+
+from coc_api_wrapper import AsyncCoCClient, CoCClient
+
+GROUP = {
+    "state": "inWar",
+    "season": "2024-01",
+    "clans": [{"tag": "#A"}, {"tag": "#B"}, {"tag": "#C"}, {"tag": "#D"}],
+    "rounds": [
+        {"warTags": ["#W1", "#W2"]},
+        {"warTags": ["#W3", "#W4"]},
+        {"warTags": ["#0", "#0"]},
+    ],
+}
+
+WARS = {
+    "%23W1": {"state": "warEnded", "clan": {"tag": "#A"}, "opponent": {"tag": "#B"}},
+    "%23W2": {"state": "warEnded", "clan": {"tag": "#C"}, "opponent": {"tag": "#D"}},
+    "%23W3": {"state": "inWar", "clan": {"tag": "#A"}, "opponent": {"tag": "#C"}},
+    "%23W4": {"state": "inWar", "clan": {"tag": "#B"}, "opponent": {"tag": "#D"}},
+}
+
+
+def make_handler(calls: dict[str, int]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.raw_path.decode()
+        calls[path] = calls.get(path, 0) + 1
+        if path.endswith("/currentwar/leaguegroup"):
+            return httpx.Response(200, json=GROUP)
+        war_tag = path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json=WARS[war_tag])
+
+    return handler
+
+
+def test_sync_cwl_season_skips_placeholders_and_keeps_ended_wars() -> None:
+    now = [0.0]
+    calls: dict[str, int] = {}
+    transport = httpx.MockTransport(make_handler(calls))
+    http_client = httpx.Client(transport=transport, base_url="https://api.clashofclans.com/v1")
+    client = CoCClient(token="token", client=http_client, max_retries=0, cache_ttl=1.0)
+    client._cache._time_fn = lambda: now[0]
+
+    season = client.get_cwl_season("#A")
+    assert sorted(season.wars) == ["#W1", "#W2", "#W3", "#W4"]
+    assert [war.state for war in season.round_wars(0)] == ["warEnded", "warEnded"]
+    assert len(season.clan_wars("#a")) == 2
+    assert "/v1/clanwarleagues/wars/%230" not in calls
+
+    now[0] = 10.0
+    client.get_cwl_season("#B")
+    assert calls["/v1/clanwarleagues/wars/%23W1"] == 1
+    assert calls["/v1/clanwarleagues/wars/%23W3"] == 2
+
+
+def test_sync_cwl_season_fetches_wars_in_parallel_when_thread_safe() -> None:
+    calls: dict[str, int] = {}
+    sync_handler = make_handler(calls)
+    barrier = threading.Barrier(4, timeout=5)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "/clanwarleagues/wars/" in request.url.raw_path.decode():
+            # Only passes when all four war requests are in flight at once.
+            barrier.wait()
+        return sync_handler(request)
+
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.Client(transport=transport, base_url="https://api.clashofclans.com/v1")
+    client = CoCClient(token="token", client=http_client, max_retries=0, thread_safe=True)
+
+    season = client.get_cwl_season("#A", max_workers=4)
+    assert sorted(season.wars) == ["#W1", "#W2", "#W3", "#W4"]
+    assert season.wars["#W3"].state == "inWar"
+
+
+async def test_async_cwl_season_dedupes_concurrent_clans() -> None:
+    calls: dict[str, int] = {}
+    sync_handler = make_handler(calls)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        return sync_handler(request)
+
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.AsyncClient(transport=transport, base_url="https://api.clashofclans.com/v1")
+    async with AsyncCoCClient(token="token", client=http_client, max_retries=0) as client:
+        seasons = await asyncio.gather(
+            client.get_cwl_season("#A"),
+            client.get_cwl_season("#B"),
+            client.get_cwl_season("#C"),
+        )
+
+    assert all(len(season.wars) == 4 for season in seasons)
+    assert all(
+        count == 1 for path, count in calls.items() if path.startswith("/v1/clanwarleagues/")
+    )
@@ -0,0 +1,140 @@
+import asyncio
+
+import httpx
+import pytest
+
+from coc_api_wrapper.adapters.discord import (
+    DiscordCoC,
+    release_shared_client,
+    shared_client,
+    should_defer,
+)
+from coc_api_wrapper.latency import LatencyTracker
+
+
+class FakeResponse:
+    def __init__(self, log: list[tuple]) -> None:
+        self._log = log
+        self._done = False
+
+    def is_done(self) -> bool:
+        return self._done
+
+    async def defer(self, **kwargs) -> None:
+        self._done = True
+        self._log.append(("defer", kwargs))
+
+    async def send_message(self, **kwargs) -> None:
+        self._done = True
+        self._log.append(("send_message", kwargs))
+
+
+class FakeFollowup:
+    def __init__(self, log: list[tuple]) -> None:
+        self._log = log
+
+    async def send(self, **kwargs) -> None:
+        self._log.append(("followup", kwargs))
+
+
+class FakeInteraction:
+    def __init__(self) -> None:
+        self.log: list[tuple] = []
+        self.response = FakeResponse(self.log)
+        self.followup = FakeFollowup(self.log)
+
+
+def http_client(delay: float = 0.0) -> httpx.AsyncClient:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(delay)
+        if request.url.raw_path.endswith(b"%23GONE"):
+            return httpx.Response(404, json={"reason": "notFound"})
+        return httpx.Response(200, json={"tag": "#P", "name": "Alice"})
+
+    return httpx.AsyncClient(
+        transport=httpx.MockTransport(handler),
+        base_url="https://api.clashofclans.com/v1",
+    )
+
+
+def test_should_defer_uses_latency_percentile() -> None:
+    latency = LatencyTracker()
+    assert not should_defer(latency, 0.0)
+    for _ in range(10):
+        latency.record(2.5)
+    assert should_defer(latency, 0.0)
+    assert not should_defer(latency, 0.0, margin=0.0)
+
+
+async def test_cached_reply_is_sent_without_defer() -> None:
+    async with DiscordCoC("token-a", client=http_client(), max_retries=0) as coc:
+
+        @coc.command()
+        async def player(interaction, tag: str) -> str:
+            return (await coc.client.get_player(tag)).name
+
+        await coc.client.get_player("#P")
+        interaction = FakeInteraction()
+        await player(interaction, "#P")
+
+    assert interaction.log == [("send_message", {"ephemeral": False, "content": "Alice"})]
+
+
+async def test_slow_fetch_defers_and_uses_followup() -> None:
+    coc = DiscordCoC("token-b", window=0.2, margin=0.1, client=http_client(0.3), max_retries=0)
+    async with coc:
+        interaction = FakeInteraction()
+
+        async def produce() -> dict:
+            return {"content": (await coc.client.get_player("#P")).name}
+
+        await coc.respond(interaction, produce, ephemeral=True)
+
+    assert [entry[0] for entry in interaction.log] == ["defer", "followup"]
+    assert interaction.log[1][1] == {"ephemeral": True, "content": "Alice"}
+
+
+async def test_high_observed_latency_defers_immediately() -> None:
+    async with DiscordCoC("token-c", client=http_client(0.05), max_retries=0) as coc:
+        for _ in range(5):
+            coc.client.latency.record(5.0)
+        interaction = FakeInteraction()
+
+        async def produce() -> str:
+            return (await coc.client.get_player("#P")).name
+
+        await coc.respond(interaction, produce)
+
+    assert interaction.log[0] == ("defer", {"ephemeral": False, "thinking": True})
+
+
+async def test_api_errors_become_ephemeral_messages() -> None:
+    async with DiscordCoC("token-d", locale="en", client=http_client(), max_retries=0) as coc:
+        interaction = FakeInteraction()
+
+        async def produce() -> str:
+            return (await coc.client.get_player("#GONE")).name
+
+        await coc.respond(interaction, produce)
+
+    assert interaction.log == [
+        ("send_message", {"ephemeral": True, "content": "Nothing found for this tag."})
+    ]
+
+
+async def test_bots_in_one_process_share_a_client() -> None:
+    first = DiscordCoC("token-e", client=http_client())
+    second = DiscordCoC("token-e")
+    await first.start()
+    await second.start()
+    assert first.client is second.client
+    with pytest.raises(ValueError, match="other arguments"):
+        shared_client("token-e", max_concurrency=4)
+    client = first.client
+    await first.close()
+    assert not client._client.is_closed
+    await second.close()
+    assert client._client.is_closed
+    fresh = shared_client("token-e", client=http_client())
+    assert fresh is not client
+    await release_shared_client(fresh)
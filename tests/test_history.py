@@ -0,0 +1,57 @@
+import pytest
+
+from coc_api_wrapper.models import Player
+from coc_api_wrapper.utils import decode_tag
+
+np = pytest.importorskip("numpy")
+
+from coc_api_wrapper.history import PlayerHistory  # noqa: E402
+
+
+def player(tag: str, trophies: int, th: int = 14, exp: int = 200) -> Player:
+    return Player.model_validate(
+        {"tag": tag, "name": "P", "trophies": trophies, "townHallLevel": th, "expLevel": exp}
+    )
+
+
+def test_history_stores_only_changed_fields(tmp_path) -> None:
+    with PlayerHistory(tmp_path / "h") as history:
+        assert history.record(player("#2PP", 5000), timestamp=100) == 3
+        assert history.record(player("#2PP", 5000), timestamp=200) == 0
+        assert history.record(player("#2PP", 5030), timestamp=300) == 1
+        assert len(history) == 4
+        ts, values = history.series("#2PP", "trophies")
+        assert ts.tolist() == [100, 300]
+        assert values.tolist() == [5000, 5030]
+
+
+def test_history_changes_since_is_vectorized_per_tag(tmp_path) -> None:
+    with PlayerHistory(tmp_path / "h") as history:
+        history.record_many([player("#2PP", 5000), player("#8QU", 4000)], timestamp=100)
+        history.record_many([player("#2PP", 5100), player("#8QU", 3950)], timestamp=200)
+        history.record_many([player("#2PP", 5150), player("#9Y", 10)], timestamp=300)
+
+        tags, deltas = history.changes_since("trophies", 150)
+        changes = {
+            decode_tag(int(tag)): int(delta) for tag, delta in zip(tags, deltas, strict=True)
+        }
+        assert changes == {"#2PP": 150, "#8QU": -50, "#9Y": 0}
+
+        _, deltas = history.changes_since("trophies", 0, tags=["#2PP"])
+        assert deltas.tolist() == [150]
+
+        with pytest.raises(ValueError):
+            history.record(player("#2PP", 1), timestamp=50)
+
+
+def test_history_reopens_and_resumes_deltas(tmp_path) -> None:
+    with PlayerHistory(tmp_path / "h") as history:
+        history.record(player("#2PP", 5000), timestamp=100)
+
+    with PlayerHistory(tmp_path / "h") as history:
+        assert history.record(player("#2PP", 5000), timestamp=200) == 0
+        _, values = history.latest("town_hall_level")
+        assert values.tolist() == [14]
+
+    with pytest.raises(ValueError):
+        PlayerHistory(tmp_path / "h", fields=("trophies",))
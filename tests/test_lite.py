@@ -0,0 +1,66 @@
+import httpx
+
+from coc_api_wrapper import AsyncCoCClient, CoCClient
+from coc_api_wrapper.bench import bench_models
+from coc_api_wrapper.lite import LiteClanMember, LitePlayerRanking, LiteWarLogEntry
+from coc_api_wrapper.models import ClanMember
+
+MEMBERS = [
+    {"tag": f"#M{i}", "name": f"M{i}", "townHallLevel": 15, "league": {"id": 7}} for i in range(5)
+]
+
+
+def members_handler(calls: list[dict]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = dict(request.url.params)
+        calls.append(params)
+        start = int(params.get("after", 0))
+        limit = int(params.get("limit", len(MEMBERS)))
+        paging = {"cursors": {"after": str(start + limit)}} if start + limit < len(MEMBERS) else {}
+        return httpx.Response(200, json={"items": MEMBERS[start : start + limit], "paging": paging})
+
+    return handler
+
+
+def test_lite_models_flatten_nested_payloads() -> None:
+    ranking = LitePlayerRanking.from_payload(
+        {"tag": "#P", "rank": 1, "clan": {"tag": "#C", "name": "C"}, "league": {"id": 29000022}}
+    )
+    assert (ranking.clan_tag, ranking.clan_name, ranking.league_id) == ("#C", "C", 29000022)
+    entry = LiteWarLogEntry.from_payload(
+        {"result": "win", "opponent": {"tag": "#O", "stars": 30, "destructionPercentage": 75.5}}
+    )
+    assert (entry.opponent_tag, entry.opponent_stars, entry.clan_tag) == ("#O", 30, None)
+    assert not hasattr(entry, "__dict__")
+
+
+def test_sync_iter_clan_members_walks_pages_and_returns_lite_rows() -> None:
+    calls: list[dict] = []
+    transport = httpx.MockTransport(members_handler(calls))
+    http_client = httpx.Client(transport=transport, base_url="https://api.clashofclans.com/v1")
+    with CoCClient(token="token", client=http_client, max_retries=0, lite_models=True) as client:
+        rows = list(client.iter_clan_members("#CLAN", page_size=2))
+        full = list(client.iter_clan_members("#CLAN", page_size=2, lite=False))
+
+    assert [row.tag for row in rows] == [m["tag"] for m in MEMBERS]
+    assert all(isinstance(row, LiteClanMember) for row in rows)
+    assert rows[0].league_id == 7
+    assert all(isinstance(row, ClanMember) for row in full)
+    assert [call.get("after") for call in calls[:3]] == [None, "2", "4"]
+
+
+async def test_async_iter_clan_members_defaults_to_pydantic() -> None:
+    transport = httpx.MockTransport(members_handler([]))
+    http_client = httpx.AsyncClient(transport=transport, base_url="https://api.clashofclans.com/v1")
+    async with AsyncCoCClient(token="token", client=http_client, max_retries=0) as client:
+        rows = [row async for row in client.iter_clan_members("#CLAN", page_size=3)]
+        lite = [row async for row in client.iter_clan_members("#CLAN", lite=True)]
+
+    assert [row.town_hall_level for row in rows] == [15] * 5
+    assert all(isinstance(row, LiteClanMember) for row in lite)
+
+
+def test_bench_models_reports_both_layers() -> None:
+    results = bench_models(["clan_members"], rows=50, repeat=1)
+    assert [result.layer for result in results] == ["pydantic", "lite"]
+    assert all(result.rows_per_second > 0 and result.bytes_per_row > 0 for result in results)
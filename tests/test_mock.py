@@ -0,0 +1,128 @@
+import random
+
+import httpx
+import pytest
+
+from coc_api_wrapper import (
+    AsyncCoCClient,
+    CoCClient,
+    NotFound,
+    RateLimited,
+    ServerError,
+    Unauthorized,
+)
+from coc_api_wrapper.mock import LatencyProfile, MockCoCAPI
+
+
+def sync_client(api: MockCoCAPI, **kwargs: object) -> CoCClient:
+    http = httpx.Client(transport=api.sync_transport(), base_url="https://api.clashofclans.com/v1")
+    return CoCClient("token", client=http, **kwargs)
+
+
+def test_mock_data_is_deterministic_and_consistent() -> None:
+    api = MockCoCAPI(seed=7, players=10_000)
+    again = MockCoCAPI(seed=7, players=10_000)
+    tag = api.clan_tag(3).replace("#", "%23")
+    assert api.respond("GET", f"/v1/clans/{tag}").body == again.respond("GET", f"/clans/{tag}").body
+    assert (
+        api.respond("GET", f"/v1/clans/{tag}").body
+        != MockCoCAPI(seed=8).respond("GET", f"/v1/clans/{tag}").body
+    )
+
+    client = sync_client(api)
+    clan = client.get_clan(api.clan_tag(3))
+    assert clan.member_list is not None
+    assert clan.members == len(clan.member_list)
+    player = client.get_player(clan.member_list[-1].tag)
+    assert player.clan is not None and player.clan.tag == clan.tag
+
+    group = client.get_cwl_group(clan.tag)
+    assert group.clans is not None and clan.tag in {c.tag for c in group.clans}
+    assert group.rounds is not None and len(group.rounds) == 7
+    war = client.get_cwl_war(group.rounds[0].war_tags[0])  # type: ignore[index]
+    assert war.clan is not None and war.opponent is not None
+    assert war.clan.tag != war.opponent.tag
+
+    with pytest.raises(NotFound):
+        client.get_player(api.player_tag(10_000))
+    with pytest.raises(NotFound):
+        client.get_league_seasons(29000001)
+    assert api.cpu_time > 0
+    api.reset_stats()
+    assert api.cpu_time == 0.0
+
+
+def test_mock_paginates_rankings_with_cursors() -> None:
+    api = MockCoCAPI(players=50_000, ranking_size=120)
+    client = sync_client(api)
+    location = api.location_ids()[8]
+
+    tags: list[str | None] = []
+    after = None
+    while True:
+        page = client.get_location_player_rankings(location, limit=50, after=after)
+        tags.extend(item.tag for item in page.items)
+        after = page.paging.cursors.after if page.paging and page.paging.cursors else None
+        if after is None:
+            break
+    assert len(tags) == len(set(tags)) == 120
+    ranks = [item.rank for item in client.get_location_player_rankings(location).items]
+    assert ranks == list(range(1, 121))
+
+    season = client.get_league_season(29000022, "2023-12", limit=3)
+    assert [item.rank for item in season.items] == [1, 2, 3]
+    assert len(client.get_league_seasons(29000022).items) > 100
+    assert len(client.get_leagues().items) == 23
+    assert client.get_current_goldpass().start_time == "20240101T000000.000Z"
+
+
+def test_mock_injects_faults() -> None:
+    with pytest.raises(RateLimited) as throttled:
+        sync_client(MockCoCAPI(throttle_rate=1.0, retry_after=4), max_retries=0).get_leagues()
+    assert throttled.value.retry_after == 4
+
+    broken = MockCoCAPI(error_rate=1.0)
+    with pytest.raises(ServerError):
+        sync_client(broken, max_retries=0).get_leagues()
+    assert set(broken.status_counts()) <= {500, 503}
+
+    with pytest.raises(Unauthorized):
+        sync_client(MockCoCAPI(token="secret")).get_leagues()
+
+    now = [0.0]
+    limited = MockCoCAPI(rate_limit=2, time_fn=lambda: now[0])
+    statuses = [limited.respond("GET", "/v1/leagues").status for _ in range(3)]
+    now[0] += 0.5
+    statuses.append(limited.respond("GET", "/v1/leagues").status)
+    assert statuses == [200, 200, 429, 200]
+    assert limited.requests == 4
+    assert limited.status_counts() == {200: 3, 429: 1}
+
+
+def test_latency_profile_is_capped() -> None:
+    profile = LatencyProfile(median=0.05, sigma=2.0, max=0.1)
+    samples = [profile.sample(random.Random(seed)) for seed in range(200)]
+    assert max(samples) == 0.1
+    assert LatencyProfile().sample(random.Random(0)) == 0.0
+
+
+async def test_mock_serves_over_http_and_async_transport() -> None:
+    api = MockCoCAPI(players=1_000, latency=LatencyProfile(median=0.001, max=0.002))
+    server = api.server()
+    await server.start()
+    try:
+        async with httpx.AsyncClient(base_url=f"{server.base_url}/v1") as http:
+            response = await http.get("/labels/clans", params={"limit": 2})
+        assert response.status_code == 200
+        assert [label["id"] for label in response.json()["items"]] == [56000000, 56000001]
+    finally:
+        await server.stop()
+
+    http = httpx.AsyncClient(
+        transport=api.async_transport(), base_url="https://api.clashofclans.com/v1"
+    )
+    async with AsyncCoCClient("token", client=http) as client:
+        war = await client.get_current_war(api.clan_tag(1))
+        raids = await client.get_capital_raids(api.clan_tag(1), limit=5)
+    assert war.state is not None
+    assert len(raids.items) == 5
@@ -0,0 +1,97 @@
+import httpx
+
+from coc_api_wrapper import CoCClient
+from coc_api_wrapper.models import Clan, ClanMember, Player
+from coc_api_wrapper.projection import CacheProjection, model_projection, project
+
+PLAYER = {
+    "tag": "#P",
+    "name": "Alice",
+    "townHallLevel": 15,
+    "expLevel": 220,
+    "trophies": 5100,
+    "clan": {"tag": "#C", "name": "Clan", "clanLevel": 20, "badgeUrls": {"small": "s"}},
+    "league": {"id": 29000022, "name": "Legend League", "iconUrls": {"tiny": "t"}},
+    "troops": [{"name": f"Troop {i}", "level": i, "village": "home"} for i in range(60)],
+    "achievements": [{"name": f"A{i}", "info": "x" * 80} for i in range(40)],
+    "labels": [{"id": 1, "name": "Active"}],
+}
+
+MEMBERS = {
+    "items": [{"tag": "#P", "name": "Alice", "role": "leader", "donations": 100}],
+    "paging": {"cursors": {"after": "abc"}},
+}
+
+
+def test_model_projection_follows_aliases_and_nesting() -> None:
+    clan = model_projection(Clan)
+    assert set(clan) == {
+        "tag",
+        "name",
+        "clanLevel",
+        "members",
+        "description",
+        "badgeUrls",
+        "location",
+        "memberList",
+    }
+    assert clan["memberList"] == model_projection(ClanMember)
+    assert clan["location"] == {"id": None, "name": None, "isCountry": None, "countryCode": None}
+    assert project({"a": [{"b": 1, "c": 2}], "d": 3}, {"a": {"b": None}}) == {"a": [{"b": 1}]}
+
+
+def test_client_caches_only_model_fields() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.raw_path.startswith(b"/v1/players/"):
+            return httpx.Response(200, json=PLAYER)
+        return httpx.Response(200, json=MEMBERS)
+
+    http_client = httpx.Client(
+        transport=httpx.MockTransport(handler),
+        base_url="https://api.clashofclans.com/v1",
+    )
+    client = CoCClient(token="token", client=http_client, cache_projection=CacheProjection())
+
+    fresh = client.get_player("#P")
+    cached = client.get_player("#P")
+    assert fresh == cached == Player.model_validate(PLAYER)
+    stored = client._cache.get("GET /players/%23P")
+    assert stored is not None
+    assert "troops" not in stored
+    assert stored["league"] == {"id": 29000022, "name": "Legend League", "iconUrls": {}}
+
+    page = client.get_clan_members("#C")
+    assert page.after == "abc"
+    assert "donations" not in client._cache.get("GET /clans/%23C/members")["items"][0]
+
+    stats = client.cache_template_stats()["responses"]["/players/{tag}"]
+    assert stats.bytes * 5 < len(httpx.Response(200, json=PLAYER).content)
+
+
+def test_clan_projection_drops_member_list_unless_requested() -> None:
+    members = [
+        {"tag": f"#M{i}", "name": f"Member {i}", "role": "member", "expLevel": 100}
+        for i in range(50)
+    ]
+    clan = {"tag": "#C", "name": "Clan", "clanLevel": 20, "members": 50, "memberList": members}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=clan)
+
+    def make_client(projection: CacheProjection) -> CoCClient:
+        http_client = httpx.Client(
+            transport=httpx.MockTransport(handler),
+            base_url="https://api.clashofclans.com/v1",
+        )
+        return CoCClient(token="token", client=http_client, cache_projection=projection)
+
+    lean = make_client(CacheProjection())
+    assert lean.get_clan("#C").member_list is None
+    stored = lean._cache.get("GET /clans/%23C")
+    assert stored is not None
+    assert set(stored) == {"tag", "name", "clanLevel", "members"}
+    assert lean.cache_stats()["responses"].bytes * 10 < len(httpx.Response(200, json=clan).content)
+
+    full = make_client(CacheProjection(exclude={}))
+    roster = full.get_clan("#C").member_list
+    assert roster is not None and len(roster) == 50
@@ -0,0 +1,82 @@
+import httpx
+
+from coc_api_wrapper import AsyncCoCClient
+from coc_api_wrapper.proxy import CoCProxy
+from coc_api_wrapper.tokens import TokenPool
+
+
+def upstream(calls: list[tuple[str, str]]) -> httpx.AsyncClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.raw_path.decode()
+        calls.append((path, request.headers["Authorization"]))
+        if path.startswith("/v1/clans/%23GONE"):
+            return httpx.Response(404, json={"reason": "notFound"})
+        if path.startswith("/v1/players/"):
+            return httpx.Response(429, headers={"Retry-After": "7"}, json={"reason": "throttled"})
+        return httpx.Response(
+            200,
+            headers={"Cache-Control": "public max-age=30"},
+            json={"tag": "#2PP", "name": "Clan"},
+        )
+
+    return httpx.AsyncClient(
+        transport=httpx.MockTransport(handler),
+        base_url="https://api.clashofclans.com/v1",
+        auth=TokenPool(["t1", "t2"]),
+    )
+
+
+async def test_proxy_serves_shared_cached_bytes_and_forwards_errors() -> None:
+    calls: list[tuple[str, str]] = []
+    client = AsyncCoCClient("t1", client=upstream(calls), max_retries=0)
+    async with client, CoCProxy(client, port=0) as proxy, httpx.AsyncClient() as http:
+        first = await http.get(f"{proxy.url}/clans/%232PP", params={"limit": 5})
+        second = await http.get(f"{proxy.url}/clans/%232PP?limit=5")
+        labelled = await http.get(f"{proxy.url}/clans?labelIds=1&labelIds=2&limit=3")
+        missing = await http.get(f"{proxy.url}/clans/%23GONE")
+        limited = await http.get(f"{proxy.url}/players/%23P")
+        rejected = await http.post(f"{proxy.url}/clans/%232PP")
+        host, port = proxy.address
+        stats = (await http.get(f"http://{host}:{port}/_proxy/stats")).json()
+
+    assert first.status_code == second.status_code == 200
+    assert first.content == second.content == b'{"tag":"#2PP","name":"Clan"}'
+    assert first.headers["content-type"] == "application/json"
+    assert first.headers["cache-control"] == second.headers["cache-control"] == "public max-age=30"
+    assert labelled.status_code == 200
+    assert missing.status_code == 404
+    assert missing.json() == {"reason": "notFound"}
+    assert limited.status_code == 429
+    assert limited.headers["retry-after"] == "7"
+    assert rejected.status_code == 405
+    assert [path for path, _ in calls] == [
+        "/v1/clans/%232PP?limit=5",
+        "/v1/clans?labelIds=1&labelIds=2&limit=3",
+        "/v1/clans/%23GONE",
+        "/v1/players/%23P",
+    ]
+    assert stats["requests"] == 7
+    assert stats["cache"]["raw"]["hits"] == 1
+
+
+def test_token_pool_rotates_and_parks_rate_limited_tokens() -> None:
+    now = [0.0]
+    pool = TokenPool(["a", "b", "c"], time_fn=lambda: now[0])
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        token = request.headers["Authorization"].removeprefix("Bearer ")
+        seen.append(token)
+        if token == "b" and now[0] < 5:
+            return httpx.Response(429, headers={"Retry-After": "5"})
+        return httpx.Response(200, json={})
+
+    with httpx.Client(transport=httpx.MockTransport(handler), auth=pool) as http:
+        for _ in range(5):
+            http.get("https://example.test/")
+        assert pool.available() == 2
+        now[0] = 6.0
+        http.get("https://example.test/")
+
+    assert seen == ["a", "b", "c", "a", "c", "a"]
+    assert pool.available() == 3
@@ -0,0 +1,68 @@
+import asyncio
+import gzip
+import json
+import math
+
+import httpx
+import pytest
+
+from coc_api_wrapper import AsyncCoCClient, CoCClient, NotFound
+
+WAR = {"state": "warEnded", "teamSize": 15, "troops": ["kept as is"]}
+
+
+def handler(calls: list[str]):
+    def handle(request: httpx.Request) -> httpx.Response:
+        path = request.url.raw_path.decode()
+        calls.append(path)
+        if path.startswith("/v1/clanwarleagues/wars/"):
+            body = gzip.compress(json.dumps(WAR).encode())
+            return httpx.Response(
+                200,
+                content=body,
+                headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+            )
+        return httpx.Response(404, json={"reason": "notFound"})
+
+    return handle
+
+
+def test_sync_get_raw_returns_and_caches_body_bytes() -> None:
+    calls: list[str] = []
+    http_client = httpx.Client(
+        transport=httpx.MockTransport(handler(calls)),
+        base_url="https://api.clashofclans.com/v1",
+    )
+    client = CoCClient(token="token", client=http_client, max_retries=0)
+
+    raw = client.get_raw("/clanwarleagues/wars/#8Q")
+    again = client.get_raw("clanwarleagues/wars/%238Q")
+
+    assert again is raw
+    assert calls == ["/v1/clanwarleagues/wars/%238Q"]
+    assert raw.status_code == 200
+    assert raw.json() == WAR
+    assert raw.content_type == "application/json"
+    assert "content-encoding" not in {name.lower() for name in raw.headers}
+    assert client._raw_cache.ttl_remaining("GET /clanwarleagues/wars/%238Q") == math.inf
+    assert client.cache_stats()["raw"].bytes == len(raw.content)
+    assert client.cache_stats()["responses"].entries == 0
+
+    with pytest.raises(NotFound):
+        client.get_raw("/players/#GONE")
+
+
+async def test_async_get_raw_coalesces_and_caches() -> None:
+    calls: list[str] = []
+    http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler(calls)),
+        base_url="https://api.clashofclans.com/v1",
+    )
+    async with AsyncCoCClient(token="token", client=http_client, max_retries=0) as client:
+        first, second = await asyncio.gather(
+            client.get_raw("/clanwarleagues/wars/#8Q"),
+            client.get_raw("/clanwarleagues/wars/#8Q"),
+        )
+        assert first is second
+        assert calls == ["/v1/clanwarleagues/wars/%238Q"]
+        assert first.json() == WAR
@@ -0,0 +1,71 @@
+import asyncio
+
+import httpx
+
+from coc_api_wrapper import AsyncCoCClient, CoCClient
+
+
+def roster_handler(calls: list[str]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.raw_path.decode()
+        calls.append(path)
+        if path.endswith("/members"):
+            members = [{"tag": f"#P{i}", "name": f"M{i}"} for i in range(5)]
+            return httpx.Response(200, json={"items": members})
+        tag = path.rsplit("/", 1)[-1]
+        if tag == "%23P3":
+            return httpx.Response(404, json={"reason": "notFound"})
+        return httpx.Response(200, json={"tag": tag.replace("%23", "#"), "name": tag})
+
+    return handler
+
+
+def test_sync_clan_roster_keeps_member_errors_separate() -> None:
+    calls: list[str] = []
+    transport = httpx.MockTransport(roster_handler(calls))
+    http_client = httpx.Client(transport=transport, base_url="https://api.clashofclans.com/v1")
+    with CoCClient(token="token", client=http_client, max_retries=0) as client:
+        client.get_player("#P0")
+        roster = client.get_clan_roster("#clan", max_workers=4)
+
+    assert len(roster) == 5
+    assert not roster.complete
+    assert sorted(roster.players) == ["%23P0", "%23P1", "%23P2", "%23P4"]
+    assert roster.errors["%23P3"].status_code == 404
+    assert roster.player("#p1") is not None
+    assert [player is None for _, player in roster] == [False, False, False, True, False]
+    assert calls.count("/v1/players/%23P0") == 1
+
+
+def test_sync_clan_roster_fans_out_only_when_thread_safe() -> None:
+    calls: list[str] = []
+    transport = httpx.MockTransport(roster_handler(calls))
+    http_client = httpx.Client(transport=transport, base_url="https://api.clashofclans.com/v1")
+    with CoCClient(token="token", client=http_client, max_retries=0, thread_safe=True) as client:
+        roster = client.get_clan_roster("#clan", max_workers=4)
+
+    assert sorted(roster.players) == ["%23P0", "%23P1", "%23P2", "%23P4"]
+    assert list(roster.errors) == ["%23P3"]
+
+
+async def test_async_clan_roster_fetches_profiles_concurrently() -> None:
+    calls: list[str] = []
+    active = [0, 0]
+    sync_handler = roster_handler(calls)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        active[0] += 1
+        active[1] = max(active[1], active[0])
+        await asyncio.sleep(0.01)
+        active[0] -= 1
+        return sync_handler(request)
+
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.AsyncClient(transport=transport, base_url="https://api.clashofclans.com/v1")
+    async with AsyncCoCClient(token="token", client=http_client, max_retries=0) as client:
+        roster = await client.get_clan_roster("#CLAN", concurrency=3)
+
+    assert roster.clan_tag == "%23CLAN"
+    assert len(roster.players) == 4
+    assert list(roster.errors) == ["%23P3"]
+    assert active[1] == 3
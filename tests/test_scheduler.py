@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+from coc_api_wrapper import RequestScheduler, request_priority
+
+
+async def test_interactive_waiters_are_served_before_background() -> None:
+    scheduler = RequestScheduler(max_concurrency=1)
+    order: list[str] = []
+
+    async def job(name: str, priority: str) -> None:
+        async with scheduler.slot(priority):  # type: ignore[arg-type]
+            order.append(name)
+            await asyncio.sleep(0)
+
+    await scheduler.acquire("background")
+    tasks = [
+        asyncio.create_task(job("bg1", "background")),
+        asyncio.create_task(job("bg2", "background")),
+        asyncio.create_task(job("user", "interactive")),
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.pending() == 3
+    scheduler.release()
+    await asyncio.gather(*tasks)
+    assert order == ["user", "bg1", "bg2"]
+
+
+async def test_aging_prevents_background_starvation() -> None:
+    now = [0.0]
+    scheduler = RequestScheduler(max_concurrency=1, aging=1.0, time_fn=lambda: now[0])
+    order: list[str] = []
+
+    async def job(name: str, priority: str) -> None:
+        await scheduler.acquire(priority)  # type: ignore[arg-type]
+        order.append(name)
+        scheduler.release()
+
+    await scheduler.acquire("interactive")
+    background = asyncio.create_task(job("bg", "background"))
+    await asyncio.sleep(0)
+    now[0] = 5.0
+    interactive = asyncio.create_task(job("user", "interactive"))
+    await asyncio.sleep(0)
+    scheduler.release()
+    await asyncio.gather(background, interactive)
+    assert order == ["bg", "user"]
+
+
+async def test_request_priority_context_is_used_by_default() -> None:
+    scheduler = RequestScheduler(max_concurrency=1)
+    order: list[str] = []
+
+    async def job(name: str) -> None:
+        await scheduler.acquire()
+        order.append(name)
+        scheduler.release()
+
+    await scheduler.acquire()
+    normal = asyncio.create_task(job("normal"))
+    with request_priority("interactive"):
+        interactive = asyncio.create_task(job("interactive"))
+    await asyncio.sleep(0)
+    scheduler.release()
+    await asyncio.gather(normal, interactive)
+    assert order == ["interactive", "normal"]
+
+
+async def test_cancelled_waiter_does_not_leak_slot() -> None:
+    scheduler = RequestScheduler(max_concurrency=1)
+    await scheduler.acquire()
+    waiter = asyncio.create_task(scheduler.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    scheduler.release()
+    assert scheduler.active == 0
+    assert scheduler.pending() == 0
+
+
+async def test_rate_limit_spaces_out_grants() -> None:
+    scheduler = RequestScheduler(rate_limit=50.0, burst=1)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    for _ in range(3):
+        await scheduler.acquire()
+        scheduler.release()
+    assert loop.time() - started >= 0.03
+
+
+def test_unknown_priority_raises() -> None:
+    with pytest.raises(ValueError), request_priority("urgent"):  # type: ignore[arg-type]
+        pass
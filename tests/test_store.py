@@ -0,0 +1,123 @@
+import httpx
+
+from coc_api_wrapper import AsyncCoCClient, CoCClient, EntityStore
+from coc_api_wrapper.models import ClanMembersPage, Player
+
+
+def member(tag: str, th: int, league: int = 29000022) -> dict:
+    return {"tag": tag, "name": tag, "townHallLevel": th, "league": {"id": league}}
+
+
+def test_store_indexes_players_by_clan_town_hall_and_league() -> None:
+    store = EntityStore()
+    page = ClanMembersPage.model_validate(
+        {"items": [member("#A1", 15), member("#A2", 14), member("#A3", 15, 29000021)]}
+    )
+    store.add_clan_members("#CA", page, complete=True)
+    store.add_clan_members(
+        "#CB", ClanMembersPage.model_validate({"items": [member("#B1", 15)]}), complete=True
+    )
+
+    assert {p.tag for p in store.players(clan="%23ca")} == {"#A1", "#A2", "#A3"}
+    assert {p.tag for p in store.players(town_hall=15)} == {"#A1", "#A3", "#B1"}
+    assert {p.tag for p in store.players(town_hall=15, league=29000022)} == {"#A1", "#B1"}
+    assert store.players(clan="#CB", town_hall=14) == []
+
+    store.add_clan_members(
+        "#CA", ClanMembersPage.model_validate({"items": [member("#A1", 16)]}), complete=True
+    )
+    assert [p.tag for p in store.clan_members("#CA")] == ["#A1"]
+    assert store.player("#A2").clan_tag is None
+    assert {p.tag for p in store.players(town_hall=15)} == {"#A3", "#B1"}
+
+
+def test_store_keeps_fields_missing_from_later_responses() -> None:
+    store = EntityStore()
+    store.add_player(
+        Player.model_validate(
+            {"tag": "#P", "name": "P", "townHallLevel": 15, "clan": {"tag": "#C", "name": "C"}}
+        )
+    )
+    store.add_clan_members(
+        "#C", ClanMembersPage.model_validate({"items": [{"tag": "#P", "name": "P2"}]})
+    )
+    record = store.player("#p")
+    assert (record.name, record.town_hall_level, record.clan_tag) == ("P2", 15, "#C")
+
+    store.add_player(Player.model_validate({"tag": "#P", "name": "P2"}))
+    assert store.player("#P").clan_tag is None
+    assert store.players(clan="#C") == []
+
+
+def test_sync_client_feeds_store_from_clan_and_rankings() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.raw_path.decode()
+        if path == "/v1/clans/%23C":
+            return httpx.Response(
+                200,
+                json={
+                    "tag": "#C",
+                    "name": "C",
+                    "location": {"id": 32000218},
+                    "memberList": [member("#P1", 15), member("#P2", 13)],
+                },
+            )
+        return httpx.Response(
+            200,
+            json={
+                "items": [
+                    {"tag": "#R1", "name": "R1", "rank": 1, "clan": {"tag": "#C", "name": "C"}}
+                ]
+            },
+        )
+
+    store = EntityStore()
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.Client(transport=transport, base_url="https://api.clashofclans.com/v1")
+    with CoCClient(token="token", client=http_client, max_retries=0, store=store) as client:
+        client.get_clan("#C")
+        client.get_location_player_rankings(32000218)
+
+    assert [clan.tag for clan in store.clans(location=32000218)] == ["#C"]
+    assert {p.tag for p in store.players(clan="#C")} == {"#P1", "#P2", "#R1"}
+    assert [p.tag for p in store.players(location=32000218)] == ["#R1"]
+
+
+async def test_async_client_feeds_store_from_players() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"tag": "#P", "name": "P", "townHallLevel": 16})
+
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.AsyncClient(transport=transport, base_url="https://api.clashofclans.com/v1")
+    async with AsyncCoCClient(
+        token="token", client=http_client, max_retries=0, store=EntityStore()
+    ) as client:
+        await client.get_player("#P")
+        assert [p.tag for p in client.store.players(town_hall=16)] == ["#P"]
+
+
+async def test_iter_walks_feed_store_in_both_clients() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.raw_path.decode()
+        if "/members" in path:
+            if "after=" in path:
+                return httpx.Response(200, json={"items": [member("#M2", 14)]})
+            page = {"items": [member("#M1", 15)], "paging": {"cursors": {"after": "c1"}}}
+            return httpx.Response(200, json=page)
+        rows = [{"tag": "#R1", "name": "R1", "rank": 1, "trophies": 6000}]
+        return httpx.Response(200, json={"items": rows})
+
+    base_url = "https://api.clashofclans.com/v1"
+    sync_store = EntityStore()
+    http_client = httpx.Client(transport=httpx.MockTransport(handler), base_url=base_url)
+    with CoCClient(token="token", client=http_client, store=sync_store, lite_models=True) as client:
+        rows = list(client.iter_clan_members("#CLAN", page_size=1))
+    assert [row.tag for row in rows] == ["#M1", "#M2"]
+    assert {p.tag for p in sync_store.clan_members("#CLAN")} == {"#M1", "#M2"}
+
+    async_store = EntityStore()
+    async_http = httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url=base_url)
+    async with AsyncCoCClient(token="token", client=async_http, store=async_store) as client:
+        ranked = [row async for row in client.iter_location_player_rankings(32000006)]
+    assert [row.tag for row in ranked] == ["#R1"]
+    assert async_store.player("#R1").location_id == 32000006
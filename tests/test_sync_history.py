@@ -0,0 +1,73 @@
+import httpx
+
+from coc_api_wrapper import AsyncCoCClient, CoCClient
+
+WARLOG = [
+    {"result": "win", "endTime": f"202401{day:02d}T000000.000Z", "teamSize": 15}
+    for day in range(20, 0, -2)
+]
+
+
+def paged_handler(items: list[dict], calls: list[dict]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = dict(request.url.params)
+        calls.append(params)
+        start = int(params.get("after", 0))
+        limit = int(params["limit"])
+        page = items[start : start + limit]
+        paging = {"cursors": {"after": str(start + limit)}} if start + limit < len(items) else {}
+        return httpx.Response(200, json={"items": page, "paging": paging})
+
+    return handler
+
+
+def make_sync_client(handler) -> CoCClient:
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.Client(transport=transport, base_url="https://api.clashofclans.com/v1")
+    return CoCClient(token="token", client=http_client, max_retries=0, cache_enabled=False)
+
+
+def test_sync_warlog_stops_at_watermark_on_first_page() -> None:
+    calls: list[dict] = []
+    client = make_sync_client(paged_handler(WARLOG, calls))
+
+    result = client.sync_warlog("#CLAN", since="20240116T000000.000Z", page_size=3)
+    assert [entry.end_time for entry in result.items] == [
+        "20240120T000000.000Z",
+        "20240118T000000.000Z",
+    ]
+    assert result.watermark == "20240120T000000.000Z"
+    assert result.pages == 1
+
+    again = client.sync_warlog("#CLAN", since=result.watermark, page_size=3)
+    assert again.items == []
+    assert again.watermark == result.watermark
+
+
+def test_sync_warlog_without_watermark_walks_all_pages() -> None:
+    calls: list[dict] = []
+    client = make_sync_client(paged_handler(WARLOG, calls))
+
+    result = client.sync_warlog("#CLAN", page_size=4)
+    assert len(result.items) == 10
+    assert result.pages == 3
+    assert [call.get("after") for call in calls] == [None, "4", "8"]
+
+
+async def test_async_sync_capital_raids_skips_ongoing_season() -> None:
+    raids = [
+        {"state": "ongoing", "endTime": "20240115T070000.000Z"},
+        {"state": "ended", "endTime": "20240108T070000.000Z", "capitalTotalLoot": 100},
+        {"state": "ended", "endTime": "20240101T070000.000Z", "capitalTotalLoot": 90},
+    ]
+    calls: list[dict] = []
+    transport = httpx.MockTransport(paged_handler(raids, calls))
+    http_client = httpx.AsyncClient(transport=transport, base_url="https://api.clashofclans.com/v1")
+    async with AsyncCoCClient(
+        token="token", client=http_client, max_retries=0, cache_enabled=False
+    ) as client:
+        result = await client.sync_capital_raids("#CLAN", since="20240101T070000.000Z")
+
+    assert [raid.capital_total_loot for raid in result.items] == [100]
+    assert result.watermark == "20240108T070000.000Z"
+    assert result.pages == 1
@@ -0,0 +1,95 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from coc_api_wrapper import CoCClient, NotFound
+from coc_api_wrapper.cache import ShardedTTLCache
+
+
+def test_sharded_cache_behaves_like_ttl_cache() -> None:
+    now = [0.0]
+    cache: ShardedTTLCache[int] = ShardedTTLCache(
+        default_ttl=1.0, max_entries=8, shards=4, time_fn=lambda: now[0]
+    )
+    for i in range(32):
+        cache.set(f"k{i}", i)
+    assert len(cache) <= 8
+    assert cache.get("k31") == 31
+    assert cache.ttl_remaining("k31") == 1.0
+
+    now[0] = 2.0
+    assert cache.get("k31") is None
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+def test_sharded_cache_survives_concurrent_writers() -> None:
+    cache: ShardedTTLCache[int] = ShardedTTLCache(default_ttl=60.0, max_entries=64)
+
+    def work(worker: int) -> None:
+        for i in range(2000):
+            cache.set(f"GET /w{worker}-{i % 7}/{i % 100}", i, size=10)
+            cache.get(f"GET /w{(worker + 1) % 8}-{i % 7}/{i % 100}")
+            if worker == 0:
+                cache.stats()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(work, range(8)))
+    assert len(cache) <= 64
+    stats = cache.stats()
+    assert stats.entries == len(cache)
+    assert stats.bytes == 10 * len(cache)
+
+
+def blocking_client(calls: list[str], **kwargs) -> CoCClient:
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.raw_path.decode()
+        with lock:
+            calls.append(path)
+        time.sleep(0.1)
+        if path.endswith("%23GONE"):
+            return httpx.Response(404, json={"reason": "notFound"})
+        return httpx.Response(200, json={"tag": "#P", "name": "P"})
+
+    http_client = httpx.Client(
+        transport=httpx.MockTransport(handler),
+        base_url="https://api.clashofclans.com/v1",
+    )
+    return CoCClient(token="token", client=http_client, max_retries=0, **kwargs)
+
+
+def test_threads_share_one_fetch_per_key() -> None:
+    calls: list[str] = []
+    with (
+        blocking_client(calls, thread_safe=True) as client,
+        ThreadPoolExecutor(max_workers=8) as executor,
+    ):
+        players = list(executor.map(client.get_player, ["#P"] * 8))
+
+    assert calls == ["/v1/players/%23P"]
+    assert {player.name for player in players} == {"P"}
+
+
+def test_followers_receive_their_own_copy_of_the_error() -> None:
+    calls: list[str] = []
+    errors: list[NotFound] = []
+
+    def fetch(client: CoCClient) -> None:
+        with pytest.raises(NotFound) as info:
+            client.get_player("#GONE")
+        errors.append(info.value)
+
+    with blocking_client(calls, thread_safe=True) as client:
+        threads = [threading.Thread(target=fetch, args=(client,)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert calls == ["/v1/players/%23GONE"]
+    assert len({id(error) for error in errors}) == 4
@@ -1,6 +1,19 @@
+from datetime import UTC, datetime
+
 import pytest
 
-from coc_api_wrapper.utils import normalize_tag, paginate
+from coc_api_wrapper.utils import (
+    cache_key,
+    decode_tag,
+    encode_tag,
+    endpoint_template,
+    is_valid_tag,
+    normalize_tag,
+    paginate,
+    parse_api_time,
+    query_params,
+    validate_tag,
+)
 
 
 def test_normalize_tag_variants() -> None:
@@ -16,3 +29,47 @@ def test_normalize_tag_empty_raises() -> None:
 
 def test_paginate_params() -> None:
     assert paginate(limit=10, after="cursor") == {"limit": 10, "after": "cursor"}
+
+
+def test_parse_api_time() -> None:
+    parsed = parse_api_time("20240131T235959.000Z")
+    assert parsed == datetime(2024, 1, 31, 23, 59, 59, tzinfo=UTC)
+
+
+def test_endpoint_template() -> None:
+    assert endpoint_template("/clans/%23ABC/members") == "/clans/{tag}/members"
+    assert endpoint_template("/locations/32000007/rankings/players") == (
+        "/locations/{id}/rankings/players"
+    )
+    assert endpoint_template("/leagues/29000022/seasons/2024-01") == (
+        "/leagues/{id}/seasons/{season_id}"
+    )
+
+
+def test_tag_validation_uses_game_alphabet() -> None:
+    assert is_valid_tag("#2PP")
+    assert is_valid_tag("%2328qgv9uy")
+    assert not is_valid_tag("#ABC")
+    assert not is_valid_tag("   ")
+    with pytest.raises(ValueError):
+        validate_tag("#O0O")
+
+
+def test_tag_codec_round_trips_and_keeps_leading_zeros() -> None:
+    for tag in ("#2PP", "#0", "#00", "#0PYLQGRJCUV", "#VVVVVVVVVVVVVVV"):
+        value = encode_tag(tag)
+        assert 0 < value < 2**63
+        assert decode_tag(value) == tag
+    assert encode_tag("#0") != encode_tag("#00")
+    assert encode_tag("%232pp") == encode_tag("#2PP")
+    with pytest.raises(ValueError):
+        decode_tag(0)
+
+
+def test_query_params_keeps_repeated_names() -> None:
+    pairs = [("labelIds", "2"), ("limit", "3"), ("labelIds", "1")]
+    assert query_params(pairs) == {"labelIds": ["2", "1"], "limit": "3"}
+    assert query_params({"limit": 3}) == {"limit": 3}
+    assert cache_key("GET", "/clans", query_params(pairs)) == (
+        "GET /clans?labelIds=2&labelIds=1&limit=3"
+    )
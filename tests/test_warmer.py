@@ -0,0 +1,94 @@
+import asyncio
+from collections.abc import Callable
+
+import httpx
+
+from coc_api_wrapper import AsyncCoCClient
+
+
+def counting_client(calls: dict[str, int], **kwargs) -> AsyncCoCClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.raw_path.decode()
+        calls[path] = calls.get(path, 0) + 1
+        if path == "/v1/players/%23GONE":
+            return httpx.Response(404, json={"reason": "notFound"})
+        if path == "/v1/players/%23BOOM":
+            raise RuntimeError("unexpected")
+        return httpx.Response(200, json={"tag": "#P", "name": "P"})
+
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.AsyncClient(transport=transport, base_url="https://api.clashofclans.com/v1")
+    return AsyncCoCClient(token="token", client=http_client, max_retries=0, **kwargs)
+
+
+async def spin_until(condition: Callable[[], bool]) -> None:
+    for _ in range(1000):
+        if condition():
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("condition not reached")
+
+
+async def test_warmer_refreshes_hot_keys_before_expiry() -> None:
+    now = [0.0]
+    calls: dict[str, int] = {}
+    waits: list[float] = []
+
+    async def sleep_fn(seconds: float) -> None:
+        waits.append(seconds)
+        await asyncio.sleep(0)
+
+    async with counting_client(calls, cache_ttl=30.0) as client:
+        client._cache._time_fn = lambda: now[0]
+        warmer = client.cache_warmer(
+            margin=5.0, spread=2.0, time_fn=lambda: now[0], sleep_fn=sleep_fn
+        )
+        warmer.add_players(["#A", "#B"])
+        async with warmer:
+            await spin_until(lambda: bool(waits))
+            assert calls == {}
+            now[0] = 2.0
+            await spin_until(lambda: warmer.refreshes == 2)
+            assert calls == {"/v1/players/%23A": 1, "/v1/players/%23B": 1}
+            while now[0] < 62.0:
+                now[0] += 1.0
+                await client.get_player("#A")
+                await client.get_player("#B")
+                for _ in range(50):
+                    await asyncio.sleep(0)
+
+        assert client.cache_stats()["responses"].misses == 0
+        assert calls == {"/v1/players/%23A": 3, "/v1/players/%23B": 3}
+        assert warmer.refreshes == 6
+        assert not warmer.running
+
+
+async def test_warmer_skips_keys_refreshed_elsewhere_and_backs_off_on_errors() -> None:
+    now = [0.0]
+    calls: dict[str, int] = {}
+    waits: list[float] = []
+
+    async def sleep_fn(seconds: float) -> None:
+        waits.append(seconds)
+        await asyncio.sleep(0)
+
+    async with counting_client(calls, cache_ttl=60.0) as client:
+        client._cache._time_fn = lambda: now[0]
+        await client.get_player("#A")
+        warmer = client.cache_warmer(
+            margin=1.0, spread=0.0, error_interval=10.0, time_fn=lambda: now[0], sleep_fn=sleep_fn
+        )
+        warmer.add_players(["#A", "#GONE", "#BOOM"])
+        async with warmer:
+            await spin_until(lambda: waits[-1:] == [10.0])
+            assert calls == {
+                "/v1/players/%23A": 1,
+                "/v1/players/%23GONE": 1,
+                "/v1/players/%23BOOM": 1,
+            }
+            now[0] = 10.0
+            await spin_until(lambda: calls["/v1/players/%23BOOM"] == 2)
+            await spin_until(lambda: waits[-1:] == [10.0])
+
+    assert calls == {"/v1/players/%23A": 1, "/v1/players/%23GONE": 2, "/v1/players/%23BOOM": 2}
+    assert warmer.refreshes == 0
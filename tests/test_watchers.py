@@ -0,0 +1,101 @@
+import asyncio
+
+import httpx
+
+from coc_api_wrapper import AsyncCoCClient, WarPollIntervals
+from coc_api_wrapper.models import CurrentWar
+from coc_api_wrapper.scheduler import current_priority
+from coc_api_wrapper.utils import parse_api_time
+from coc_api_wrapper.watchers import diff_wars
+
+
+def war(state: str, stars: int = 0, opponent_stars: int = 0, **extra: str) -> dict:
+    return {
+        "state": state,
+        "startTime": "20240101T120000.000Z",
+        "endTime": "20240102T120000.000Z",
+        "clan": {"tag": "%23A", "stars": stars},
+        "opponent": {"tag": "%23B", "stars": opponent_stars},
+        **extra,
+    }
+
+
+def test_diff_wars_reports_lifecycle_events() -> None:
+    prep = CurrentWar.model_validate(war("preparation"))
+    live = CurrentWar.model_validate(war("inWar"))
+    scored = CurrentWar.model_validate(war("inWar", stars=3))
+    ended = CurrentWar.model_validate(war("warEnded", stars=3))
+
+    assert diff_wars("%23A", None, prep) == []
+    assert [e.kind for e in diff_wars("%23A", prep, live)] == ["war_started"]
+    assert [e.kind for e in diff_wars("%23A", live, scored)] == ["stars_changed"]
+    assert [e.kind for e in diff_wars("%23A", scored, ended)] == ["war_ended"]
+    assert diff_wars("%23A", scored, scored) == []
+
+
+async def test_next_interval_tightens_near_war_end() -> None:
+    end = parse_api_time("20240102T120000.000Z").timestamp()
+    now = [end - 3600]
+    async with AsyncCoCClient(token="token") as client:
+        watcher = client.watch_wars([], time_fn=lambda: now[0], intervals=WarPollIntervals())
+    live = CurrentWar.model_validate(war("inWar"))
+
+    assert watcher.next_interval(CurrentWar.model_validate({"state": "notInWar"})) == 900.0
+    assert watcher.next_interval(live) == 180.0
+    now[0] = end - 120
+    assert watcher.next_interval(live) == 30.0
+
+
+async def test_watcher_yields_events_and_skips_unchanged_payloads() -> None:
+    responses = [war("preparation"), war("preparation"), war("inWar"), war("inWar", stars=2)]
+    calls = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.raw_path.decode() == "/v1/clans/%23A/currentwar"
+        assert current_priority() == "background"
+        payload = responses[min(calls["n"], len(responses) - 1)]
+        calls["n"] += 1
+        return httpx.Response(200, json=payload)
+
+    async def sleep_fn(seconds: float) -> None:
+        await asyncio.sleep(0)
+
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.AsyncClient(transport=transport, base_url="https://api.clashofclans.com/v1")
+    async with AsyncCoCClient(token="token", client=http_client, cache_enabled=False) as client:
+        watcher = client.watch_wars(["#a"], sleep_fn=sleep_fn, spread=0)
+        kinds: list[str] = []
+        async for event in watcher:
+            kinds.append(event.kind)
+            if len(kinds) == 2:
+                break
+
+    assert kinds == ["war_started", "stars_changed"]
+    assert calls["n"] >= 4
+
+
+async def test_watcher_survives_unexpected_poll_errors(caplog) -> None:
+    responses = [{"state": 5}, war("preparation"), war("inWar")]
+    calls = {"n": 0}
+    slept: list[float] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = responses[min(calls["n"], len(responses) - 1)]
+        calls["n"] += 1
+        return httpx.Response(200, json=payload)
+
+    async def sleep_fn(seconds: float) -> None:
+        slept.append(seconds)
+        await asyncio.sleep(0)
+
+    transport = httpx.MockTransport(handler)
+    http_client = httpx.AsyncClient(transport=transport, base_url="https://api.clashofclans.com/v1")
+    intervals = WarPollIntervals(error=42.0)
+    async with AsyncCoCClient(token="token", client=http_client, cache_enabled=False) as client:
+        watcher = client.watch_wars(["#a"], sleep_fn=sleep_fn, spread=0, intervals=intervals)
+        async for event in watcher:
+            assert event.kind == "war_started"
+            break
+
+    assert slept[0] == 42.0
+    assert "war watcher poll crashed for %23A" in caplog.text